@@ -0,0 +1,110 @@
+"""
+Typed Arrow tables of scraped rows, loaded through dlt's Arrow/Parquet path.
+dlt takes the column types from the Arrow schema instead of inferring and normalizing every row,
+so dates and counts land in the destination as DATE and BIGINT instead of strings.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+
+import pyarrow as pa
+
+from .models import Deck
+
+TOURNAMENTS_SCHEMA = pa.schema(
+    [
+        ("data_date", pa.date32()),
+        ("data_time", pa.string()),
+        ("data_name", pa.string()),
+        ("data_organizer", pa.string()),
+        ("data_format", pa.string()),
+        ("data_players", pa.int64()),
+        ("data_winner", pa.string()),
+        ("tournament_page", pa.string()),
+        ("date", pa.date32()),
+    ]
+)
+
+TOURNAMENT_PARTICIPANTS_SCHEMA = pa.schema(
+    [
+        ("tournament_link", pa.string()),
+        ("place", pa.int64()),
+        ("name", pa.string()),
+        ("record", pa.string()),
+        ("deck", pa.string()),
+        ("points", pa.string()),
+        ("decklist_link", pa.string()),
+        ("matches", pa.string()),
+    ]
+)
+
+PARTICIPANT_DECK_SCHEMA = pa.schema(
+    [
+        ("player", pa.string()),
+        ("tournament", pa.string()),
+        ("decklist_link", pa.string()),
+    ]
+)
+
+# One row per distinct card of a deck, keyed on the deck's (tournament, player) and `card`
+PARTICIPANT_DECK_CARDS_SCHEMA = pa.schema(
+    [
+        ("tournament", pa.string()),
+        ("player", pa.string()),
+        ("card", pa.string()),
+        ("name", pa.string()),
+        ("code", pa.string()),
+        ("quantity", pa.int64()),
+        ("kind", pa.string()),
+    ]
+)
+
+# Columns are named as dlt normalizes the Match aliases (Round, P1, ...), the names already in the destination
+PARTICIPANT_MATCHES_SCHEMA = pa.schema(
+    [
+        ("round", pa.string()),
+        ("p1", pa.string()),
+        ("p2", pa.string()),
+        ("result", pa.string()),
+        ("tournament", pa.string()),
+    ]
+)
+MATCH_ATTRIBUTES = {"p1": "player1", "p2": "player2"}
+
+
+def to_table(
+    rows: Sequence[Any],
+    schema: pa.Schema,
+    attributes: Optional[dict[str, str]] = None,
+) -> pa.Table:
+    """Builds the table column by column from the attributes of `rows`, named as the schema unless mapped."""
+    attributes = attributes or {}
+    return pa.table(
+        {
+            name: [getattr(row, attributes.get(name, name)) for row in rows]
+            for name in schema.names
+        },
+        schema=schema,
+    )
+
+
+def card_key(kind: str, name: str, code: Optional[str]) -> str:
+    """Key of a card within a deck, built from the values that tell its lines apart."""
+    return f"{kind}|{name}|{code or ''}"
+
+
+def deck_cards_table(decks: Sequence[Deck]) -> pa.Table:
+    """The cards of `decks` as flat rows, so dlt has no nested decklist to normalize into a child table."""
+    columns: dict[str, list[Any]] = {
+        name: [] for name in PARTICIPANT_DECK_CARDS_SCHEMA.names
+    }
+    for deck in decks:
+        for (kind, name, code), quantity in deck.decklist.quantities().items():
+            columns["tournament"].append(deck.tournament)
+            columns["player"].append(deck.player)
+            columns["card"].append(card_key(kind, name, code))
+            columns["name"].append(name)
+            columns["code"].append(code)
+            columns["quantity"].append(quantity)
+            columns["kind"].append(kind)
+    return pa.table(columns, schema=PARTICIPANT_DECK_CARDS_SCHEMA)
@@ -0,0 +1,213 @@
+import argparse
+import json
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+from ..constants import (
+    CRAWL_MAX_IN_FLIGHT,
+    CRAWL_PARSE_WORKERS,
+    HTTP_CACHE_PATH,
+    RATE_LIMIT_MAX_RATE,
+)
+from ..main import default_tournament_params
+from .corpus import Corpus
+from .runner import (
+    WORKLOADS,
+    BenchmarkOptions,
+    measure_parse,
+    options_dict,
+    run_workload,
+)
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+# Fixed so that synthetic runs, and the incremental target month, are comparable over time
+SYNTHETIC_LAST_MONTH = date(2026, 1, 1)
+
+
+def _delta(value: Any, baseline: Any) -> str:
+    if not isinstance(value, (int, float)) or not isinstance(baseline, (int, float)):
+        return ""
+    if not baseline:
+        return f" (baseline {baseline})"
+    return f" (baseline {baseline}, {(value - baseline) / baseline:+.1%})"
+
+
+def report(results: dict[str, Any], baseline: Optional[dict[str, Any]]) -> None:
+    baseline = baseline or {}
+    for field in ("corpus", "config"):
+        if baseline and baseline.get(field) != results[field]:
+            print(f"Baseline was recorded with a different {field}:")
+            print(f"  baseline: {baseline.get(field)}")
+            print(f"  current:  {results[field]}")
+
+    print(f"Corpus: {results['corpus']}")
+    print("Parse time per page (us):")
+    for kind, value in results["parse_us_per_page"].items():
+        reference = baseline.get("parse_us_per_page", {}).get(kind)
+        print(f"  {kind:<10} {value:>10}{_delta(value, reference)}")
+
+    for workload, metrics in results["workloads"].items():
+        reference = baseline.get("workloads", {}).get(workload, {})
+        print(f"{workload}:")
+        for name in (
+            "pages",
+            "rows",
+            "pages_per_second",
+            "rows_per_second",
+            "crawl_seconds",
+            "load_seconds",
+            "peak_rss_mib",
+        ):
+            print(
+                f"  {name:<17} {metrics[name]:>10}{_delta(metrics[name], reference.get(name))}"
+            )
+        print(f"  {'requests':<17} {metrics['requests']}")
+
+
+def run(args: argparse.Namespace) -> None:
+    options = BenchmarkOptions(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_in_flight=args.max_in_flight,
+        parse_workers=args.parse_workers,
+        max_rate=args.max_rate,
+        rate_limit=not args.no_rate_limit,
+        cache=args.cache,
+        verbose=args.verbose,
+    )
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.corpus:
+            corpus_path = args.corpus
+            corpus = Corpus.load(corpus_path)
+            corpus_name = str(args.corpus)
+        else:
+            corpus = Corpus.synthetic(
+                default_tournament_params(),
+                months=args.months,
+                tournaments_per_month=args.tournaments_per_month,
+                players=args.players,
+                last_month=SYNTHETIC_LAST_MONTH,
+            )
+            corpus_path = str(Path(workdir) / "corpus.jsonl.gz")
+            corpus.save(corpus_path)
+            corpus_name = (
+                f"synthetic {args.months} months x {args.tournaments_per_month} "
+                f"tournaments x {args.players} players"
+            )
+
+        print(f"Measuring parse time over {len(corpus)} pages...", flush=True)
+        results: dict[str, Any] = {
+            "corpus": corpus_name,
+            "config": options_dict(options),
+            "parse_us_per_page": measure_parse(corpus, options.parse_repeat),
+            "workloads": {},
+        }
+
+        # One fresh process per workload keeps peak RSS figures independent
+        context = multiprocessing.get_context("spawn")
+        for workload in args.workload:
+            print(f"Running {workload} workload...", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results["workloads"][workload] = executor.submit(
+                    run_workload, workload, corpus_path, options
+                ).result()
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists() and not args.save_baseline:
+        baseline = json.loads(baseline_path.read_text())
+    report(results, baseline)
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {baseline_path}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+def record(args: argparse.Namespace) -> None:
+    corpus = Corpus.from_cache(args.cache_path)
+    corpus.save(args.out)
+    kinds: dict[str, int] = {}
+    for page in corpus:
+        kinds[page.kind] = kinds.get(page.kind, 0) + 1
+    print(f"Recorded {len(corpus)} pages {kinds} to {args.out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scraper against a local stand-in for play.limitlesstcg.com."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser(
+        "record", help="Record a corpus from the HTTP response cache of a real crawl."
+    )
+    record_parser.add_argument("--cache-path", default=HTTP_CACHE_PATH)
+    record_parser.add_argument("--out", default=".benchmark/corpus.jsonl.gz")
+    record_parser.set_defaults(func=record)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark.")
+    run_parser.add_argument(
+        "--corpus",
+        help="Recorded corpus to replay. Defaults to a generated synthetic corpus.",
+    )
+    run_parser.add_argument("--months", type=int, default=2)
+    run_parser.add_argument("--tournaments-per-month", type=int, default=20)
+    run_parser.add_argument("--players", type=int, default=16)
+    run_parser.add_argument(
+        "--workload", nargs="+", choices=WORKLOADS, default=list(WORKLOADS)
+    )
+    run_parser.add_argument(
+        "--latency", type=float, default=0.02, help="Seconds added to every response."
+    )
+    run_parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Upper bound of random extra latency."
+    )
+    run_parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests answered with 500.",
+    )
+    run_parser.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests answered with 429 and Retry-After.",
+    )
+    run_parser.add_argument("--max-in-flight", type=int, default=CRAWL_MAX_IN_FLIGHT)
+    run_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=CRAWL_PARSE_WORKERS,
+        help="Processes parsing downloaded pages; 0 parses on the fetch threads.",
+    )
+    run_parser.add_argument("--max-rate", type=float, default=RATE_LIMIT_MAX_RATE)
+    run_parser.add_argument("--no-rate-limit", action="store_true")
+    run_parser.add_argument(
+        "--cache", action="store_true", help="Crawl through a scratch response cache."
+    )
+    run_parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    run_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run instead of comparing against it.",
+    )
+    run_parser.add_argument(
+        "--output", help="Also write the results as JSON to this file."
+    )
+    run_parser.add_argument(
+        "--verbose", action="store_true", help="Show crawler and dlt output."
+    )
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    args.func(args)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import sqlite3
+import zlib
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from ..constants import BASE_URL
+from ..payload import TournamentPayload
+
+LISTING = "listing"
+STANDINGS = "standings"
+DECKLIST = "decklist"
+PLAYER = "player"
+
+
+@dataclass(slots=True)
+class Page:
+    kind: str
+    path: str
+    body: str
+    content_type: str = "text/html; charset=utf-8"
+
+
+def page_key(url: str) -> str:
+    """Addresses a page by path and sorted query, independent of the origin that served it."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query)))
+    return f"{parts.path}?{query}" if query else parts.path
+
+
+def page_kind(path: str) -> str:
+    path = urlsplit(path).path
+    if path.startswith("/tournaments/completed"):
+        return LISTING
+    if path.endswith("/standings"):
+        return STANDINGS
+    if path.endswith("/decklist"):
+        return DECKLIST
+    return PLAYER
+
+
+class Corpus:
+    """
+    Pages of play.limitlesstcg.com keyed by `page_key`, replayed by the stand-in server.
+    Stored as one gzipped JSON line per page.
+    """
+
+    def __init__(self, pages: Optional[dict[str, Page]] = None):
+        self.pages = pages or {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __iter__(self) -> Iterator[Page]:
+        return iter(self.pages.values())
+
+    def add(self, url: str, body: str, content_type: Optional[str] = None) -> None:
+        key = page_key(url)
+        self.pages[key] = Page(
+            kind=page_kind(key),
+            path=key,
+            body=body,
+            content_type=content_type or "text/html; charset=utf-8",
+        )
+
+    def get(self, url: str) -> Optional[Page]:
+        return self.pages.get(page_key(url))
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            for page in self.pages.values():
+                file.write(
+                    json.dumps(
+                        {
+                            "path": page.path,
+                            "content_type": page.content_type,
+                            "body": page.body,
+                        }
+                    )
+                    + "\n"
+                )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Corpus:
+        corpus = cls()
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                record = json.loads(line)
+                corpus.add(record["path"], record["body"], record["content_type"])
+        return corpus
+
+    @classmethod
+    def from_cache(cls, cache_path: str | Path) -> Corpus:
+        """Records every successful page of an HTTP response cache written by a real crawl."""
+        corpus = cls()
+        con = sqlite3.connect(cache_path)
+        try:
+            for url, content_type, encoding, body in con.execute(
+                "select url, content_type, encoding, body from responses where status = 200"
+            ):
+                corpus.add(
+                    url,
+                    zlib.decompress(body).decode(encoding or "utf-8", "replace"),
+                    content_type,
+                )
+        finally:
+            con.close()
+        return corpus
+
+    @classmethod
+    def synthetic(
+        cls,
+        tournament_params: TournamentPayload,
+        months: int = 2,
+        tournaments_per_month: int = 20,
+        players: int = 16,
+        rounds: int = 5,
+        last_month: Optional[date] = None,
+        seed: int = 0,
+    ) -> Corpus:
+        """
+        Generates pages shaped like the live site, for machines without a recorded corpus.
+        Tournaments are spread over `months` months ending with `last_month`, newest first.
+        """
+        rng = random.Random(seed)
+        last_month = last_month or date.today().replace(day=1)
+        corpus = cls()
+
+        tournaments = []
+        month = last_month
+        for m in range(months):
+            for i in range(tournaments_per_month):
+                day = min(1 + i * 27 // tournaments_per_month, 28)
+                tournaments.append((f"bench{m:02d}{i:03d}", month.replace(day=day)))
+            month = (month - timedelta(days=1)).replace(day=1)
+        tournaments.sort(key=lambda t: t[1], reverse=True)
+
+        show = tournament_params.show
+        pages = [tournaments[i : i + show] for i in range(0, len(tournaments), show)]
+        if not pages or len(pages[-1]) == show:
+            pages.append([])
+        for number, page in enumerate(pages, start=1):
+            params = tournament_params.model_dump(mode="json")
+            params["page"] = number
+            url = (
+                requests.Request(
+                    "GET", BASE_URL + "/tournaments/completed", params=params
+                )
+                .prepare()
+                .url
+            )
+            corpus.add(url, _listing_html(page, players))
+
+        for tournament_id, _ in tournaments:
+            names = [f"player{tournament_id[-3:]}{p:03d}" for p in range(players)]
+            corpus.add(
+                f"/tournament/{tournament_id}/standings",
+                _standings_html(tournament_id, names, rng),
+            )
+            for name in names:
+                player = f"/tournament/{tournament_id}/player/{name}"
+                corpus.add(f"{player}/decklist", _decklist_html(rng))
+                corpus.add(player, _player_html(names, rounds, rng))
+
+        return corpus
+
+
+_ARCHETYPES = ["Dragapult ex", "Gardevoir ex", "Charizard ex", "Raging Bolt ex"]
+_POKEMON = ["Dreepy", "Drakloak", "Dragapult ex", "Ralts", "Kirlia", "Gardevoir ex"]
+_TRAINERS = ["Professor's Research", "Boss's Orders", "Ultra Ball", "Rare Candy"]
+_ENERGY = ["Basic Psychic Energy", "Basic Fire Energy"]
+_SETS = ["SVI", "PAL", "OBF", "MEW", "PAR", "TWM"]
+
+
+def _page(content: str) -> str:
+    return f"<html><head><title>Limitless</title></head><body>{content}</body></html>"
+
+
+def _listing_html(tournaments: list[tuple[str, date]], players: int) -> str:
+    rows = "".join(
+        f'<tr data-date="{day.isoformat()}" data-name="Benchmark Cup {tournament_id}" '
+        f'data-organizer="Benchmark League" data-format="STANDARD" data-players="{players}" '
+        f'data-winner="player{tournament_id[-3:]}000">'
+        f"<td>{day.isoformat()}</td>"
+        f'<td><a href="/tournament/{tournament_id}/standings" data-time="1700000000000">'
+        f"Benchmark Cup {tournament_id}</a></td>"
+        f"<td>Benchmark League</td><td>{players}</td><td>player{tournament_id[-3:]}000</td></tr>"
+        for tournament_id, day in tournaments
+    )
+    return _page(
+        '<div class="main"><div><table class="completed-tournaments">'
+        "<tr><th>Date</th><th>Name</th><th>Organizer</th><th>Players</th><th>Winner</th></tr>"
+        f"{rows}</table></div></div>"
+    )
+
+
+def _standings_html(tournament_id: str, names: list[str], rng: random.Random) -> str:
+    rows = "".join(
+        f"<tr><td>{place}</td><td><a>{name}</a></td><td>{rng.randint(0, 15)}</td>"
+        f"<td>{rng.randint(0, 5)} - {rng.randint(0, 5)} - {rng.randint(0, 1)}</td>"
+        f'<td><a href="/decks?archetype=x"><span data-tooltip="{rng.choice(_ARCHETYPES)}">'
+        f'<img class="pokemon" alt="x"></span></a></td>'
+        f'<td><a href="/tournament/{tournament_id}/player/{name}/decklist">'
+        f'<i class="fa fa-list-alt"></i></a></td></tr>'
+        for place, name in enumerate(names, start=1)
+    )
+    return _page(
+        '<div class="main"><div><div class="standings completed"><table><tbody>'
+        "<tr><th>Place</th><th>Name</th><th>Points</th><th>Record</th><th>Deck</th><th>List</th></tr>"
+        f"{rows}</tbody></table></div></div></div>"
+    )
+
+
+def _cards(kind: str, names: list[str], count: int, rng: random.Random) -> str:
+    cards = "".join(
+        f'<p><a href="/cards/{rng.choice(_SETS)}/{rng.randint(1, 250)}">'
+        f"{rng.randint(1, 4)} {rng.choice(names)}</a></p>"
+        for _ in range(count)
+    )
+    return (
+        f'<div class="cards"><div class="heading">{kind} ({count})</div>{cards}</div>'
+    )
+
+
+def _decklist_html(rng: random.Random) -> str:
+    return _page(
+        '<div class="decklist">'
+        + _cards("Pokémon", _POKEMON, rng.randint(6, 12), rng)
+        + _cards("Trainer", _TRAINERS, rng.randint(12, 20), rng)
+        + _cards("Energy", _ENERGY, rng.randint(1, 3), rng)
+        + "</div>"
+    )
+
+
+def _player_html(names: list[str], rounds: int, rng: random.Random) -> str:
+    rows = "".join(
+        f"<tr><td>{r}</td><td>{rng.choice(['WIN', 'LOSS', 'TIE'])}</td>"
+        f"<td><a>{rng.choice(names)}</a></td>"
+        f'<td><span data-tooltip="{rng.choice(_ARCHETYPES)}"></span></td>'
+        f"<td>{rng.randint(0, 2)}-{rng.randint(0, 2)}</td></tr>"
+        for r in range(1, rounds + 1)
+    )
+    return _page(
+        '<div class="main"><div class="history"><table>'
+        "<tr><th>Round</th><th>Result</th><th>Opponent</th><th>Deck</th><th>Score</th></tr>"
+        f"{rows}</table></div></div>"
+    )
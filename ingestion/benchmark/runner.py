@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from selectolax.parser import HTMLParser
+
+from ..constants import (
+    BASE_URL,
+    CRAWL_MAX_IN_FLIGHT,
+    CRAWL_PARSE_WORKERS,
+    PIPELINE_DATASET_NAME,
+    RATE_LIMIT_MAX_RATE,
+)
+from ..extractors import (
+    parse_decklist,
+    parse_matches,
+    parse_standings,
+    parse_tournaments,
+)
+from ..models import Participant
+from .corpus import DECKLIST, LISTING, PLAYER, STANDINGS, Corpus
+
+INCREMENTAL = "incremental"
+BACKFILL = "backfill"
+WORKLOADS = (INCREMENTAL, BACKFILL)
+
+
+@dataclass(slots=True)
+class BenchmarkOptions:
+    latency: float = 0.02
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    max_in_flight: int = CRAWL_MAX_IN_FLIGHT
+    parse_workers: int = CRAWL_PARSE_WORKERS
+    max_rate: float = RATE_LIMIT_MAX_RATE
+    rate_limit: bool = True
+    cache: bool = False
+    parse_repeat: int = 3
+    verbose: bool = False
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _parse_page(kind: str, path: str, html: str) -> None:
+    if kind == LISTING:
+        parse_tournaments(html)
+    elif kind == STANDINGS:
+        parse_standings(BASE_URL + path, html)
+    elif kind == DECKLIST:
+        parse_decklist(HTMLParser(html))
+    elif kind == PLAYER:
+        participant = Participant(
+            tournament_link=BASE_URL + path, place=1, name="player", record=""
+        )
+        parse_matches(participant, HTMLParser(html))
+
+
+def measure_parse(corpus: Corpus, repeat: int = 3) -> dict[str, float]:
+    """Mean parse time per page in microseconds, by page kind, over `repeat` passes of the corpus."""
+    elapsed: dict[str, int] = defaultdict(int)
+    pages: dict[str, int] = defaultdict(int)
+    for _ in range(repeat):
+        for page in corpus:
+            if page.kind == LISTING and "<tr data-" not in page.body:
+                continue
+            started = time.perf_counter_ns()
+            _parse_page(page.kind, page.path, page.body)
+            elapsed[page.kind] += time.perf_counter_ns() - started
+            pages[page.kind] += 1
+
+    result = {kind: elapsed[kind] / pages[kind] / 1000 for kind in sorted(pages)}
+    result["all"] = sum(elapsed.values()) / max(1, sum(pages.values())) / 1000
+    return {kind: round(value, 1) for kind, value in result.items()}
+
+
+def latest_month(corpus: Corpus) -> Optional[str]:
+    """The newest tournament month in the corpus, the target of the incremental workload."""
+    dates = [
+        tournament.data_date
+        for page in corpus
+        if page.kind == LISTING
+        for tournament in parse_tournaments(page.body)
+        if tournament.data_date
+    ]
+    if not dates:
+        return None
+    return max(dates).strftime("%Y-%m")
+
+
+def run_workload(
+    workload: str, corpus_path: str, options: BenchmarkOptions
+) -> dict[str, Any]:
+    """
+    Crawls the corpus from a stand-in server and loads the rows into a scratch DuckDB pipeline.
+    Meant to run in a fresh process, so peak RSS covers this workload only.
+    """
+    os.environ.setdefault("RUNTIME__DLTHUB_TELEMETRY", "false")
+    if not options.verbose:
+        os.environ.setdefault("RUNTIME__LOG_LEVEL", "ERROR")
+
+    import dlt
+
+    from ..crawler import Crawler, TournamentCrawl
+    from ..http_client import configure_cache, configure_origin, configure_rate_limiter
+    from ..main import CollectedRows, default_tournament_params, resolve_target_month
+    from .server import StandInServer
+
+    corpus = Corpus.load(corpus_path)
+    backfill = workload == BACKFILL
+    target_month = None if backfill else latest_month(corpus)
+
+    with (
+        tempfile.TemporaryDirectory() as workdir,
+        StandInServer(
+            corpus,
+            latency=options.latency,
+            jitter=options.jitter,
+            error_rate=options.error_rate,
+            throttle_rate=options.throttle_rate,
+        ) as server,
+    ):
+        configure_origin(server.url)
+        configure_cache(Path(workdir) / "responses.sqlite" if options.cache else None)
+        configure_rate_limiter(
+            max_in_flight=options.max_in_flight,
+            max_rate=options.max_rate,
+            enabled=options.rate_limit,
+        )
+        pipeline = dlt.pipeline(
+            pipeline_name="ingestion_benchmark",
+            destination=dlt.destinations.duckdb(
+                str(Path(workdir) / "ingestion_benchmark.duckdb")
+            ),
+            dataset_name=PIPELINE_DATASET_NAME,
+            pipelines_dir=str(Path(workdir) / "pipelines"),
+        )
+
+        output = sys.stdout if options.verbose else io.StringIO()
+        with contextlib.redirect_stdout(output):
+            rows = CollectedRows()
+            crawler = Crawler(
+                max_in_flight=options.max_in_flight,
+                parse_workers=options.parse_workers,
+            )
+            crawl = TournamentCrawl(
+                default_tournament_params(),
+                on_rows=rows,
+                target_dt=resolve_target_month(target_month, backfill),
+                backfill=backfill,
+                crawler=crawler,
+            )
+            started = time.perf_counter()
+            with crawler:
+                crawl.run()
+            crawl_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            rows.load(pipeline)
+            load_seconds = time.perf_counter() - started
+
+        requests = dict(server.requests)
+
+    pages = sum(
+        requests.get(kind, 0) for kind in (LISTING, STANDINGS, DECKLIST, PLAYER)
+    )
+    return {
+        "target_month": target_month,
+        "pages": pages,
+        "requests": requests,
+        "rows": len(rows),
+        "crawl_seconds": round(crawl_seconds, 3),
+        "pages_per_second": round(pages / crawl_seconds, 1),
+        "load_seconds": round(load_seconds, 3),
+        "rows_per_second": round(len(rows) / load_seconds, 1) if load_seconds else 0.0,
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+    }
+
+
+def options_dict(options: BenchmarkOptions) -> dict[str, Any]:
+    config = asdict(options)
+    config.pop("verbose")
+    return config
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .corpus import Corpus
+
+
+class StandInServer:
+    """
+    Local HTTP server replaying a Corpus in place of play.limitlesstcg.com.
+    Every response is delayed by `latency` seconds (plus up to `jitter`); a share of requests
+    fails with 500 (`error_rate`) or 429 with Retry-After (`throttle_rate`).
+    """
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("stand-in server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.requests[kind] += 1
+
+    def _outcome(self) -> tuple[float, Optional[int]]:
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return delay, 429
+        if roll < self.throttle_rate + self.error_rate:
+            return delay, 500
+        return delay, None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def _reply(
+                self, status: int, body: bytes = b"", headers: Optional[dict] = None
+            ) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                delay, failure = server._outcome()
+                if delay:
+                    time.sleep(delay)
+
+                if failure == 429:
+                    server._count("throttled")
+                    self._reply(429, headers={"Retry-After": str(server.retry_after)})
+                    return
+                if failure == 500:
+                    server._count("failed")
+                    self._reply(500)
+                    return
+
+                page = server.corpus.get(self.path)
+                if page is None:
+                    server._count("missing")
+                    self._reply(404)
+                    return
+
+                server._count(page.kind)
+                self._reply(
+                    200, page.body.encode(), {"Content-Type": page.content_type}
+                )
+
+        return Handler
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> StandInServer:
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> StandInServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -1,3 +1,5 @@
+import os
+
 BASE_URL = "https://play.limitlesstcg.com"
 
 REGEX_CARD_PATTERN = r"(\d+)\s+([\w\s'’áéíóúÁÉÍÓÚüÜ-]+)(?:\s*\(([\w-]+)\))?"
@@ -6,7 +8,13 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
-DETAIL_FETCH_WORKERS = 8
+CRAWL_MAX_IN_FLIGHT = 16
+CRAWL_MAX_IN_FLIGHT_PER_HOST = 8
+# Processes parsing downloaded pages, leaving one core to the fetch threads; 0 parses on threads
+CRAWL_PARSE_WORKERS = max((os.cpu_count() or 1) - 1, 0)
+CRAWL_PROGRESS_EVERY = 500
+
+STREAM_BATCH_SIZE = 20
 
 REQUEST_TIMEOUT_SECONDS = 30
 REQUEST_RETRY_ATTEMPTS = 5
@@ -14,6 +22,18 @@ REQUEST_RETRY_BACKOFF_FACTOR = 1
 REQUEST_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 REQUEST_RETRY_ALLOWED_METHODS = frozenset(["GET"])
 
+RATE_LIMIT_INITIAL_RATE = 5.0
+RATE_LIMIT_MIN_RATE = 0.5
+RATE_LIMIT_MAX_RATE = 100.0
+RATE_LIMIT_INITIAL_IN_FLIGHT = 4
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_DECREASE_COOLDOWN_SECONDS = 1.0
+RATE_LIMIT_LATENCY_TOLERANCE = 3.0
+
+HTTP_CACHE_PATH = ".http_cache/responses.sqlite"
+HTTP_CACHE_MAX_BYTES = 2 * 1024**3
+HTTP_CACHE_TTL_SECONDS = 6 * 60 * 60
+
 PIPELINE_NAME = "pokemon_tcg_pipeline"
 PIPELINE_DESTINATION = "duckdb"
 PIPELINE_DATASET_NAME = "pokemon_tcg_data"
@@ -21,9 +41,12 @@ PIPELINE_DATASET_NAME = "pokemon_tcg_data"
 TOURNAMENTS_TABLE = "tournaments"
 TOURNAMENT_PARTICIPANTS_TABLE = "tournament_participants"
 PARTICIPANT_DECK_TABLE = "participant_deck"
+PARTICIPANT_DECK_CARDS_TABLE = "participant_deck_cards"
 PARTICIPANT_MATCHES_TABLE = "participant_matches"
+CRAWL_FRONTIER_TABLE = "crawl_frontier"
 
 TOURNAMENTS_PRIMARY_KEY = "tournament_page"
 TOURNAMENT_PARTICIPANTS_PRIMARY_KEY = ["tournament_link", "name"]
 PARTICIPANT_DECK_PRIMARY_KEY = ["tournament", "player"]
+PARTICIPANT_DECK_CARDS_PRIMARY_KEY = ["tournament", "player", "card"]
 PARTICIPANT_MATCHES_PRIMARY_KEY = ["tournament", "Round", "P1"]
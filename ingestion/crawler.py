@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import multiprocessing
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from .constants import (
+    BASE_URL,
+    CRAWL_MAX_IN_FLIGHT,
+    CRAWL_MAX_IN_FLIGHT_PER_HOST,
+    CRAWL_PARSE_WORKERS,
+    CRAWL_PROGRESS_EVERY,
+    PARTICIPANT_DECK_TABLE,
+    PARTICIPANT_MATCHES_TABLE,
+    TOURNAMENT_PARTICIPANTS_TABLE,
+    TOURNAMENTS_TABLE,
+)
+from .extractors import (
+    extract_tournament_page,
+    fetch_participant_pages,
+    fetch_standings,
+    parse_participant_details,
+    parse_standings_page,
+)
+from .frontier import DECKLIST, MATCHES, PAGE, STANDINGS, CrawlFrontier
+from .http_client import rate_limiter_stats
+from .models import Participant, Tournament
+from .payload import TournamentPayload
+from .tournament_index import TournamentIndex
+
+RowsCallback = Callable[[str, list[Any]], None]
+
+
+class JobKind(IntEnum):
+    """Crawl stages. Lower values are dequeued first, so open work drains before new pages are listed."""
+
+    PARTICIPANT = 0
+    STANDINGS = 1
+    TOURNAMENT_PAGE = 2
+
+
+@dataclass(order=True)
+class CrawlJob:
+    kind: JobKind
+    seq: int
+    url: str = field(compare=False)
+    payload: Any = field(compare=False, default=None)
+
+
+class Crawler:
+    """
+    Runs blocking `http_client.get` based extractors on an asyncio loop.
+    Every request is bounded by a global and a per-host in-flight budget.
+    Downloaded pages can be handed to a pool of parse processes, so CPU-bound parsing
+    neither holds a request slot nor competes with the fetch threads for the GIL.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = CRAWL_MAX_IN_FLIGHT,
+        max_in_flight_per_host: int = CRAWL_MAX_IN_FLIGHT_PER_HOST,
+        parse_workers: int = CRAWL_PARSE_WORKERS,
+    ):
+        if max_in_flight < 1 or max_in_flight_per_host < 1:
+            raise ValueError("crawl concurrency limits must be positive")
+        if parse_workers < 0:
+            raise ValueError("parse workers must not be negative")
+
+        self.max_in_flight = max_in_flight
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.parse_workers = parse_workers
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> Crawler:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops the parse processes. They are started again by the next parse."""
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=True)
+            self._parse_executor = None
+
+    def _parser(self) -> Executor:
+        if self.parse_workers == 0:
+            if self._executor is None:
+                raise RuntimeError("crawler is not running")
+            return self._executor
+        # Kept across runs, so streamed batches do not pay for starting the processes again.
+        # Spawned rather than forked, as the fetch threads may hold locks at fork time.
+        if self._parse_executor is None:
+            self._parse_executor = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._parse_executor
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_in_flight_per_host)
+        return self._host_limits[host]
+
+    async def call(self, url: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs `fn(*args)`, which fetches `url`, in the worker pool once both budgets allow it."""
+        if self._global_limit is None or self._executor is None:
+            raise RuntimeError("crawler is not running")
+
+        async with self._global_limit, self._host_limit(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def parse(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs `fn(*args)`, which parses downloaded pages, outside the request budget.
+        `fn` and its arguments are pickled to a parse process unless parse_workers is 0.
+        """
+        loop = asyncio.get_running_loop()
+        parser = self._parser()
+        try:
+            return await loop.run_in_executor(parser, fn, *args)
+        except BrokenProcessPool:
+            # A parse process died (OOM, segfault) and the pool refuses all further work,
+            # so it is replaced and the parse retried once. A page that kills the new pool too fails.
+            self._discard_parser(parser)
+            return await loop.run_in_executor(self._parser(), fn, *args)
+
+    def _discard_parser(self, parser: Executor) -> None:
+        # Every parse in flight sees the same broken pool; only the first replaces it
+        if parser is self._parse_executor:
+            print("A parse process died; starting a new parse pool", flush=True)
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+
+    @contextlib.asynccontextmanager
+    async def _budget(self) -> AsyncIterator[None]:
+        self._host_limits = {}
+        self._global_limit = asyncio.Semaphore(self.max_in_flight)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        try:
+            yield
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._global_limit = None
+
+    async def run(self, seeds: list[CrawlJob], handle: Callable[..., Any]) -> None:
+        """
+        Processes `seeds` and every job they spawn until the queue is drained.
+        `handle(job, enqueue)` is awaited per job and may enqueue follow-up jobs.
+        """
+        queue: asyncio.PriorityQueue[CrawlJob] = asyncio.PriorityQueue()
+        counter = itertools.count()
+
+        def enqueue(kind: JobKind, url: str, payload: Any = None) -> None:
+            queue.put_nowait(CrawlJob(kind, next(counter), url, payload))
+
+        for seed in seeds:
+            enqueue(seed.kind, seed.url, seed.payload)
+
+        async def worker() -> None:
+            while True:
+                job = await queue.get()
+                try:
+                    await handle(job, enqueue)
+                except Exception as exc:
+                    # A worker that died would leave its share of the queue undrained and `join` hung
+                    print(
+                        f"Crawl job {job.url!r} generated an exception: {exc}",
+                        flush=True,
+                    )
+                finally:
+                    queue.task_done()
+
+        async with self._budget():
+            workers = [asyncio.create_task(worker()) for _ in range(self.max_in_flight)]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        url_of: Callable[[Any], Optional[str]],
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> list[tuple[Any, Any, Optional[Exception]]]:
+        """
+        Runs `fn(item)` for every item concurrently under the crawl budget, and `parse` on each
+        of its results when given. Returns `(item, result, exception)` triples in input order;
+        items without a url are skipped.
+        """
+
+        async def call_one(item: Any) -> tuple[Any, Any, Optional[Exception]]:
+            try:
+                result = await self.call(url_of(item), fn, item)
+                if parse:
+                    result = await self.parse(parse, result)
+                return item, result, None
+            except Exception as exc:
+                return item, None, exc
+
+        async def call_all() -> list[tuple[Any, Any, Optional[Exception]]]:
+            async with self._budget():
+                return await asyncio.gather(
+                    *(call_one(item) for item in items if url_of(item))
+                )
+
+        return asyncio.run(call_all())
+
+
+class TournamentCrawl:
+    """
+    Crawls tournament pages, standings, decklists and match histories as one dependency-aware queue.
+    Extracted rows are handed to `on_rows(table_name, rows)` as soon as each job completes.
+    """
+
+    def __init__(
+        self,
+        tournament_params: TournamentPayload,
+        on_rows: RowsCallback,
+        target_dt: Optional[datetime] = None,
+        backfill: bool = False,
+        crawler: Optional[Crawler] = None,
+        frontier: Optional[CrawlFrontier] = None,
+        index: Optional[TournamentIndex] = None,
+    ):
+        self.tournament_params = tournament_params
+        self.on_rows = on_rows
+        self.target_dt = target_dt
+        self.backfill = backfill
+        self.crawler = crawler or Crawler()
+        self.frontier = frontier
+        self.index = index
+        self.tournaments_seen: list[str] = []
+        self.tournaments_unchanged = 0
+        self.details_scheduled = 0
+        self.details_completed = 0
+
+    def run(self) -> None:
+        seed = CrawlJob(
+            JobKind.TOURNAMENT_PAGE,
+            0,
+            BASE_URL + "/tournaments/completed",
+            self.tournament_params.page,
+        )
+        asyncio.run(self.crawler.run([seed], self.handle))
+
+    def _record(
+        self,
+        kind: str,
+        key: str,
+        tournament: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if self.frontier:
+            self.frontier.record(kind, key, tournament, error)
+
+    async def handle(self, job: CrawlJob, enqueue: Callable[..., None]) -> None:
+        if job.kind is JobKind.TOURNAMENT_PAGE:
+            await self._tournament_page(job, enqueue)
+        elif job.kind is JobKind.STANDINGS:
+            await self._standings(job, enqueue)
+        else:
+            await self._details(job)
+
+    async def _tournament_page(
+        self, job: CrawlJob, enqueue: Callable[..., None]
+    ) -> None:
+        page: int = job.payload
+        try:
+            batch, has_more = await self.crawler.call(
+                job.url,
+                extract_tournament_page,
+                self.tournament_params,
+                page,
+                self.target_dt,
+                self.backfill,
+            )
+        except Exception as exc:
+            print(f"Tournament page {page} generated an exception: {exc}", flush=True)
+            self._record(PAGE, str(page), error=exc)
+            return
+
+        self._record(PAGE, str(page))
+
+        if has_more:
+            enqueue(JobKind.TOURNAMENT_PAGE, job.url, page + 1)
+
+        if not batch:
+            return
+
+        print(
+            f"Yielding batch of {len(batch)} tournaments from page {page}", flush=True
+        )
+        self.on_rows(TOURNAMENTS_TABLE, batch)
+        for tournament in batch:
+            if not tournament.tournament_page:
+                continue
+            self.tournaments_seen.append(tournament.tournament_page)
+            if self.frontier and self.frontier.tournament_done(
+                tournament.tournament_page
+            ):
+                continue
+            if self.index and self.index.is_unchanged(tournament):
+                self.tournaments_unchanged += 1
+                continue
+            enqueue(JobKind.STANDINGS, tournament.tournament_page, tournament)
+
+    async def _standings(self, job: CrawlJob, enqueue: Callable[..., None]) -> None:
+        tournament: Tournament = job.payload
+        try:
+            page = await self.crawler.call(
+                job.url, fetch_standings, tournament.tournament_page
+            )
+            participants = await self.crawler.parse(parse_standings_page, page)
+        except Exception as exc:
+            print(
+                f"Tournament {tournament.tournament_page!r} generated an exception during participant extraction: {exc}",
+                flush=True,
+            )
+            self._record(STANDINGS, job.url, job.url, exc)
+            return
+
+        self._record(STANDINGS, job.url, job.url)
+        self.on_rows(TOURNAMENT_PARTICIPANTS_TABLE, participants)
+        for participant in participants:
+            wants_decklist = self._wants(DECKLIST, participant.decklist_link)
+            wants_matches = self._wants(MATCHES, participant.matches)
+            if not (wants_decklist or wants_matches):
+                continue
+            enqueue(
+                JobKind.PARTICIPANT,
+                participant.matches or participant.decklist_link,
+                (participant, wants_decklist, wants_matches),
+            )
+            self.details_scheduled += 1
+
+    def _wants(self, kind: str, url: Optional[str]) -> bool:
+        return bool(url) and not (
+            self.frontier and self.frontier.detail_done(kind, url)
+        )
+
+    async def _details(self, job: CrawlJob) -> None:
+        participant: Participant
+        participant, wants_decklist, wants_matches = job.payload
+        try:
+            pages = await self.crawler.call(
+                job.url,
+                fetch_participant_pages,
+                participant,
+                wants_decklist,
+                wants_matches,
+            )
+            details = await self.crawler.parse(parse_participant_details, pages)
+        except Exception as exc:
+            # Page errors are returned in the details; this is the parse stage itself failing,
+            # e.g. a broken parse process, so both pages are recorded as failed and retried later
+            details = None
+            deck_error: Optional[Exception] = exc
+            matches_error: Optional[Exception] = exc
+        else:
+            deck_error, matches_error = details.deck_error, details.matches_error
+        finally:
+            self.details_completed += 1
+            if self.details_completed % CRAWL_PROGRESS_EVERY == 0:
+                print(
+                    f"Fetched details of {self.details_completed}/{self.details_scheduled} participants. "
+                    f"Rate limiter: {rate_limiter_stats()}",
+                    flush=True,
+                )
+
+        for stage, url, wanted, error in (
+            (DECKLIST, participant.decklist_link, wants_decklist, deck_error),
+            (MATCHES, participant.matches, wants_matches, matches_error),
+        ):
+            if not wanted:
+                continue
+            if error:
+                print(
+                    f"Participant {participant.name!r} generated an exception during {stage} extraction: {error}",
+                    flush=True,
+                )
+            self._record(stage, url, participant.tournament_link, error)
+
+        if details is None:
+            return
+        if details.deck:
+            self.on_rows(PARTICIPANT_DECK_TABLE, [details.deck])
+        if details.matches:
+            self.on_rows(PARTICIPANT_MATCHES_TABLE, details.matches)
@@ -1,17 +1,37 @@
 import re
 import requests
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
-from selectolax.parser import HTMLParser
+from selectolax.parser import HTMLParser, Node
 
 from .constants import BASE_URL, REGEX_CARD_PATTERN
 from .http_client import get
-from .models import Deck, Participant, Tournament, Card, Match
+from .models import (
+    Deck,
+    DecklistColumns,
+    Match,
+    Participant,
+    Tournament,
+    extract_node_text,
+    parse_int,
+)
+from .payload import TournamentPayload
+
+_CARD_PATTERN = re.compile(REGEX_CARD_PATTERN)
+_CARD_HREF_PATTERN = re.compile(r"/cards/([^/]+)/([^/]+)$")
+# The `.cards` selector the decklist is parsed from
+_CARDS_CLASS_PATTERN = re.compile(r"""class=["'](?:[^"']*\s)?cards[\s"']""")
 
 
 def extract_tournaments(response: requests.Response) -> list[Tournament]:
+    return parse_tournaments(response.text)
+
+
+def parse_tournaments(html: str) -> list[Tournament]:
     tournament_list = []
 
-    tree = HTMLParser(response.text)
+    tree = HTMLParser(html)
 
     table_tournament_tree = tree.css_first("body > div.main > div > table")
     for tournaments in table_tournament_tree.css("tr")[1:]:
@@ -31,12 +51,89 @@ def extract_tournaments(response: requests.Response) -> list[Tournament]:
     return tournament_list
 
 
-def extract_participants(link: Optional[str]) -> list[Participant]:
+def extract_tournament_page(
+    tournament_params: TournamentPayload,
+    page: int,
+    target_dt: Optional[datetime] = None,
+    backfill: bool = False,
+) -> tuple[list[Tournament], bool]:
+    """
+    Scrapes one page of completed tournaments.
+    Returns the tournaments selected for the run and whether the next page should be scraped.
+    """
+    params = tournament_params.model_dump()
+    params["page"] = page
+
+    print(f"Scraping page {page}...", flush=True)
+
+    response = get(BASE_URL + "/tournaments/completed", params=params)
+
+    tournaments_list = extract_tournaments(response)
+
+    if not tournaments_list:
+        print("No tournaments found on this page.")
+        return [], False
+
+    batch = []
+    stop_extraction = False
+
+    for t in tournaments_list:
+        if backfill:
+            batch.append(t)
+        else:
+            if not t.data_date:
+                print(f"Missing or invalid date for tournament: {t.tournament_page}")
+                continue
+            t_date = datetime(t.data_date.year, t.data_date.month, t.data_date.day)
+
+            # We only want tournaments from the target month
+            if target_dt is None:
+                raise ValueError("invalid value for target date")
+
+            elif t_date.year == target_dt.year and t_date.month == target_dt.month:
+                batch.append(t)
+
+            elif t_date < target_dt:
+                stop_extraction = True
+            else:
+                continue
+
+    if stop_extraction and not backfill:
+        print("Reached past data relative to target month. Stopping.", flush=True)
+        return batch, False
+
+    if len(tournaments_list) < tournament_params.show:
+        print("End scraping tournaments (last page reached).", flush=True)
+        return batch, False
+
+    return batch, True
+
+
+@dataclass(slots=True)
+class FetchedPage:
+    """Raw HTML of a page, downloaded by the fetch stage for the parse stage."""
+
+    url: str
+    html: str
+
+
+def fetch_standings(link: Optional[str]) -> FetchedPage:
     if not link:
         raise ValueError("tournament link not provided")
 
-    response = get(link)
-    tree = HTMLParser(response.text)
+    return FetchedPage(link, get(link, immutable=True).text)
+
+
+def parse_standings_page(page: FetchedPage) -> list[Participant]:
+    return parse_standings(page.url, page.html)
+
+
+def extract_participants(link: Optional[str]) -> list[Participant]:
+    return parse_standings_page(fetch_standings(link))
+
+
+def parse_standings(link: str, html: str) -> list[Participant]:
+    tree = HTMLParser(html)
     header_element = tree.css_first(
         "body > div.main > div > div.standings.completed > table > tbody > tr:nth-child(1)"
     )
@@ -47,45 +144,33 @@ def extract_participants(link: Optional[str]) -> list[Participant]:
     )[1:]
 
     return [
-        Participant(
-            tournament_link=link, **dict(zip(headers, [i for i in element.css("td")]))
-        )
+        parse_participant(link, dict(zip(headers, element.css("td"))))
         for element in element_list
     ]
 
 
-def parse_card(text: str, kind: str, code: Optional[str] = None) -> Card:
-    match = re.match(REGEX_CARD_PATTERN, text)
-
-    if match:
-        return Card(
-            **{
-                "quantity": int(match.group(1)),
-                "name": match.group(2).strip(),
-                "code": match.group(3) or code,
-                "kind": kind,
-            }
-        )
-
-    raise ValueError("invalid card string")
-
-
-def extract_card_code(card_node) -> Optional[str]:
-    link = card_node.css_first("a")
-    if not link:
-        return None
-
-    href = link.attributes.get("href", "")
-    match = re.search(r"/cards/([^/]+)/([^/]+)$", href)
-    if not match:
-        return None
-
-    return f"{match.group(1)}-{match.group(2)}"
+def parse_participant(link: str, cells: dict[str, Node]) -> Participant:
+    """Builds a Participant from a standings row keyed by column header, keeping only plain values."""
+    decklist_href = None
+    if (list_cell := cells.get("List")) and (anchor := list_cell.css_first("a")):
+        decklist_href = anchor.attributes.get("href")
+
+    return Participant(
+        tournament_link=link,
+        place=parse_int(extract_node_text(cells["Place"])),
+        name=extract_node_text(cells["Name"]),
+        record=extract_node_text(cells["Record"]),
+        deck=extract_node_text(cells["Deck"]) if "Deck" in cells else None,
+        points=extract_node_text(cells["Points"]) if "Points" in cells else None,
+        decklist_link=BASE_URL + decklist_href if decklist_href else None,
+        matches=BASE_URL + decklist_href.replace("/decklist", "")
+        if decklist_href
+        else None,
+    )
 
 
-def extract_card_kind(card_container) -> str:
-    heading = card_container.css_first(".heading")
-    heading_text = heading.text(strip=True).lower() if heading else ""
+def card_kind(heading: str) -> str:
+    heading_text = heading.lower()
     if "energy" in heading_text:
         return "energy"
     if "trainer" in heading_text:
@@ -96,48 +181,82 @@ def extract_card_kind(card_container) -> str:
     raise ValueError(f"unknown card kind heading: {heading_text!r}")
 
 
-def extract_decklist(link: Optional[str]) -> list[Card]:
+@dataclass(slots=True)
+class ParticipantPages:
+    """
+    Raw detail pages of one participant, downloaded by `fetch_participant_pages`.
+    The player page is fetched first; when it already carries the decklist, /decklist is never fetched.
+    """
+
+    participant: Participant
+    decklist: bool = True
+    matches: bool = True
+    player_html: Optional[str] = None
+    decklist_html: Optional[str] = None
+    player_error: Optional[Exception] = None
+    decklist_error: Optional[Exception] = None
+
+
+@dataclass(slots=True)
+class ParticipantDetails:
+    deck: Optional[Deck] = None
+    matches: list[Match] = field(default_factory=list)
+    deck_error: Optional[Exception] = None
+    matches_error: Optional[Exception] = None
+
+
+def parse_decklist(tree: HTMLParser) -> DecklistColumns:
+    """
+    Parses every card line of a decklist page into columns in one pass per card section.
+    Card lines must match REGEX_CARD_PATTERN; the code falls back to the card link when absent.
+    """
+    columns = DecklistColumns()
+    for container in tree.css(".cards"):
+        heading = container.css_first(".heading")
+        kind = card_kind(heading.text(strip=True) if heading else "")
+
+        for node in container.css("p"):
+            text = node.text()
+            match = _CARD_PATTERN.match(text)
+            if not match:
+                raise ValueError(f"invalid card string: {text!r}")
+
+            code = match.group(3)
+            if code is None:
+                for child in node.traverse():
+                    if child.tag == "a":
+                        href = _CARD_HREF_PATTERN.search(
+                            child.attributes.get("href") or ""
+                        )
+                        code = f"{href.group(1)}-{href.group(2)}" if href else None
+                        break
+
+            columns.name.append(match.group(2).strip())
+            columns.code.append(code)
+            columns.quantity.append(int(match.group(1)))
+            columns.kind.append(kind)
+
+    return columns
+
+
+def extract_decklist(link: Optional[str]) -> DecklistColumns:
     if not link:
         raise ValueError("decklist link not provided")
 
-    response = get(link)
-    tree = HTMLParser(response.text)
-    card_container_list = tree.css(".cards")
-
-    decklist = []
-    for raw_card_node in card_container_list:
-        kind = extract_card_kind(raw_card_node)
-        decklist.extend(
-            [
-                parse_card(node.text(), kind=kind, code=extract_card_code(node))
-                for node in raw_card_node.css("p")
-            ]
-        )
-
-    return decklist
+    response = get(link, immutable=True)
+    return parse_decklist(HTMLParser(response.text))
 
 
 def get_deck(participant: Participant) -> Optional[Deck]:
     """Fetches a decklist for a participant and constructs a Deck object."""
-    if not participant.decklist_link:
-        return None
-
-    decklist = extract_decklist(participant.decklist_link)
-    return Deck(
-        player=participant.name,
-        tournament=participant.tournament_link,
-        decklist=decklist,
-        decklist_link=participant.decklist_link,
-    )
+    return fetch_participant_details(participant, matches=False).deck
 
 
 def extract_matches(participant: Participant) -> list[Match]:
-    if not participant.matches:
-        return []
+    return fetch_participant_details(participant, decklist=False).matches
 
-    response = get(participant.matches)
-    tree = HTMLParser(response.text)
 
+def parse_matches(participant: Participant, tree: HTMLParser) -> list[Match]:
     # Use the 'history' class to find the table as seen in the HTML snippet
     table = tree.css_first("div.history table")
     if not table:
@@ -163,11 +282,89 @@ def extract_matches(participant: Participant) -> list[Match]:
         matches.append(
             Match(
                 tournament=participant.tournament_link,
-                Round=cols[0],
-                Result=cols[1],
-                P2=cols[2],
+                Round=extract_node_text(cols[0]),
+                Result=extract_node_text(cols[1]),
+                P2=extract_node_text(cols[2]),
                 P1=participant.name,
             )
         )
 
     return matches
+
+
+def has_decklist(html: str) -> bool:
+    """Whether a player page carries the decklist, told from its markup without parsing it."""
+    return _CARDS_CLASS_PATTERN.search(html) is not None
+
+
+def fetch_participant_pages(
+    participant: Participant, decklist: bool = True, matches: bool = True
+) -> ParticipantPages:
+    """
+    Downloads the pages the decklist and match history of a participant are parsed from.
+    Both requests run back to back on the calling thread's session, so the second one reuses
+    its warm connection. Failures are kept per page instead of raised.
+    """
+    pages = ParticipantPages(participant, decklist, matches)
+
+    if matches and participant.matches:
+        try:
+            pages.player_html = get(participant.matches, immutable=True).text
+        except Exception as exc:
+            pages.player_error = exc
+
+    if decklist and participant.decklist_link:
+        if pages.player_html is None or not has_decklist(pages.player_html):
+            try:
+                pages.decklist_html = get(
+                    participant.decklist_link, immutable=True
+                ).text
+            except Exception as exc:
+                pages.decklist_error = exc
+
+    return pages
+
+
+def parse_participant_details(pages: ParticipantPages) -> ParticipantDetails:
+    """Parses the pages of `fetch_participant_pages`. Failures are reported per page instead of raised."""
+    participant = pages.participant
+    details = ParticipantDetails()
+    player_tree = (
+        HTMLParser(pages.player_html) if pages.player_html is not None else None
+    )
+
+    if pages.matches and participant.matches:
+        try:
+            if pages.player_error:
+                raise pages.player_error
+            details.matches = parse_matches(participant, player_tree)
+        except Exception as exc:
+            details.matches_error = exc
+
+    if pages.decklist and participant.decklist_link:
+        try:
+            if pages.decklist_html is not None:
+                tree = HTMLParser(pages.decklist_html)
+            elif pages.decklist_error:
+                raise pages.decklist_error
+            else:
+                tree = player_tree
+            details.deck = Deck(
+                player=participant.name,
+                tournament=participant.tournament_link,
+                decklist=parse_decklist(tree),
+                decklist_link=participant.decklist_link,
+            )
+        except Exception as exc:
+            details.deck_error = exc
+
+    return details
+
+
+def fetch_participant_details(
+    participant: Participant, decklist: bool = True, matches: bool = True
+) -> ParticipantDetails:
+    """Extracts the decklist and match history of a participant from one shared set of pages."""
+    return parse_participant_details(
+        fetch_participant_pages(participant, decklist, matches)
+    )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Optional
+
+import dlt
+
+from .constants import CRAWL_FRONTIER_TABLE
+
+PAGE = "page"
+TOURNAMENT = "tournament"
+STANDINGS = "standings"
+DECKLIST = "decklist"
+MATCHES = "matches"
+
+DONE = "done"
+FAILED = "failed"
+
+
+class CrawlFrontier:
+    """
+    Fetch state of every listing page, tournament and participant detail page, persisted
+    in a table of the pipeline dataset.
+    Records are buffered and only written by `commit`, once the rows they describe are loaded.
+    With `resume=True`, completed tournaments and participant pages are skipped.
+    """
+
+    def __init__(self, pipeline: dlt.Pipeline, resume: bool = False):
+        self.pipeline = pipeline
+        self.resume = resume
+        self._lock = threading.Lock()
+        self._done_tournaments: set[str] = set()
+        self._done_details: set[tuple[str, str]] = set()
+        self._pending: dict[
+            tuple[str, str], tuple[str, Optional[str], Optional[str]]
+        ] = {}
+        self._failed_tournaments: set[str] = set()
+
+        with self.pipeline.sql_client() as client:
+            if not client.has_dataset():
+                client.create_dataset()
+            client.execute_sql(
+                f"""
+                create table if not exists {client.make_qualified_table_name(CRAWL_FRONTIER_TABLE)} (
+                    kind varchar not null,
+                    key varchar not null,
+                    tournament varchar,
+                    status varchar not null,
+                    attempts integer not null,
+                    error varchar,
+                    updated_at timestamp not null,
+                    primary key (kind, key)
+                )
+                """
+            )
+            if resume:
+                self._load(client)
+
+    def _load(self, client) -> None:
+        table = client.make_qualified_table_name(CRAWL_FRONTIER_TABLE)
+        self._done_tournaments = {
+            key
+            for (key,) in client.execute_sql(
+                f"select key from {table} where kind = %s and status = %s",
+                TOURNAMENT,
+                DONE,
+            )
+        }
+        # Only details of unfinished tournaments are needed to resume them
+        self._done_details = {
+            (kind, key)
+            for kind, key in client.execute_sql(
+                f"""
+                select kind, key from {table}
+                where kind in (%s, %s) and status = %s
+                    and tournament not in (
+                        select key from {table} where kind = %s and status = %s
+                    )
+                """,
+                DECKLIST,
+                MATCHES,
+                DONE,
+                TOURNAMENT,
+                DONE,
+            )
+        }
+        failed = client.execute_sql(
+            f"select count(*) from {table} where status = %s", FAILED
+        )[0][0]
+        print(
+            f"Resuming crawl: {len(self._done_tournaments)} tournaments complete, "
+            f"{failed} failed fetches to retry.",
+            flush=True,
+        )
+
+    def tournament_done(self, tournament: Optional[str]) -> bool:
+        return self.resume and tournament in self._done_tournaments
+
+    def detail_done(self, kind: str, url: Optional[str]) -> bool:
+        return self.resume and (kind, url) in self._done_details
+
+    def record(
+        self,
+        kind: str,
+        key: str,
+        tournament: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            status = FAILED if error else DONE
+            self._pending[(kind, key)] = (
+                status,
+                tournament,
+                str(error) if error else None,
+            )
+            if error and tournament:
+                self._failed_tournaments.add(tournament)
+
+    def complete_tournaments(self, tournaments: Iterable[Optional[str]]) -> None:
+        """Marks tournaments done unless one of their pages failed in this run."""
+        with self._lock:
+            for tournament in tournaments:
+                if tournament and tournament not in self._failed_tournaments:
+                    self._pending[(TOURNAMENT, tournament)] = (DONE, tournament, None)
+
+    def commit(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._failed_tournaments = set()
+        if not pending:
+            return
+
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        rows = [
+            (kind, key, tournament, status, 1, error, now)
+            for (kind, key), (status, tournament, error) in pending.items()
+        ]
+        with self.pipeline.sql_client() as client:
+            table = client.make_qualified_table_name(CRAWL_FRONTIER_TABLE)
+            client.native_connection.executemany(
+                f"""
+                insert into {table} values (?, ?, ?, ?, ?, ?, ?)
+                on conflict (kind, key) do update set
+                    tournament = excluded.tournament,
+                    status = excluded.status,
+                    attempts = {table}.attempts + 1,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+
+        for kind, key, _, status, *_ in rows:
+            if status != DONE:
+                continue
+            if kind == TOURNAMENT:
+                self._done_tournaments.add(key)
+            elif kind in (DECKLIST, MATCHES):
+                self._done_details.add((kind, key))
+
+    def rollback(self) -> None:
+        """Drops buffered records of a batch that failed to load."""
+        with self._lock:
+            self._pending = {}
+            self._failed_tournaments = set()
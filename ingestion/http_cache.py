@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .constants import HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTL_SECONDS
+
+_SCHEMA = """
+create table if not exists responses (
+    key text primary key,
+    url text not null,
+    status integer not null,
+    content_type text,
+    encoding text,
+    etag text,
+    last_modified text,
+    body blob not null,
+    size integer not null,
+    immutable integer not null,
+    fetched_at real not null,
+    accessed_at real not null
+);
+create index if not exists responses_accessed_at on responses (accessed_at);
+"""
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a request is not in the cache."""
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    key: str
+    url: str
+    status: int
+    content_type: Optional[str]
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    immutable: bool
+    fetched_at: float
+
+    def is_fresh(self, ttl_seconds: float, now: Optional[float] = None) -> bool:
+        if self.immutable:
+            return True
+        return (now or time.time()) - self.fetched_at < ttl_seconds
+
+    def revalidation_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response._content = self.body
+        response.status_code = self.status
+        response.url = self.url
+        response.encoding = self.encoding
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": self.content_type} if self.content_type else {}
+        )
+        return response
+
+
+def cache_key(url: str, params: Any = None) -> str:
+    """Addresses a GET request by its url and sorted query parameters."""
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        url = f"{url}?{urlencode(sorted((str(k), str(v)) for k, v in items))}"
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite backed store of zlib compressed GET responses.
+    Mutable entries expire after `ttl_seconds` and are revalidated with ETag/Last-Modified;
+    immutable entries never expire. The least recently used entries are evicted above `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = HTTP_CACHE_MAX_BYTES,
+        ttl_seconds: float = HTTP_CACHE_TTL_SECONDS,
+        offline: bool = False,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.offline = offline
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as con:
+            con.executescript(_SCHEMA)
+            (self._total_bytes,) = con.execute(
+                "select coalesce(sum(size), 0) from responses"
+            ).fetchone()
+            if self._total_bytes > self.max_bytes:
+                self._evict(con)
+
+    def _connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "connection", None)
+        if con is None:
+            con = sqlite3.connect(self.path, timeout=30)
+            con.execute("pragma journal_mode=wal")
+            con.execute("pragma synchronous=normal")
+            self._local.connection = con
+        return con
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        row = (
+            self._connection()
+            .execute(
+                "select key, url, status, content_type, encoding, etag, last_modified, "
+                "body, immutable, fetched_at from responses where key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        return CachedResponse(
+            key=row[0],
+            url=row[1],
+            status=row[2],
+            content_type=row[3],
+            encoding=row[4],
+            etag=row[5],
+            last_modified=row[6],
+            body=zlib.decompress(row[7]),
+            immutable=bool(row[8]),
+            fetched_at=row[9],
+        )
+
+    def touch(self, key: str, revalidated: bool = False) -> None:
+        now = time.time()
+        with self._connection() as con:
+            if revalidated:
+                con.execute(
+                    "update responses set accessed_at = ?, fetched_at = ? where key = ?",
+                    (now, now, key),
+                )
+            else:
+                con.execute(
+                    "update responses set accessed_at = ? where key = ?", (now, key)
+                )
+
+    def store(
+        self, key: str, response: requests.Response, immutable: bool = False
+    ) -> None:
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self._lock, self._connection() as con:
+            previous = con.execute(
+                "select size from responses where key = ?", (key,)
+            ).fetchone()
+            con.execute(
+                "insert or replace into responses values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    response.headers.get("Content-Type"),
+                    response.encoding,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    body,
+                    len(body),
+                    int(immutable),
+                    now,
+                    now,
+                ),
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(con)
+
+    def _evict(self, con: sqlite3.Connection) -> None:
+        """Drops least recently used entries until the cache is back under 90% of max_bytes."""
+        target = int(self.max_bytes * 0.9)
+        while self._total_bytes > target:
+            rows = con.execute(
+                "select key, size from responses order by accessed_at limit 256"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                con.execute("delete from responses where key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= target:
+                    break
+
+    def stats(self) -> dict[str, Any]:
+        entries, immutable = (
+            self._connection()
+            .execute("select count(*), coalesce(sum(immutable), 0) from responses")
+            .fetchone()
+        )
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "immutable_entries": immutable,
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -1,32 +1,97 @@
 from __future__ import annotations
 
 import threading
-from typing import Any
+import time
+from pathlib import Path
+from typing import Any, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from .constants import (
+    BASE_URL,
     HEADERS,
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CACHE_TTL_SECONDS,
+    RATE_LIMIT_INITIAL_IN_FLIGHT,
+    RATE_LIMIT_INITIAL_RATE,
+    RATE_LIMIT_MAX_RATE,
+    RATE_LIMIT_MIN_RATE,
     REQUEST_RETRY_ALLOWED_METHODS,
     REQUEST_RETRY_ATTEMPTS,
     REQUEST_RETRY_BACKOFF_FACTOR,
     REQUEST_RETRY_STATUS_CODES,
     REQUEST_TIMEOUT_SECONDS,
 )
+from .http_cache import CacheMissError, ResponseCache, cache_key
+from .rate_limiter import AdaptiveRateLimiter
 
 _THREAD_LOCAL = threading.local()
+# Throttling statuses are retried by `_fetch`, so every attempt is seen by the shared rate limiter
 _RETRY_CONFIG = Retry(
     total=REQUEST_RETRY_ATTEMPTS,
     connect=REQUEST_RETRY_ATTEMPTS,
     read=REQUEST_RETRY_ATTEMPTS,
-    status=REQUEST_RETRY_ATTEMPTS,
+    status=0,
     backoff_factor=REQUEST_RETRY_BACKOFF_FACTOR,
-    status_forcelist=REQUEST_RETRY_STATUS_CODES,
     allowed_methods=REQUEST_RETRY_ALLOWED_METHODS,
-    respect_retry_after_header=True,
 )
+_CACHE: Optional[ResponseCache] = None
+_LIMITER: Optional[AdaptiveRateLimiter] = None
+_ORIGIN: Optional[str] = None
+
+
+def configure_cache(
+    path: Optional[str | Path],
+    max_bytes: int = HTTP_CACHE_MAX_BYTES,
+    ttl_seconds: float = HTTP_CACHE_TTL_SECONDS,
+    offline: bool = False,
+) -> Optional[ResponseCache]:
+    """Enables the on-disk response cache for every `get` call, or disables it when path is None."""
+    global _CACHE
+    _CACHE = (
+        ResponseCache(
+            path, max_bytes=max_bytes, ttl_seconds=ttl_seconds, offline=offline
+        )
+        if path
+        else None
+    )
+    return _CACHE
+
+
+def configure_rate_limiter(
+    max_in_flight: int,
+    max_rate: float = RATE_LIMIT_MAX_RATE,
+    enabled: bool = True,
+) -> Optional[AdaptiveRateLimiter]:
+    """Shares one adaptive rate limiter across every `get` call, or disables it."""
+    global _LIMITER
+    _LIMITER = (
+        AdaptiveRateLimiter(
+            initial_rate=min(RATE_LIMIT_INITIAL_RATE, max_rate),
+            min_rate=min(RATE_LIMIT_MIN_RATE, max_rate),
+            max_rate=max_rate,
+            initial_in_flight=min(RATE_LIMIT_INITIAL_IN_FLIGHT, max_in_flight),
+            max_in_flight=max_in_flight,
+        )
+        if enabled
+        else None
+    )
+    return _LIMITER
+
+
+def configure_origin(origin: Optional[str]) -> None:
+    """
+    Sends requests for BASE_URL to another origin, such as a local stand-in server.
+    Cache keys and extracted links keep BASE_URL.
+    """
+    global _ORIGIN
+    _ORIGIN = origin.rstrip("/") if origin else None
+
+
+def rate_limiter_stats() -> Optional[dict[str, Any]]:
+    return _LIMITER.stats() if _LIMITER else None
 
 
 def _session() -> requests.Session:
@@ -39,8 +104,86 @@ def _session() -> requests.Session:
     return session
 
 
-def get(url: str, **kwargs: Any) -> requests.Response:
+def _retry_after(response: requests.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return _RETRY_CONFIG.parse_retry_after(value)
+    except Exception:
+        return None
+
+
+def _fetch(url: str, **kwargs: Any) -> requests.Response:
+    """
+    Sends one GET through the rate limiter, retrying throttled and 5xx responses.
+    Returns the last response once REQUEST_RETRY_ATTEMPTS are exhausted.
+    """
+    if _ORIGIN and url.startswith(BASE_URL):
+        url = _ORIGIN + url[len(BASE_URL) :]
+
+    for attempt in range(REQUEST_RETRY_ATTEMPTS + 1):
+        if _LIMITER:
+            _LIMITER.acquire()
+        started = time.monotonic()
+        try:
+            response = _session().get(url, **kwargs)
+        except requests.RequestException as exc:
+            if _LIMITER:
+                _LIMITER.release(
+                    time.monotonic() - started,
+                    throttled=isinstance(exc, requests.Timeout),
+                )
+            raise
+
+        throttled = response.status_code in REQUEST_RETRY_STATUS_CODES
+        retry_after = _retry_after(response) if throttled else None
+        if _LIMITER:
+            _LIMITER.release(time.monotonic() - started, throttled, retry_after)
+
+        if not throttled or attempt == REQUEST_RETRY_ATTEMPTS:
+            return response
+
+        # The shared limiter already paces the retry; without it, back off on this thread
+        if not _LIMITER:
+            time.sleep(retry_after or REQUEST_RETRY_BACKOFF_FACTOR * 2**attempt)
+
+    raise AssertionError("unreachable")
+
+
+def get(url: str, immutable: bool = False, **kwargs: Any) -> requests.Response:
+    """
+    GETs url through the shared session and the response cache when one is configured.
+    Pages fetched with immutable=True (completed tournaments) are never revalidated once cached.
+    """
     kwargs.setdefault("timeout", REQUEST_TIMEOUT_SECONDS)
-    response = _session().get(url, **kwargs)
+    if _CACHE is None:
+        response = _fetch(url, **kwargs)
+        response.raise_for_status()
+        return response
+
+    key = cache_key(url, kwargs.get("params"))
+    cached = _CACHE.lookup(key)
+    if cached and cached.is_fresh(_CACHE.ttl_seconds):
+        _CACHE.touch(key)
+        return cached.to_response()
+
+    if _CACHE.offline:
+        if cached:
+            return cached.to_response()
+        raise CacheMissError(f"{url!r} is not cached and the cache is offline")
+
+    if cached:
+        kwargs["headers"] = {
+            **cached.revalidation_headers(),
+            **(kwargs.get("headers") or {}),
+        }
+
+    response = _fetch(url, **kwargs)
+    if cached and response.status_code == requests.codes.not_modified:
+        _CACHE.touch(key, revalidated=True)
+        return cached.to_response()
+
     response.raise_for_status()
+    _CACHE.store(key, response, immutable=immutable)
     return response
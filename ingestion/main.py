@@ -1,14 +1,20 @@
 import argparse
+import itertools
+import os
 import warnings
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Optional
 
 import dlt
 
 from .constants import (
-    BASE_URL,
-    DETAIL_FETCH_WORKERS,
+    CRAWL_MAX_IN_FLIGHT,
+    CRAWL_MAX_IN_FLIGHT_PER_HOST,
+    CRAWL_PARSE_WORKERS,
+    HTTP_CACHE_PATH,
+    PARTICIPANT_DECK_CARDS_PRIMARY_KEY,
+    PARTICIPANT_DECK_CARDS_TABLE,
     PARTICIPANT_DECK_PRIMARY_KEY,
     PARTICIPANT_DECK_TABLE,
     PARTICIPANT_MATCHES_PRIMARY_KEY,
@@ -16,18 +22,34 @@ from .constants import (
     PIPELINE_DATASET_NAME,
     PIPELINE_DESTINATION,
     PIPELINE_NAME,
+    RATE_LIMIT_MAX_RATE,
+    STREAM_BATCH_SIZE,
     TOURNAMENT_PARTICIPANTS_PRIMARY_KEY,
     TOURNAMENT_PARTICIPANTS_TABLE,
     TOURNAMENTS_PRIMARY_KEY,
     TOURNAMENTS_TABLE,
 )
+from .batches import (
+    MATCH_ATTRIBUTES,
+    PARTICIPANT_DECK_SCHEMA,
+    PARTICIPANT_MATCHES_SCHEMA,
+    TOURNAMENT_PARTICIPANTS_SCHEMA,
+    TOURNAMENTS_SCHEMA,
+    deck_cards_table,
+    to_table,
+)
+from .crawler import Crawler, TournamentCrawl
 from .extractors import (
-    extract_matches,
-    extract_participants,
-    extract_tournaments,
-    get_deck,
+    ParticipantDetails,
+    extract_tournament_page,
+    fetch_participant_pages,
+    fetch_standings,
+    parse_participant_details,
+    parse_standings_page,
 )
-from .http_client import get
+from .frontier import DECKLIST, MATCHES, STANDINGS, CrawlFrontier
+from .http_client import configure_cache, configure_rate_limiter, rate_limiter_stats
+from .models import Deck, Match, Participant, Tournament
 from .payload import (
     FormatEnum,
     GameEnum,
@@ -36,10 +58,54 @@ from .payload import (
     TournamentPayload,
     TypeEnum,
 )
+from .tournament_index import TournamentIndex
 
 # Suppress the pkg_resources deprecation warning from dlt
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated as an API")
 
+# Arrow tables get the _dlt_load_id column of rows normalized by dlt, which the staging models read.
+# Set in the environment so that normalize worker processes see it too.
+os.environ.setdefault("NORMALIZE__PARQUET_NORMALIZER__ADD_DLT_LOAD_ID", "true")
+
+
+def default_tournament_params() -> TournamentPayload:
+    """Completed online standard tournaments, as scraped by every ingestion run."""
+    return TournamentPayload(
+        game=GameEnum.TCG,
+        format=FormatEnum.STANDARD,
+        platform=PlatformEnum.ALL,
+        type=TypeEnum.ONLINE,
+        time=TimeEnum.ALL,
+    )
+
+
+def resolve_target_month(
+    target_month: Optional[str] = None, backfill: bool = False
+) -> Optional[datetime]:
+    """
+    Resolves the first day of the month scraped in incremental mode.
+    Returns None in backfill mode or when target_month is not a valid YYYY-MM.
+    """
+    if backfill:
+        print("Running in backfill mode.", flush=True)
+        return None
+
+    if target_month:
+        try:
+            target_dt = datetime.strptime(target_month, "%Y-%m")
+        except ValueError:
+            print(f"Invalid target_month format: {target_month}. Expected YYYY-MM.")
+            return None
+    else:
+        now = datetime.now()
+        target_dt = datetime(now.year, now.month, 1)
+    print(
+        f"Running in incremental mode for month: {target_dt.strftime('%Y-%m')}",
+        flush=True,
+    )
+    return target_dt
+
+
 def iter_tournaments(
     tournament_params: TournamentPayload,
     target_month: Optional[str] = None,
@@ -51,68 +117,16 @@ def iter_tournaments(
     If backfill is False, scrapes only for the target_month (YYYY-MM).
     If target_month is not provided, defaults to current month.
     """
-    target_dt = None
-    if not backfill:
-        if target_month:
-            try:
-                target_dt = datetime.strptime(target_month, "%Y-%m")
-            except ValueError:
-                print(f"Invalid target_month format: {target_month}. Expected YYYY-MM.")
-                return
-        else:
-            now = datetime.now()
-            target_dt = datetime(now.year, now.month, 1)
-        print(
-            f"Running in incremental mode for month: {target_dt.strftime('%Y-%m')}",
-            flush=True,
-        )
-    else:
-        print("Running in backfill mode.", flush=True)
+    target_dt = resolve_target_month(target_month, backfill)
+    if target_dt is None and not backfill:
+        return
 
     has_data = True
     page = tournament_params.page
     while has_data:
-        params = tournament_params.model_dump()
-        params["page"] = page
-
-        print(f"Scraping page {page}...", flush=True)
-
-        response = get(BASE_URL + "/tournaments/completed", params=params)
-
-        tournaments_list = extract_tournaments(response)
-
-        if not tournaments_list:
-            print("No tournaments found on this page.")
-            break
-
-        batch_to_yield = []
-        stop_extraction = False
-
-        for t in tournaments_list:
-            if backfill:
-                batch_to_yield.append(t)
-            else:
-                if not t.date:
-                    continue
-                try:
-                    # Date is in ISO format (e.g., 2026-02-01T02:00:00.000Z) or YYYY-MM-DD
-                    date_str = t.date.split("T")[0]
-                    t_date = datetime.strptime(date_str, "%Y-%m-%d")
-                except ValueError:
-                    print(f"Failed to parse date: {t.date}")
-                    continue
-
-                # We only want tournaments from the target month
-                if target_dt is None:
-                    raise ValueError("invalid value for target date")
-
-                elif t_date.year == target_dt.year and t_date.month == target_dt.month:
-                    batch_to_yield.append(t)
-
-                elif t_date < target_dt:
-                    stop_extraction = True
-                else:
-                    continue
+        batch_to_yield, has_data = extract_tournament_page(
+            tournament_params, page, target_dt, backfill
+        )
 
         if batch_to_yield:
             print(
@@ -121,16 +135,6 @@ def iter_tournaments(
             )
             yield batch_to_yield
 
-        if stop_extraction and not backfill:
-            print("Reached past data relative to target month. Stopping.", flush=True)
-            has_data = False
-            break
-
-        if len(tournaments_list) < tournament_params.show:
-            has_data = False
-            print("End scraping tournaments (last page reached).", flush=True)
-            break
-
         page += 1
 
 
@@ -139,12 +143,9 @@ def iter_tournaments(
     write_disposition="merge",
     primary_key=TOURNAMENTS_PRIMARY_KEY,
 )
-def tournaments(
-    tournament_params: TournamentPayload,
-    target_month: Optional[str] = None,
-    backfill: bool = False,
-):
-    yield from iter_tournaments(tournament_params, target_month, backfill)
+def tournaments(tournament_batches: Iterable[list[Tournament]]):
+    for batch in tournament_batches:
+        yield to_table(batch, TOURNAMENTS_SCHEMA)
 
 
 @dlt.transformer(
@@ -153,51 +154,328 @@ def tournaments(
     write_disposition="merge",
     primary_key=TOURNAMENT_PARTICIPANTS_PRIMARY_KEY,
 )
-def participants(tournaments: dlt.sources.DltResource):
-    for t in tournaments:
-        try:
-            yield extract_participants(t.tournament_page)
-
-        except Exception as exc:
+def participants(
+    tournaments: dlt.sources.DltResource,
+    crawler: Optional[Crawler] = None,
+    frontier: Optional[CrawlFrontier] = None,
+):
+    crawler = crawler or Crawler()
+    pages = tournaments.column("tournament_page").to_pylist()
+    for page, rows, exc in crawler.map(
+        fetch_standings, pages, url_of=lambda page: page, parse=parse_standings_page
+    ):
+        if frontier:
+            frontier.record(STANDINGS, page, page, exc)
+        if exc:
             print(
-                f"Tournament {t.tournament_page!r} generated an exception during participant extraction: {exc}"
+                f"Tournament {page!r} generated an exception during participant extraction: {exc}"
             )
+        elif rows:
+            yield to_table(rows, TOURNAMENT_PARTICIPANTS_SCHEMA)
+
+
+@dlt.transformer(data_from=participants, selected=False)
+def participant_details(
+    participants: dlt.sources.DltResource,
+    crawler: Optional[Crawler] = None,
+    frontier: Optional[CrawlFrontier] = None,
+):
+    """
+    Fetches decklists and match histories of a participant batch in one pass, so pages
+    that carry both are downloaded once. Not loaded itself: decks, deck cards and matches
+    are split into their tables by the transformers below.
+    """
+    crawler = crawler or Crawler()
+    pending = []
+    for p in (Participant(**row) for row in participants.to_pylist()):
+        wants_decklist = bool(p.decklist_link) and not (
+            frontier and frontier.detail_done(DECKLIST, p.decklist_link)
+        )
+        wants_matches = bool(p.matches) and not (
+            frontier and frontier.detail_done(MATCHES, p.matches)
+        )
+        if wants_decklist or wants_matches:
+            pending.append((p, wants_decklist, wants_matches))
+
+    fetched: list[ParticipantDetails] = []
+    for (p, wants_decklist, wants_matches), details, exc in crawler.map(
+        lambda item: fetch_participant_pages(*item),
+        pending,
+        url_of=lambda item: item[0].matches or item[0].decklist_link,
+        parse=parse_participant_details,
+    ):
+        for stage, url, wanted, error in (
+            (DECKLIST, p.decklist_link, wants_decklist, exc or details.deck_error),
+            (MATCHES, p.matches, wants_matches, exc or details.matches_error),
+        ):
+            if not wanted:
+                continue
+            if frontier:
+                frontier.record(stage, url, p.tournament_link, error)
+            if error:
+                print(
+                    f"Participant {p.name!r} generated an exception during {stage} extraction: {error}"
+                )
+        if not exc:
+            fetched.append(details)
+
+    if fetched:
+        yield fetched
 
 
 @dlt.transformer(
-    data_from=participants,
+    data_from=participant_details,
     table_name=PARTICIPANT_DECK_TABLE,
     write_disposition="merge",
     primary_key=PARTICIPANT_DECK_PRIMARY_KEY,
 )
-def decks(participants: dlt.sources.DltResource):
-    for p in participants:
-        try:
-            deck = get_deck(p)
-            if deck:
-                yield deck.model_dump()
+def decks(details: list[ParticipantDetails]):
+    rows = [d.deck for d in details if d.deck]
+    if rows:
+        yield to_table(rows, PARTICIPANT_DECK_SCHEMA)
 
-        except Exception as exc:
-            print(
-                f"Participant {p.name!r} generated an exception during decklist extraction: {exc}"
-            )
+
+@dlt.transformer(
+    data_from=participant_details,
+    table_name=PARTICIPANT_DECK_CARDS_TABLE,
+    write_disposition="merge",
+    primary_key=PARTICIPANT_DECK_CARDS_PRIMARY_KEY,
+    merge_key=PARTICIPANT_DECK_PRIMARY_KEY,
+)
+def deck_cards(details: list[ParticipantDetails]):
+    """Cards of the decks; merging on the deck as well replaces every card of a reloaded deck."""
+    rows = [d.deck for d in details if d.deck]
+    if rows:
+        yield deck_cards_table(rows)
 
 
 @dlt.transformer(
-    data_from=participants,
+    data_from=participant_details,
     table_name=PARTICIPANT_MATCHES_TABLE,
     write_disposition="merge",
     primary_key=PARTICIPANT_MATCHES_PRIMARY_KEY,
 )
-def matches(participants: dlt.sources.DltResource):
-    for p in participants:
+def matches(details: list[ParticipantDetails]):
+    rows = [match for d in details for match in d.matches]
+    if rows:
+        yield to_table(rows, PARTICIPANT_MATCHES_SCHEMA, MATCH_ATTRIBUTES)
+
+
+@dlt.source(name=PIPELINE_NAME)
+def tournament_source(
+    tournament_batches: Iterable[list[Tournament]],
+    crawler: Optional[Crawler] = None,
+    frontier: Optional[CrawlFrontier] = None,
+):
+    """
+    Wires tournaments -> participants -> decks, deck cards and matches into one source.
+    The participants and participant details pipes are forked, so every standings and
+    player page is fetched once per run.
+    """
+    tournament_resource = tournaments(tournament_batches)
+    participant_resource = tournament_resource | participants(
+        crawler=crawler, frontier=frontier
+    )
+    details_resource = participant_resource | participant_details(
+        crawler=crawler, frontier=frontier
+    )
+    return (
+        tournament_resource,
+        participant_resource,
+        details_resource,
+        details_resource | decks,
+        details_resource | deck_cards,
+        details_resource | matches,
+    )
+
+
+def iter_stream_batches(
+    tournament_params: TournamentPayload,
+    target_month: Optional[str] = None,
+    backfill: bool = False,
+    batch_size: int = STREAM_BATCH_SIZE,
+):
+    """Re-chunks scraped tournament pages into batches of at most batch_size tournaments."""
+    for page_batch in iter_tournaments(tournament_params, target_month, backfill):
+        for batch in itertools.batched(page_batch, batch_size):
+            yield list(batch)
+
+
+def run_streaming(
+    pipeline: dlt.Pipeline,
+    tournament_params: TournamentPayload,
+    target_month: Optional[str] = None,
+    backfill: bool = False,
+    batch_size: int = STREAM_BATCH_SIZE,
+    crawler: Optional[Crawler] = None,
+    frontier: Optional[CrawlFrontier] = None,
+    index: Optional[TournamentIndex] = None,
+) -> None:
+    """
+    Loads tournaments in bounded batches, one pipeline.run per batch.
+    Peak memory is bounded by batch_size and every finished batch is committed to the destination,
+    together with its crawl frontier records.
+    """
+    for number, batch in enumerate(
+        iter_stream_batches(tournament_params, target_month, backfill, batch_size),
+        start=1,
+    ):
+        if frontier:
+            batch = [
+                t for t in batch if not frontier.tournament_done(t.tournament_page)
+            ]
+            if not batch:
+                print(f"Skipping stream batch {number}: already complete.", flush=True)
+                continue
+
+        if index:
+            batch = [t for t in batch if not index.is_unchanged(t)]
+            if not batch:
+                print(f"Skipping stream batch {number}: already loaded.", flush=True)
+                continue
+
+        print(
+            f"Loading stream batch {number} with {len(batch)} tournaments.", flush=True
+        )
         try:
-            yield [match.model_dump(by_alias=True) for match in extract_matches(p)]
+            load_info = pipeline.run(
+                tournament_source([batch], crawler=crawler, frontier=frontier),
+                loader_file_format="parquet",
+            )
+        except Exception:
+            if frontier:
+                frontier.rollback()
+            raise
+        print(load_info)
 
-        except Exception as exc:
-            print(
-                f"Participant {p.name!r} generated an exception during matches extraction: {exc}"
+        if frontier:
+            frontier.complete_tournaments(t.tournament_page for t in batch)
+            frontier.commit()
+
+
+class CollectedRows:
+    """Rows handed over by a TournamentCrawl, kept until they are loaded with one pipeline.run per table."""
+
+    def __init__(self):
+        self.tournaments: list[Tournament] = []
+        self.participants: list[Participant] = []
+        self.decks: list[Deck] = []
+        self.matches: list[Match] = []
+
+    def __call__(self, table_name: str, rows: list) -> None:
+        if table_name == TOURNAMENTS_TABLE:
+            self.tournaments.extend(rows)
+        elif table_name == TOURNAMENT_PARTICIPANTS_TABLE:
+            self.participants.extend(rows)
+        elif table_name == PARTICIPANT_DECK_TABLE:
+            self.decks.extend(rows)
+        elif table_name == PARTICIPANT_MATCHES_TABLE:
+            self.matches.extend(rows)
+
+    def __len__(self) -> int:
+        return (
+            len(self.tournaments)
+            + len(self.participants)
+            + len(self.decks)
+            + len(self.matches)
+        )
+
+    def load(self, pipeline: dlt.Pipeline) -> None:
+        if self.tournaments:
+            load_info = pipeline.run(
+                to_table(self.tournaments, TOURNAMENTS_SCHEMA),
+                table_name=TOURNAMENTS_TABLE,
+                write_disposition="merge",
+                primary_key=TOURNAMENTS_PRIMARY_KEY,
+                loader_file_format="parquet",
+            )
+            print(load_info)
+
+        if self.participants:
+            load_info = pipeline.run(
+                to_table(self.participants, TOURNAMENT_PARTICIPANTS_SCHEMA),
+                table_name=TOURNAMENT_PARTICIPANTS_TABLE,
+                write_disposition="merge",
+                primary_key=TOURNAMENT_PARTICIPANTS_PRIMARY_KEY,
+                loader_file_format="parquet",
+            )
+            print(load_info)
+
+        if self.decks:
+            load_info = pipeline.run(
+                to_table(self.decks, PARTICIPANT_DECK_SCHEMA),
+                table_name=PARTICIPANT_DECK_TABLE,
+                write_disposition="merge",
+                primary_key=PARTICIPANT_DECK_PRIMARY_KEY,
+                loader_file_format="parquet",
             )
+            print(load_info)
+
+            # pipeline.run takes no merge_key, so the hints are set on a resource
+            load_info = pipeline.run(
+                dlt.resource(
+                    deck_cards_table(self.decks),
+                    name=PARTICIPANT_DECK_CARDS_TABLE,
+                    write_disposition="merge",
+                    primary_key=PARTICIPANT_DECK_CARDS_PRIMARY_KEY,
+                    merge_key=PARTICIPANT_DECK_PRIMARY_KEY,
+                ),
+                loader_file_format="parquet",
+            )
+            print(load_info)
+
+        if self.matches:
+            load_info = pipeline.run(
+                to_table(self.matches, PARTICIPANT_MATCHES_SCHEMA, MATCH_ATTRIBUTES),
+                table_name=PARTICIPANT_MATCHES_TABLE,
+                write_disposition="merge",
+                primary_key=PARTICIPANT_MATCHES_PRIMARY_KEY,
+                loader_file_format="parquet",
+            )
+            print(load_info)
+
+
+def run_collected(
+    pipeline: dlt.Pipeline,
+    tournament_params: TournamentPayload,
+    target_month: Optional[str] = None,
+    backfill: bool = False,
+    crawler: Optional[Crawler] = None,
+    frontier: Optional[CrawlFrontier] = None,
+    index: Optional[TournamentIndex] = None,
+) -> None:
+    """Crawls every selected tournament first, then loads each table with one pipeline.run."""
+    rows = CollectedRows()
+    target_dt = resolve_target_month(target_month, backfill)
+    crawl = TournamentCrawl(
+        tournament_params,
+        on_rows=rows,
+        target_dt=target_dt,
+        backfill=backfill,
+        crawler=crawler,
+        frontier=frontier,
+        index=index,
+    )
+    if target_dt is not None or backfill:
+        crawl.run()
+
+    print(f"Loaded {len(rows.tournaments)} tournaments from scraper.", flush=True)
+    if crawl.tournaments_unchanged:
+        print(
+            f"Skipped {crawl.tournaments_unchanged} tournaments already loaded.",
+            flush=True,
+        )
+    print(f"Loaded {len(rows.participants)} participants from scraper.", flush=True)
+    print(
+        f"Loaded {len(rows.decks)} decks and {len(rows.matches)} matches from scraper.",
+        flush=True,
+    )
+
+    rows.load(pipeline)
+
+    if frontier:
+        frontier.complete_tournaments(crawl.tournaments_seen)
+        frontier.commit()
 
 
 if __name__ == "__main__":
@@ -213,10 +491,85 @@ if __name__ == "__main__":
         help="Target month for incremental scrape in YYYY-MM-01 format. Defaults to current month.",
         default=None,
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Maximum number of concurrent HTTP requests across all hosts.",
+        default=CRAWL_MAX_IN_FLIGHT,
+    )
+    parser.add_argument(
+        "--max-in-flight-per-host",
+        type=int,
+        help="Maximum number of concurrent HTTP requests against a single host.",
+        default=CRAWL_MAX_IN_FLIGHT_PER_HOST,
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        help="Processes parsing downloaded pages; 0 parses on the fetch threads.",
+        default=CRAWL_PARSE_WORKERS,
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        help="Upper bound of the adaptive request rate, in requests per second.",
+        default=RATE_LIMIT_MAX_RATE,
+    )
+    parser.add_argument(
+        "--no-rate-limit",
+        action="store_true",
+        help="Disable the adaptive rate limiter and rely only on the in-flight budget.",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        help="SQLite file of the on-disk HTTP response cache.",
+        default=HTTP_CACHE_PATH,
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch from the network and do not record responses.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve every request from the response cache and fail on cache misses.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip tournaments and participant pages the crawl frontier marks complete.",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="In incremental mode, re-fetch tournaments that are already loaded with an unchanged player count.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Load tournaments in bounded batches as they are scraped, committing each batch.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Number of tournaments per committed batch in streaming mode.",
+        default=STREAM_BATCH_SIZE,
+    )
 
     args = parser.parse_args()
 
-    time_param = TimeEnum.ALL
+    cache = configure_cache(
+        None if args.no_cache else args.cache_path, offline=args.offline
+    )
+    if cache:
+        print(f"Using HTTP response cache: {cache.stats()}", flush=True)
+    configure_rate_limiter(
+        max_in_flight=args.max_in_flight,
+        max_rate=args.max_rate,
+        enabled=not args.no_rate_limit,
+    )
 
     pipeline = dlt.pipeline(
         pipeline_name=PIPELINE_NAME,
@@ -224,118 +577,41 @@ if __name__ == "__main__":
         dataset_name=PIPELINE_DATASET_NAME,
     )
 
-    payload = TournamentPayload(
-        game=GameEnum.TCG,
-        format=FormatEnum.STANDARD,
-        platform=PlatformEnum.ALL,
-        type=TypeEnum.ONLINE,
-        time=time_param,
+    payload = default_tournament_params()
+    crawler = Crawler(
+        max_in_flight=args.max_in_flight,
+        max_in_flight_per_host=args.max_in_flight_per_host,
+        parse_workers=args.parse_workers,
     )
-    tournament_rows = [
-        tournament
-        for batch in iter_tournaments(
-            payload, target_month=args.month, backfill=args.backfill
-        )
-        for tournament in batch
-    ]
-    print(f"Loaded {len(tournament_rows)} tournaments from scraper.", flush=True)
-
-    participant_rows = []
-    for tournament in tournament_rows:
-        try:
-            participant_rows.extend(extract_participants(tournament.tournament_page))
-        except Exception as exc:
-            print(
-                f"Tournament {tournament.tournament_page!r} generated an exception during participant extraction: {exc}"
-            )
-    print(f"Loaded {len(participant_rows)} participants from scraper.", flush=True)
-
-    def fetch_participant_details(participant):
-        deck_row = None
-        participant_matches = []
-        errors = []
-
-        try:
-            deck = get_deck(participant)
-            if deck:
-                deck_row = deck.model_dump()
-        except Exception as exc:
-            errors.append(
-                f"Participant {participant.name!r} generated an exception during decklist extraction: {exc}"
+    frontier = CrawlFrontier(pipeline, resume=args.resume)
+    index = None
+    if not args.backfill and not args.refresh:
+        index = TournamentIndex.load(pipeline)
+        print(f"Known tournaments in destination: {len(index)}", flush=True)
+
+    # Stops the parse processes once the crawl is done
+    with crawler:
+        if args.stream:
+            run_streaming(
+                pipeline,
+                payload,
+                target_month=args.month,
+                backfill=args.backfill,
+                batch_size=args.batch_size,
+                crawler=crawler,
+                frontier=frontier,
+                index=index,
             )
-
-        try:
-            participant_matches = [
-                match.model_dump(by_alias=True)
-                for match in extract_matches(participant)
-            ]
-        except Exception as exc:
-            errors.append(
-                f"Participant {participant.name!r} generated an exception during matches extraction: {exc}"
+        else:
+            run_collected(
+                pipeline,
+                payload,
+                target_month=args.month,
+                backfill=args.backfill,
+                crawler=crawler,
+                frontier=frontier,
+                index=index,
             )
 
-        return deck_row, participant_matches, errors
-
-    deck_rows = []
-    match_rows = []
-    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
-        futures = [
-            executor.submit(fetch_participant_details, participant)
-            for participant in participant_rows
-        ]
-        for completed, future in enumerate(as_completed(futures), start=1):
-            deck_row, participant_matches, errors = future.result()
-            if deck_row:
-                deck_rows.append(deck_row)
-            match_rows.extend(participant_matches)
-            for error in errors:
-                print(error, flush=True)
-            if completed % 500 == 0 or completed == len(futures):
-                print(
-                    f"Fetched details for {completed}/{len(futures)} participants.",
-                    flush=True,
-                )
-    print(
-        f"Loaded {len(deck_rows)} decks and {len(match_rows)} matches from scraper.",
-        flush=True,
-    )
-
-    if tournament_rows:
-        load_info = pipeline.run(
-            [tournament.model_dump() for tournament in tournament_rows],
-            table_name=TOURNAMENTS_TABLE,
-            write_disposition="merge",
-            primary_key=TOURNAMENTS_PRIMARY_KEY,
-            loader_file_format="jsonl",
-        )
-        print(load_info)
-
-    if participant_rows:
-        load_info = pipeline.run(
-            [participant.model_dump() for participant in participant_rows],
-            table_name=TOURNAMENT_PARTICIPANTS_TABLE,
-            write_disposition="merge",
-            primary_key=TOURNAMENT_PARTICIPANTS_PRIMARY_KEY,
-            loader_file_format="jsonl",
-        )
-        print(load_info)
-
-    if deck_rows:
-        load_info = pipeline.run(
-            deck_rows,
-            table_name=PARTICIPANT_DECK_TABLE,
-            write_disposition="merge",
-            primary_key=PARTICIPANT_DECK_PRIMARY_KEY,
-            loader_file_format="jsonl",
-        )
-        print(load_info)
-
-    if match_rows:
-        load_info = pipeline.run(
-            match_rows,
-            table_name=PARTICIPANT_MATCHES_TABLE,
-            write_disposition="merge",
-            primary_key=PARTICIPANT_MATCHES_PRIMARY_KEY,
-            loader_file_format="jsonl",
-        )
-        print(load_info)
+    if stats := rate_limiter_stats():
+        print(f"Rate limiter: {stats}", flush=True)
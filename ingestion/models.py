@@ -1,8 +1,8 @@
+from dataclasses import dataclass, field
+from datetime import date
 from typing import Annotated, Any, Optional
 from pydantic import BaseModel, Field, BeforeValidator, computed_field
 
-from .constants import BASE_URL
-
 
 def extract_node_text(value: Any) -> str:
     if not hasattr(value, "text"):
@@ -19,62 +19,94 @@ def extract_node_text(value: Any) -> str:
     return ""
 
 
-TextExtractorValidator = Annotated[
-    Any, BeforeValidator(extract_node_text)
-]
+TextExtractorValidator = Annotated[Any, BeforeValidator(extract_node_text)]
 
 
-class Participant(BaseModel):
-    tournament_link: str
-    place: Annotated[TextExtractorValidator, Field(alias="Place")]
-    name: Annotated[TextExtractorValidator, Field(alias="Name")]
-    record: Annotated[TextExtractorValidator, Field(alias="Record")]
-    deck: Annotated[Optional[TextExtractorValidator], Field(alias="Deck")] = None
-    raw_decklist: Annotated[Any, Field(alias="List", exclude=True)] = None
-    points: Annotated[Optional[TextExtractorValidator], Field(alias="Points")] = None
+def parse_date(value: Any) -> Optional[date]:
+    """Date of an ISO date or timestamp (2026-02-01 or 2026-02-01T02:00:00.000Z), None when missing or invalid."""
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value).split("T")[0])
+    except ValueError:
+        return None
 
-    @computed_field
-    @property
-    def decklist_link(self) -> Optional[str]:
-        if self.raw_decklist and (link := self.raw_decklist.css_first("a")):
-            if href := link.attributes.get("href"):
-                return BASE_URL + href
 
-    @computed_field
-    @property
-    def matches(self) -> Optional[str]:
-        if self.raw_decklist and (link := self.raw_decklist.css_first("a")):
-            if href := link.attributes.get("href"):
-                return BASE_URL + href.replace("/decklist", "")
+def parse_int(value: Any) -> Optional[int]:
+    """Integer of a whole-number string, None for anything else (empty cells, DQ, ...)."""
+    if isinstance(value, int):
+        return value
+    text = str(value or "").strip()
+    return int(text) if text.isdigit() else None
+
+
+DateValidator = Annotated[Optional[date], BeforeValidator(parse_date)]
+IntValidator = Annotated[Optional[int], BeforeValidator(parse_int)]
+
+
+@dataclass(slots=True)
+class Participant:
+    """
+    Standings row reduced to plain values at parse time.
+    Holds no selectolax node, so the parsed standings page can be freed right after extraction.
+    """
+
+    tournament_link: str
+    place: Optional[int]
+    name: str
+    record: str
+    deck: Optional[str] = None
+    points: Optional[str] = None
+    decklist_link: Optional[str] = None
+    matches: Optional[str] = None
 
 
 class Tournament(BaseModel):
-    data_date: Annotated[Optional[str], Field(alias="data-date")] = None
+    data_date: Annotated[DateValidator, Field(alias="data-date")] = None
     data_time: Annotated[Optional[str], Field(alias="data-time")] = None
     data_name: Annotated[Optional[str], Field(alias="data-name")] = None
     data_organizer: Annotated[Optional[str], Field(alias="data-organizer")] = None
     data_format: Annotated[Optional[str], Field(alias="data-format")] = None
-    data_players: Annotated[Optional[str], Field(alias="data-players")] = None
+    data_players: Annotated[IntValidator, Field(alias="data-players")] = None
     data_winner: Annotated[Optional[str], Field(alias="data-winner")] = None
     tournament_page: Optional[str] = None
 
     @computed_field
     @property
-    def date(self) -> Optional[str]:
+    def date(self) -> Optional[date]:
         return self.data_date
 
 
-class Card(BaseModel):
-    name: str
-    code: Optional[str]
-    quantity: int
-    kind: str
+@dataclass(slots=True)
+class DecklistColumns:
+    """Cards of one decklist as parallel columns, built in one pass without per-card objects."""
+
+    name: list[str] = field(default_factory=list)
+    code: list[Optional[str]] = field(default_factory=list)
+    quantity: list[int] = field(default_factory=list)
+    kind: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def quantities(self) -> dict[tuple[str, str, Optional[str]], int]:
+        """Quantity of each distinct (kind, name, code) card, summed over the lines listing it."""
+        quantities: dict[tuple[str, str, Optional[str]], int] = {}
+        for name, code, quantity, kind in zip(
+            self.name, self.code, self.quantity, self.kind
+        ):
+            card = (kind, name, code)
+            quantities[card] = quantities.get(card, 0) + quantity
+        return quantities
 
 
-class Deck(BaseModel):
+@dataclass(slots=True)
+class Deck:
     player: str
     tournament: str
-    decklist: list[Card]
+    decklist: DecklistColumns
     decklist_link: Optional[str]
 
 
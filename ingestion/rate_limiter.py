@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Optional
+
+from .constants import (
+    CRAWL_MAX_IN_FLIGHT,
+    RATE_LIMIT_DECREASE_COOLDOWN_SECONDS,
+    RATE_LIMIT_DECREASE_FACTOR,
+    RATE_LIMIT_INITIAL_IN_FLIGHT,
+    RATE_LIMIT_INITIAL_RATE,
+    RATE_LIMIT_LATENCY_TOLERANCE,
+    RATE_LIMIT_MAX_RATE,
+    RATE_LIMIT_MIN_RATE,
+)
+
+# Weight of a new sample in the latency baseline, and samples needed before it is trusted
+_LATENCY_EWMA_ALPHA = 0.05
+_LATENCY_WARMUP_SAMPLES = 20
+
+
+class AdaptiveRateLimiter:
+    """
+    Request rate and concurrency shared by every worker thread.
+    A token bucket paces requests at `rate` per second and at most `in_flight_limit` run at once.
+    Both double every round of clean responses until the first congestion signal (slow start),
+    then grow additively. They are cut multiplicatively on 429/5xx or when latency rises above
+    RATE_LIMIT_LATENCY_TOLERANCE times its baseline.
+    A Retry-After header pauses every worker until it expires.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = RATE_LIMIT_INITIAL_RATE,
+        min_rate: float = RATE_LIMIT_MIN_RATE,
+        max_rate: float = RATE_LIMIT_MAX_RATE,
+        initial_in_flight: int = RATE_LIMIT_INITIAL_IN_FLIGHT,
+        max_in_flight: int = CRAWL_MAX_IN_FLIGHT,
+    ):
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError("rate limits must satisfy 0 < min <= initial <= max")
+        if not 1 <= initial_in_flight <= max_in_flight:
+            raise ValueError("in-flight limits must satisfy 1 <= initial <= max")
+
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.in_flight_limit = float(initial_in_flight)
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+        self._condition = threading.Condition()
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._slow_start = True
+        self._latency_baseline: Optional[float] = None
+        self._latency_samples = 0
+        self._requests = 0
+        self._throttled = 0
+
+    def _refill(self, now: float) -> None:
+        capacity = max(1.0, self.rate)
+        self._tokens = min(
+            capacity, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+
+    def _wait_time(self, now: float) -> float:
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.in_flight >= int(self.in_flight_limit):
+            # Woken by release(); the timeout only guards against a lost notification
+            return 1.0
+        if self._tokens < 1.0:
+            return (1.0 - self._tokens) / self.rate
+        return 0.0
+
+    def acquire(self) -> None:
+        """Blocks until a request may start."""
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now)
+                if wait <= 0:
+                    break
+                self._condition.wait(wait)
+
+            self._tokens -= 1.0
+            self.in_flight += 1
+            self._requests += 1
+
+    def release(
+        self,
+        latency: float,
+        throttled: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Reports the outcome of a request started with `acquire` and adapts rate and concurrency."""
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+            if throttled:
+                self._throttled += 1
+                self._decrease(now)
+            elif self._is_slow(latency):
+                self._decrease(now)
+            elif self._slow_start:
+                self.rate = min(self.max_rate, self.rate + 1.0)
+                self.in_flight_limit = min(
+                    float(self.max_in_flight), self.in_flight_limit + 1.0
+                )
+            else:
+                # Roughly +1 request/s per second and +1 in-flight slot per round of responses
+                self.rate = min(self.max_rate, self.rate + 1.0 / self.rate)
+                self.in_flight_limit = min(
+                    float(self.max_in_flight),
+                    self.in_flight_limit + 1.0 / self.in_flight_limit,
+                )
+
+            self._condition.notify_all()
+
+    def _is_slow(self, latency: float) -> bool:
+        baseline = self._latency_baseline
+        self._latency_samples += 1
+        if baseline is None:
+            self._latency_baseline = latency
+            return False
+
+        # The baseline keeps adapting, so a lasting shift in latency stops counting as congestion
+        self._latency_baseline = baseline + _LATENCY_EWMA_ALPHA * (latency - baseline)
+        return (
+            self._latency_samples > _LATENCY_WARMUP_SAMPLES
+            and latency > baseline * RATE_LIMIT_LATENCY_TOLERANCE
+        )
+
+    def _decrease(self, now: float) -> None:
+        # Responses to requests sent before the last cut carry no new information
+        if now - self._last_decrease < RATE_LIMIT_DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self._slow_start = False
+        self.rate = max(self.min_rate, self.rate * RATE_LIMIT_DECREASE_FACTOR)
+        self.in_flight_limit = max(
+            1.0, self.in_flight_limit * RATE_LIMIT_DECREASE_FACTOR
+        )
+        self._tokens = min(self._tokens, 1.0)
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "rate": round(self.rate, 2),
+                "in_flight": self.in_flight,
+                "in_flight_limit": int(self.in_flight_limit),
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "latency_baseline": round(self._latency_baseline or 0.0, 3),
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 1),
+            }
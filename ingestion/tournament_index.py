@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import dlt
+from dlt.destinations.exceptions import DatabaseUndefinedRelation
+
+from .constants import (
+    PARTICIPANT_DECK_TABLE,
+    PARTICIPANT_MATCHES_TABLE,
+    TOURNAMENT_PARTICIPANTS_TABLE,
+    TOURNAMENTS_PRIMARY_KEY,
+    TOURNAMENTS_TABLE,
+)
+from .models import Tournament
+
+
+@dataclass(slots=True)
+class KnownTournament:
+    players: Optional[int]
+    participants: int
+    # Participants whose decklist or match history link has no loaded rows, e.g. after a failed fetch
+    incomplete: int = 0
+
+
+class TournamentIndex:
+    """
+    Tournaments already loaded into the destination, keyed on TOURNAMENTS_PRIMARY_KEY.
+    Incremental runs use it to fetch only tournaments that are new, whose player count changed,
+    or whose deck or match rows are incomplete.
+    """
+
+    def __init__(self, known: Optional[dict[str, KnownTournament]] = None):
+        self.known = known or {}
+
+    @classmethod
+    def load(cls, pipeline: dlt.Pipeline) -> TournamentIndex:
+        with pipeline.sql_client() as client:
+            if not client.has_dataset():
+                return cls()
+
+            tournaments = client.make_qualified_table_name(TOURNAMENTS_TABLE)
+            participants = client.make_qualified_table_name(
+                TOURNAMENT_PARTICIPANTS_TABLE
+            )
+            decks = client.make_qualified_table_name(PARTICIPANT_DECK_TABLE)
+            matches = client.make_qualified_table_name(PARTICIPANT_MATCHES_TABLE)
+            try:
+                rows = client.execute_sql(
+                    f"""
+                    select
+                        t.{TOURNAMENTS_PRIMARY_KEY},
+                        any_value(t.data_players),
+                        count(p.tournament_link),
+                        count(*) filter (
+                            where (p.decklist_link is not null and d.player is null)
+                                or (p.matches is not null and m.p1 is null)
+                        )
+                    from {tournaments} as t
+                    left join {participants} as p
+                        on t.{TOURNAMENTS_PRIMARY_KEY} = p.tournament_link
+                    left join {decks} as d
+                        on p.tournament_link = d.tournament and p.name = d.player
+                    -- Match rows are keyed on the participant as p1
+                    left join (select distinct tournament, p1 from {matches}) as m
+                        on p.tournament_link = m.tournament and p.name = m.p1
+                    group by 1
+                    """
+                )
+            except DatabaseUndefinedRelation:
+                return cls()
+
+        return cls(
+            {
+                page: KnownTournament(
+                    players=int(players) if players is not None else None,
+                    participants=count,
+                    incomplete=incomplete,
+                )
+                for page, players, count, incomplete in rows
+            }
+        )
+
+    def __len__(self) -> int:
+        return len(self.known)
+
+    def is_unchanged(self, tournament: Tournament) -> bool:
+        """
+        True when the tournament was loaded with participants, each with the deck and match rows of
+        their links, and its player count still matches.
+        """
+        known = self.known.get(tournament.tournament_page or "")
+        if known is None or known.participants == 0 or known.incomplete:
+            return False
+        return known.players == tournament.data_players
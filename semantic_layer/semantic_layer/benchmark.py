@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark of the semantic models, on the data the server reads: the dbt DuckDB file, the one at
+POKEMON_TCG_DATABASE_PATH (e.g. a dbt build of `transformations.benchmark generate --scale 100`), or the
+Parquet lake at POKEMON_TCG_LAKE_PATH.
+WORKLOAD extends the queries of test_queries.py to every model of boring.yml. At each concurrency level, with
+and without the query cache, a fresh process builds the models as the MCP server does, runs every query
+once cold and then `--passes` times warm, and reports latency percentiles, Ibis compile and DuckDB execution
+time, and its peak RSS. Rows scanned per query are read from DuckDB's query profile.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+BASELINE_PATH: Path = Path(__file__).with_name("benchmark_baseline.json")
+CONCURRENCY_LEVELS: List[int] = [1, 4, 16]
+WARM_PASSES: int = 5
+
+UNCACHED = "uncached"
+CACHED = "cached"
+MODES = (UNCACHED, CACHED)
+
+
+def _equals(field: str, value: Any) -> Dict[str, Any]:
+    return {"field": field, "operator": "=", "value": value}
+
+
+# Queries as an MCP client sends them, with JSON filters so that the query cache can answer them
+WORKLOAD: List[Dict[str, Any]] = [
+    {
+        "name": "charizard_win_rate",
+        "model": "archetype_stats",
+        "query": {
+            "dimensions": ["archetype"],
+            "measures": ["win_rate"],
+            "filters": [_equals("archetype", "Charizard")],
+        },
+    },
+    {
+        "name": "top_archetypes_by_set",
+        "model": "archetype_stats",
+        "query": {
+            "dimensions": ["set_name", "archetype"],
+            "measures": ["total_matches", "win_rate"],
+            "order_by": [("total_matches", "desc")],
+            "limit": 20,
+        },
+    },
+    {
+        "name": "sub_archetypes_of_dragapult",
+        "model": "archetype_stats",
+        "query": {
+            "dimensions": ["set_name", "sub_archetype"],
+            "measures": ["total_matches", "win_rate"],
+            "filters": [_equals("archetype", "Dragapult")],
+        },
+    },
+    {
+        "name": "monthly_meta_share",
+        "model": "monthly_meta_shifts",
+        "query": {
+            "dimensions": ["tournament_month", "archetype"],
+            "measures": ["avg_meta_share", "avg_win_rate"],
+            "order_by": [("tournament_month", "desc")],
+            "limit": 50,
+        },
+    },
+    {
+        "name": "performance_against_gholdengo",
+        "model": "archetype_matchups",
+        "query": {
+            "dimensions": ["p1_archetype"],
+            "measures": ["win_no_ties_rate"],
+            "filters": [_equals("p2_archetype", "Gholdengo")],
+            "order_by": [("win_no_ties_rate", "desc")],
+            "limit": 5,
+        },
+    },
+    {
+        "name": "dragapult_matchups_by_set",
+        "model": "archetype_matchups",
+        "query": {
+            "dimensions": ["set_name", "p2_archetype"],
+            "measures": ["total_matches", "win_ties_rate"],
+            "filters": [_equals("p1_archetype", "Dragapult")],
+        },
+    },
+    {
+        "name": "sub_archetype_matchups",
+        "model": "archetype_matchups",
+        "query": {
+            "dimensions": ["p1_sub_archetype", "p2_sub_archetype"],
+            "measures": ["total_matches", "win_no_ties_rate"],
+            "order_by": [("total_matches", "desc")],
+            "limit": 20,
+        },
+    },
+    {
+        "name": "most_used_cards",
+        "model": "cards_used",
+        "query": {
+            "dimensions": ["card_name", "card_kind"],
+            "measures": ["total_used", "decks_containing"],
+            "order_by": [("decks_containing", "desc")],
+            "limit": 20,
+        },
+    },
+    {
+        "name": "dragapult_staples",
+        "model": "card_staples",
+        "query": {
+            "dimensions": ["card_name"],
+            "measures": ["avg_inclusion_rate"],
+            "filters": [_equals("archetype", "Dragapult")],
+            "order_by": [("avg_inclusion_rate", "desc")],
+            "limit": 10,
+        },
+    },
+    {
+        "name": "tech_cards_against_gholdengo",
+        "model": "matchup_suggestions",
+        "query": {
+            "dimensions": ["archetype", "suggested_card"],
+            "measures": ["avg_relevance_score", "sample_size"],
+            "filters": [_equals("opponent_archetype", "Gholdengo")],
+            "order_by": [("avg_relevance_score", "desc")],
+            "limit": 10,
+        },
+    },
+    {
+        "name": "tournaments_by_set",
+        "model": "tournament_analysis",
+        "query": {
+            "dimensions": ["set_name"],
+            "measures": ["player_count", "total_matches"],
+        },
+    },
+    {
+        "name": "top_players",
+        "model": "deck_analysis",
+        "query": {
+            "dimensions": ["player_name"],
+            "measures": ["total_wins", "avg_win_rate"],
+            "order_by": [("total_wins", "desc")],
+            "limit": 25,
+        },
+    },
+    {
+        "name": "trainer_cards",
+        "model": "cards",
+        "query": {
+            "dimensions": ["card_name", "card_code"],
+            "filters": [_equals("card_kind", "trainer")],
+            "limit": 100,
+        },
+    },
+    {
+        "name": "matches_by_result",
+        "model": "matches",
+        "query": {"dimensions": ["result"], "measures": ["match_count"]},
+    },
+    {
+        "name": "largest_tournaments_by_matches",
+        "model": "matches",
+        "query": {
+            "dimensions": ["tournament_id"],
+            "measures": ["match_count"],
+            "order_by": [("match_count", "desc")],
+            "limit": 10,
+        },
+    },
+]
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of `values`."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize(seconds: List[float]) -> Dict[str, float]:
+    """Latency percentiles in milliseconds."""
+    return {
+        f"p{percent}_ms": round(percentile(seconds, percent) * 1000, 2) for percent in (50, 95, 99)
+    }
+
+
+def data_source() -> str:
+    from tables import LAKE_PATH_ENV, database_path
+
+    lake_path = os.environ.get(LAKE_PATH_ENV)
+    return f"lake {lake_path}" if lake_path else f"database {database_path()}"
+
+
+def run_level(mode: str, concurrency: int, passes: int) -> Dict[str, Any]:
+    """
+    Builds the models as the MCP server does, then runs WORKLOAD once cold and `passes` times warm on
+    `concurrency` threads. Meant to run in a fresh process, so that the cold pass finds nothing cached
+    and peak RSS covers this run only.
+    """
+    from cache import QueryCache
+    from semantic_models import build_models
+    from tables import data_version, load_tables
+
+    started = time.perf_counter()
+    tables = load_tables()
+    query_cache = QueryCache(data_version) if mode == CACHED else None
+    models = build_models(query_cache, tables)
+    build_seconds = time.perf_counter() - started
+
+    def timed(spec: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        query = models[spec["model"]].query(**spec["query"])
+        if query_cache is not None:
+            query.execute()
+            return {"name": spec["name"], "seconds": time.perf_counter() - started}
+        # The steps of PooledQuery.execute, timed apart
+        sql = query.sql()
+        compiled = time.perf_counter()
+        tables.pool().execute(sql)
+        finished = time.perf_counter()
+        return {
+            "name": spec["name"],
+            "seconds": finished - started,
+            "compile_seconds": compiled - started,
+            "execute_seconds": finished - compiled,
+        }
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        cold = list(executor.map(timed, WORKLOAD))
+        started = time.perf_counter()
+        warm = list(executor.map(timed, WORKLOAD * passes))
+        warm_seconds = time.perf_counter() - started
+
+    queries: Dict[str, Dict[str, Any]] = {}
+    for spec, cold_timing in zip(WORKLOAD, cold):
+        timings = [timing for timing in warm if timing["name"] == spec["name"]]
+        metrics: Dict[str, Any] = {
+            "cold_ms": round(cold_timing["seconds"] * 1000, 2),
+            **summarize([timing["seconds"] for timing in timings]),
+        }
+        if query_cache is None:
+            for step in ("compile", "execute"):
+                metrics[f"{step}_p50_ms"] = summarize(
+                    [timing[f"{step}_seconds"] for timing in timings]
+                )["p50_ms"]
+        queries[spec["name"]] = metrics
+
+    result: Dict[str, Any] = {
+        "build_seconds": round(build_seconds, 3),
+        "cold": summarize([timing["seconds"] for timing in cold]),
+        "warm": summarize([timing["seconds"] for timing in warm]),
+        "queries_per_second": round(len(warm) / warm_seconds, 1),
+        "peak_rss_mib": round(peak_rss_mib(), 1),
+        "queries": queries,
+    }
+    if query_cache is not None:
+        result["cache_hits"] = query_cache.hits
+        result["cache_misses"] = query_cache.misses
+    return result
+
+
+def _profile_nodes(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+    nodes = [node]
+    for child in node.get("children", []):
+        nodes.extend(_profile_nodes(child))
+    return nodes
+
+
+def rows_scanned(profile: Dict[str, Any]) -> int:
+    """
+    Rows read by the scans of a DuckDB JSON query profile. Versions that do not report rows scanned
+    per operator count the rows the scans emit, after the filters pushed into them.
+    """
+    total = 0
+    for node in _profile_nodes(profile):
+        name = str(node.get("operator_type") or node.get("name") or "")
+        if "SCAN" not in name and "READ_" not in name:
+            continue
+        scanned = node.get("operator_rows_scanned")
+        if scanned is None:
+            scanned = node.get("operator_cardinality", node.get("cardinality", 0))
+        total += int(scanned)
+    return total
+
+
+def profile_queries() -> Dict[str, Dict[str, int]]:
+    """Rows scanned and rows returned by every query of WORKLOAD, from one profiled run of each."""
+    from semantic_models import build_models
+    from tables import load_tables
+
+    tables = load_tables()
+    models = build_models(None, tables)
+    cursor = tables.connection().con.cursor()
+    profiles: Dict[str, Dict[str, int]] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        output = Path(workdir) / "profile.json"
+        cursor.execute("pragma enable_profiling = 'json'")
+        cursor.execute(f"pragma profiling_output = '{output}'")
+        for spec in WORKLOAD:
+            sql = models[spec["model"]].query(**spec["query"]).sql()
+            rows = cursor.execute(sql).fetchall()
+            profiles[spec["name"]] = {
+                "rows_scanned": rows_scanned(json.loads(output.read_text())),
+                "rows_returned": len(rows),
+            }
+    return profiles
+
+
+def _delta(value: Any, baseline: Any) -> str:
+    if not isinstance(value, (int, float)) or not isinstance(baseline, (int, float)):
+        return ""
+    if not baseline:
+        return f" (baseline {baseline})"
+    return f" (baseline {baseline}, {(value - baseline) / baseline:+.1%})"
+
+
+def report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    baseline = baseline or {}
+    for field in ("data", "config"):
+        if baseline and baseline.get(field) != results[field]:
+            print(f"Baseline was recorded with a different {field}:")
+            print(f"  baseline: {baseline.get(field)}")
+            print(f"  current:  {results[field]}")
+
+    print(f"Data: {results['data']}")
+    print("Rows scanned / returned:")
+    for name, profile in results["profiles"].items():
+        reference = baseline.get("profiles", {}).get(name, {})
+        scanned = profile["rows_scanned"]
+        print(
+            f"  {name:<32} {scanned:>12}{_delta(scanned, reference.get('rows_scanned'))}"
+            f" / {profile['rows_returned']}"
+        )
+
+    for run, metrics in results["runs"].items():
+        reference = baseline.get("runs", {}).get(run, {})
+        print(f"{run}:")
+        for name in ("build_seconds", "queries_per_second", "peak_rss_mib"):
+            print(f"  {name:<32} {metrics[name]:>12}{_delta(metrics[name], reference.get(name))}")
+        for phase in ("cold", "warm"):
+            for name, value in metrics[phase].items():
+                label = f"{phase}_{name}"
+                print(f"  {label:<32} {value:>12}{_delta(value, reference.get(phase, {}).get(name))}")
+        if "cache_hits" in metrics:
+            print(f"  {'cache hits / misses':<32} {metrics['cache_hits']:>12} / {metrics['cache_misses']}")
+        for name, query in metrics["queries"].items():
+            query_reference = reference.get("queries", {}).get(name, {})
+            steps = ""
+            if "compile_p50_ms" in query:
+                steps = f"  compile {query['compile_p50_ms']} ms, execute {query['execute_p50_ms']} ms"
+            print(
+                f"  {name:<32} cold {query['cold_ms']} ms, p50 {query['p50_ms']} ms"
+                f"{_delta(query['p50_ms'], query_reference.get('p50_ms'))}, p95 {query['p95_ms']} ms,"
+                f" p99 {query['p99_ms']} ms{steps}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=CONCURRENCY_LEVELS)
+    parser.add_argument("--mode", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--passes", type=int, default=WARM_PASSES, help="Warm runs of every query.")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run instead of comparing against it.",
+    )
+    parser.add_argument("--output", help="Also write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "data": data_source(),
+        "config": {"passes": args.passes, "queries": [spec["name"] for spec in WORKLOAD]},
+        "profiles": {},
+        "runs": {},
+    }
+    # One fresh process per run keeps cold timings cold and peak RSS figures independent
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        print("Profiling queries...", flush=True)
+        results["profiles"] = executor.submit(profile_queries).result()
+    for mode in args.mode:
+        for concurrency in args.concurrency:
+            print(f"Running {mode} queries on {concurrency} threads...", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                results["runs"][f"{mode}_{concurrency}"] = executor.submit(
+                    run_level, mode, concurrency, args.passes
+                ).result()
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists() and not args.save_baseline:
+        baseline = json.loads(baseline_path.read_text())
+    report(results, baseline)
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {baseline_path}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
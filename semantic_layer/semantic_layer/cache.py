@@ -0,0 +1,146 @@
+"""
+LRU cache of semantic query results for the MCP server.
+Results are keyed on the model and the normalised query, and dropped whenever `data_version` changes,
+i.e. when a dlt load or a dbt run rewrites the data the tables are read from.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+CACHE_MAX_ENTRIES: int = 256
+CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+# How often the data version is checked; results may be this many seconds stale after a run
+CACHE_VERSION_CHECK_SECONDS: float = 1.0
+
+
+def result_size(result: Any) -> int:
+    memory_usage = getattr(result, "memory_usage", None)
+    if memory_usage is None:
+        return 0
+    return int(memory_usage(deep=True).sum())
+
+
+class QueryCache:
+    """Thread-safe LRU of query results, bounded by entry count and by DataFrame memory."""
+
+    def __init__(
+        self,
+        data_version: Callable[[], Hashable],
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        self._data_version = data_version
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._version: Optional[Hashable] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _check_version(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < CACHE_VERSION_CHECK_SECONDS:
+            return
+        self._checked_at = now
+        version = self._data_version()
+        if version != self._version:
+            self._version = version
+            self._entries.clear()
+            self._bytes = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        size = result_size(result)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                self._bytes -= self._entries.popitem(last=False)[1][1]
+
+
+def query_key(model_name: str, **query: Any) -> Optional[str]:
+    """Normalised query, or None when it has filters that are Python callables and cannot be compared."""
+    filters = query.get("filters")
+    filter_list: List[Any] = filters if isinstance(filters, list) else [] if filters is None else [filters]
+    if any(callable(query_filter) for query_filter in filter_list):
+        return None
+    query["filters"] = filter_list
+    return json.dumps([model_name, query], sort_keys=True, default=str)
+
+
+class CachedQuery:
+    """
+    Query expression whose `execute()` is answered from the cache when the same query ran before.
+    The semantic query is only built on a cache miss, or when anything else than `execute()` is asked of it.
+    """
+
+    def __init__(self, build: Callable[[], Any], cache: QueryCache, key: str) -> None:
+        self._build = build
+        self._query: Optional[Any] = None
+        self._cache = cache
+        self._key = key
+
+    def _expression(self) -> Any:
+        if self._query is None:
+            self._query = self._build()
+        return self._query
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._expression(), name)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        if args or kwargs:
+            return self._expression().execute(*args, **kwargs)
+        result = self._cache.get(self._key)
+        if result is None:
+            result = self._expression().execute()
+            self._cache.put(self._key, result)
+        # Callers get their own copy, so that they cannot change the cached result
+        return result.copy() if hasattr(result, "copy") else result
+
+    def chart(self, spec: Optional[Dict[str, Any]] = None, backend: str = "echarts", format: str = "static") -> Any:
+        """BSL's chart of the query, drawn from the cached result. Only its metadata is read from the expression."""
+        from boring_semantic_layer.chart import chart
+
+        return chart(self, spec=spec, backend=backend, format=format)
+
+
+class CachedModel:
+    """Semantic model whose query results are kept in a QueryCache."""
+
+    def __init__(self, model: Any, name: str, cache: QueryCache) -> None:
+        self._model = model
+        self._name = name
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    def query(self, *args: Any, **query: Any) -> Any:
+        key = None if args else query_key(self._name, **query)
+        if key is None:
+            return self._model.query(*args, **query)
+        return CachedQuery(lambda: self._model.query(**query), self._cache, key)
+
+
+def cache_models(models: Dict[str, Any], cache: QueryCache) -> Dict[str, Any]:
+    return {name: CachedModel(model, name, cache) for name, model in models.items()}
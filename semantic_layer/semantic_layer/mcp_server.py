@@ -3,33 +3,18 @@
 MCP Server for the Pokemon TCG Data Lake Semantic Layer.
 Exposes semantic models for archetypes, cards, and matches via Model Context Protocol.
 """
-import ibis
-from pathlib import Path
-from typing import Dict, Any
-from boring_semantic_layer import MCPSemanticModel, from_yaml
+from typing import Any, Mapping
+from boring_semantic_layer import MCPSemanticModel
+from cache import QueryCache
+from semantic_models import load_models
+from tables import data_version
 
-# Define paths
-base_dir: Path = Path(__file__).parent
-yaml_path: Path = base_dir / "boring.yml"
+# Repeated queries are answered from memory until a dlt load or dbt run changes the data
+query_cache: QueryCache = QueryCache(data_version)
 
-# Pre-load tables from specific DuckDB schemas
-# Boring Semantic Layer uses Ibis under the hood
-con: Any = ibis.duckdb.connect(str(base_dir.parent.parent / "pokemon_tcg_pipeline.duckdb"))
-tables: Dict[str, Any] = {
-    "mart_archetype_stats": con.table("mart_archetype_stats", database="main_consumption"),
-    "mart_monthly_meta_shifts": con.table("mart_monthly_meta_shifts", database="main_consumption"),
-    "mart_archetype_matchups": con.table("mart_archetype_matchups", database="main_consumption"),
-    "mart_cards_used": con.table("mart_cards_used", database="main_consumption"),
-    "mart_archetype_card_staples": con.table("mart_archetype_card_staples", database="main_consumption"),
-    "mart_archetype_matchup_suggestions": con.table("mart_archetype_matchup_suggestions", database="main_consumption"),
-    "mart_tournament_analysis": con.table("mart_tournament_analysis", database="main_consumption"),
-    "mart_deck_analysis": con.table("mart_deck_analysis", database="main_consumption"),
-    "dim_cards": con.table("dim_cards", database="main_semantic"),
-    "fct_matches": con.table("fct_matches", database="main_semantic"),
-}
-
-# Load semantic models from boring.yml
-models: Dict[str, Any] = from_yaml(str(yaml_path), tables=tables)
+# Semantic models from boring.yml, on the DuckDB file or the Parquet lake when POKEMON_TCG_LAKE_PATH is set.
+# They are built on the first tool call, so the MCP handshake does not wait on the database.
+models: Mapping[str, Any] = load_models(query_cache)
 
 # Create and configure MCP server
 server: MCPSemanticModel = MCPSemanticModel(
@@ -0,0 +1,96 @@
+"""
+Pool of DuckDB cursors the semantic queries run on.
+Cursors are separate connections to the one read-only database the tables are bound to, so queries from
+different threads run side by side instead of queueing on the Ibis connection, and each query is interrupted
+once it runs for longer than the timeout.
+"""
+import os
+import queue
+import threading
+from typing import Any, Dict, Mapping, Optional
+
+QUERY_POOL_SIZE: int = 4
+# Worker threads and memory are shared by all cursors of the database
+QUERY_THREADS: int = os.cpu_count() or 1
+QUERY_MEMORY_LIMIT: str = "2GB"
+QUERY_TIMEOUT_SECONDS: float = 30.0
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        connection: Any,
+        size: int = QUERY_POOL_SIZE,
+        timeout: float = QUERY_TIMEOUT_SECONDS,
+    ) -> None:
+        connection.execute(f"set threads = {QUERY_THREADS}")
+        connection.execute(f"set memory_limit = '{QUERY_MEMORY_LIMIT}'")
+        self._timeout = timeout
+        self._idle: "queue.Queue[Any]" = queue.Queue()
+        for _ in range(size):
+            self._idle.put(connection.cursor())
+
+    def execute(self, sql: str) -> Any:
+        """Runs `sql` on an idle cursor and returns its result as a DataFrame."""
+        import duckdb
+
+        try:
+            cursor = self._idle.get(timeout=self._timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No idle connection after {self._timeout}s") from None
+
+        timer = threading.Timer(self._timeout, cursor.interrupt)
+        timer.start()
+        try:
+            return cursor.execute(sql).df()
+        except duckdb.InterruptException:
+            raise TimeoutError(f"Query cancelled after running for {self._timeout}s") from None
+        finally:
+            timer.cancel()
+            self._idle.put(cursor)
+
+
+class PooledQuery:
+    """Query expression whose `execute()` runs its SQL on the pool instead of the Ibis connection."""
+
+    def __init__(self, query: Any, pool: ConnectionPool) -> None:
+        self._query = query
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._query, name)
+
+    def sql(self) -> str:
+        """The DuckDB SQL the semantic query compiles to."""
+        import ibis
+
+        return str(ibis.to_sql(self._query.to_untagged(), dialect="duckdb"))
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        if args or kwargs or not hasattr(self._query, "to_untagged"):
+            return self._query.execute(*args, **kwargs)
+        return self._pool.execute(self.sql())
+
+    def chart(self, spec: Optional[Dict[str, Any]] = None, backend: str = "echarts", format: str = "static") -> Any:
+        """BSL's chart of the query, drawn from the result of `execute()` rather than another run of the query."""
+        from boring_semantic_layer.chart import chart
+
+        return chart(self, spec=spec, backend=backend, format=format)
+
+
+class PooledModel:
+    """Semantic model whose queries execute on a ConnectionPool."""
+
+    def __init__(self, model: Any, pool: ConnectionPool) -> None:
+        self._model = model
+        self._pool = pool
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    def query(self, *args: Any, **kwargs: Any) -> Any:
+        return PooledQuery(self._model.query(*args, **kwargs), self._pool)
+
+
+def pool_models(models: Mapping[str, Any], pool: ConnectionPool) -> Dict[str, Any]:
+    return {name: PooledModel(model, pool) for name, model in models.items()}
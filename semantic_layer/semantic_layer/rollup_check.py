@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Runs every rollup grain of rollups.ROLLUPS, unfiltered and with a filter, through the routed model and
+the model on the finest-grain mart, and fails when a query is not routed or the two results differ.
+"""
+import sys
+from typing import Any, Dict, List, Optional
+
+from boring_semantic_layer import from_yaml
+from pandas.testing import assert_frame_equal
+
+from rollups import ROLLUPS, RoutedModel, route_models
+from semantic_models import YAML_PATH, model_definitions
+from tables import load_tables
+
+
+def check(name: str, routed: RoutedModel, base: Any, dimensions: List[str], filters: List[Any]) -> Optional[str]:
+    if routed.route(dimensions, filters) is base:
+        return "not routed"
+    measures = list(model_definitions()[name]["measures"])
+    expected = base.query(dimensions=dimensions, measures=measures, filters=filters).execute()
+    actual = routed.query(dimensions=dimensions, measures=measures, filters=filters).execute()
+    expected = expected.sort_values(dimensions).reset_index(drop=True)
+    actual = actual.sort_values(dimensions).reset_index(drop=True)[expected.columns]
+    if expected.empty:
+        return "no rows to compare"
+    try:
+        assert_frame_equal(expected, actual, check_dtype=False)
+    except AssertionError as exc:
+        return f"results differ: {exc}"
+    return None
+
+
+def main() -> None:
+    tables = load_tables()
+    base_models = from_yaml(str(YAML_PATH), tables=tables)
+    routed_models: Dict[str, Any] = route_models(base_models, tables, model_definitions())
+
+    failures = 0
+    for name, (_, _, grains) in ROLLUPS.items():
+        base, routed = base_models[name], routed_models[name]
+        for grain in grains:
+            dimensions = grain.split(",")
+            # The first value of the grain's leading column, so that the filter keeps some rows
+            column = dimensions[0]
+            value = tables[ROLLUPS[name][0]][column].min().execute()
+            for filters in ([], [{"field": column, "operator": "=", "value": value}]):
+                error = check(name, routed, base, dimensions, filters)
+                label = f"{name} by {grain}" + (f" where {column} = {value!r}" if filters else "")
+                print(f"{label}: {error or 'ok'}")
+                failures += error is not None
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
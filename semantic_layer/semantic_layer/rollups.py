@@ -0,0 +1,133 @@
+"""
+Routes semantic model queries to the pre-aggregated `*_rollup` marts.
+A query whose dimensions and filters only use the columns of a rollup grain reads the rows of that grain
+instead of aggregating the finest-grain mart, so coarse queries become lookups of a few rows.
+"""
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+# Semantic model -> (table it is defined on, rollup table, grains of the rollup from the smallest up).
+# Grains are the comma-separated `grain` values of the rollup marts; dimensions share their column names.
+ROLLUPS: Dict[str, Tuple[str, str, List[str]]] = {
+    "archetype_stats": (
+        "mart_archetype_stats",
+        "mart_archetype_stats_rollup",
+        ["archetype", "archetype,sub_archetype", "set_name,archetype"],
+    ),
+    "archetype_matchups": (
+        "mart_archetype_matchups",
+        "mart_archetype_matchups_rollup",
+        [
+            "p1_archetype",
+            "p1_archetype,p2_archetype",
+            "set_name,p1_archetype",
+            "p1_archetype,p1_sub_archetype,p2_archetype",
+            "p1_archetype,p2_archetype,p2_sub_archetype",
+            "set_name,p1_archetype,p2_archetype",
+        ],
+    ),
+}
+
+
+def filter_columns(filters: List[Any], table: Any) -> Optional[Set[str]]:
+    """Columns used by query filters, or None when they cannot be told apart."""
+    import ibis.expr.operations as ops
+
+    columns: Set[str] = set()
+    for query_filter in filters:
+        if callable(query_filter):
+            try:
+                expr = query_filter(table)
+            except Exception:
+                return None
+            columns.update(field.name for field in expr.op().find(ops.Field))
+        elif isinstance(query_filter, dict):
+            if "conditions" in query_filter:
+                nested = filter_columns(query_filter["conditions"], table)
+                if nested is None:
+                    return None
+                columns.update(nested)
+            elif "field" in query_filter:
+                columns.add(query_filter["field"])
+            else:
+                return None
+        else:
+            return None
+    return columns
+
+
+class RoutedModel:
+    """
+    Semantic model that answers queries from the smallest rollup grain covering them.
+    The model of a grain is built the first time a query is routed to it.
+    """
+
+    def __init__(
+        self, model: Any, grains: List[str], build_grain_model: Callable[[str], Any], table: Any
+    ) -> None:
+        self._model = model
+        self._grains = grains
+        self._build_grain_model = build_grain_model
+        self._grain_models: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._table = table
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    def grain_model(self, grain: str) -> Any:
+        with self._lock:
+            if grain not in self._grain_models:
+                self._grain_models[grain] = self._build_grain_model(grain)
+            return self._grain_models[grain]
+
+    def route(self, dimensions: List[str], filters: List[Any]) -> Any:
+        columns = filter_columns(filters, self._table)
+        if columns is None:
+            return self._model
+        columns.update(dimensions)
+        for grain in self._grains:
+            if columns <= set(grain.split(",")):
+                return self.grain_model(grain)
+        return self._model
+
+    def query(
+        self,
+        dimensions: Optional[List[str]] = None,
+        measures: Optional[List[str]] = None,
+        filters: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if filters is None:
+            filter_list: List[Any] = []
+        elif isinstance(filters, list):
+            filter_list = filters
+        else:
+            filter_list = [filters]
+        model = self.route(dimensions or [], filter_list)
+        return model.query(dimensions=dimensions, measures=measures, filters=filters, **kwargs)
+
+
+def build_grain_model(
+    definitions: Mapping[str, Any], tables: Mapping[str, Any], model_name: str, table_name: str, rollup_name: str,
+    grain: str,
+) -> Any:
+    """The definition of `model_name` in boring.yml, on the rows of a single grain of its rollup."""
+    from boring_semantic_layer import from_config
+
+    rollup = tables[rollup_name]
+    # Without `database`, which would make BSL reload the table by name, dropping the grain filter
+    definition = {key: value for key, value in definitions[model_name].items() if key != "database"}
+    return from_config({model_name: definition}, tables={table_name: rollup.filter(rollup.grain == grain)})[model_name]
+
+
+def route_models(
+    models: Dict[str, Any], tables: Mapping[str, Any], definitions: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Wraps the models of ROLLUPS so that their queries read the rollup marts where they can."""
+    routed = dict(models)
+    for model_name, (table_name, rollup_name, grains) in ROLLUPS.items():
+        build = partial(build_grain_model, definitions, tables, model_name, table_name, rollup_name)
+        routed[model_name] = RoutedModel(models[model_name], grains, build, tables[table_name])
+    return routed
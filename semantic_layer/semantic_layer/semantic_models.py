@@ -0,0 +1,72 @@
+"""
+Semantic models of boring.yml, shared by the MCP server and test_queries.py.
+Nothing is imported, parsed or opened for them until a model is first used,
+so the MCP handshake does not wait on Ibis, the YAML or the database.
+"""
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional
+
+import yaml
+
+from cache import QueryCache, cache_models
+from tables import LazyTables, load_tables
+
+YAML_PATH: Path = Path(__file__).parent / "boring.yml"
+
+
+@lru_cache(maxsize=None)
+def model_definitions() -> Dict[str, Any]:
+    """boring.yml, parsed once, with the C loader when PyYAML was built with it."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(YAML_PATH) as f:
+        return yaml.load(f, Loader=loader)
+
+
+class LazyModels(Mapping[str, Any]):
+    """Models named in boring.yml; all of them are built on the first lookup of any."""
+
+    def __init__(self, build: Callable[[], Dict[str, Any]]) -> None:
+        self._build = build
+        self._models: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def _loaded(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._models is None:
+                self._models = self._build()
+            return self._models
+
+    def __getitem__(self, name: str) -> Any:
+        return self._loaded()[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in model_definitions()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(model_definitions())
+
+    def __len__(self) -> int:
+        return len(model_definitions())
+
+
+def build_models(query_cache: Optional[QueryCache], tables: Optional[LazyTables] = None) -> Dict[str, Any]:
+    from boring_semantic_layer import from_yaml
+    from pool import pool_models
+    from rollups import route_models
+
+    tables = tables or load_tables()
+    models = route_models(from_yaml(str(YAML_PATH), tables=tables), tables, model_definitions())
+    models = pool_models(models, tables.pool())
+    if query_cache is not None:
+        models = cache_models(models, query_cache)
+    return models
+
+
+def load_models(query_cache: Optional[QueryCache] = None) -> Mapping[str, Any]:
+    """
+    Models of boring.yml on the tables of `load_tables`, with coarse archetype queries routed to the rollup
+    marts, executed on the tables' connection pool, and their results kept in `query_cache` when one is given.
+    """
+    return LazyModels(lambda: build_models(query_cache))
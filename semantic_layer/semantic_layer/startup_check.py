@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Measures the time from starting the MCP stdio server to its answer to the `initialize` request,
+and fails when the slowest of `--runs` starts is over the budget.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+SERVER_PATH: Path = Path(__file__).parent / "mcp_server.py"
+STARTUP_BUDGET_SECONDS: float = 3.0
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "startup_check", "version": "0.1.0"},
+    },
+}
+
+
+def time_to_first_response() -> float:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, str(SERVER_PATH)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert server.stdin is not None and server.stdout is not None
+        server.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        server.stdin.flush()
+        for line in server.stdout:
+            if json.loads(line).get("id") == INITIALIZE_REQUEST["id"]:
+                return time.perf_counter() - started
+        raise RuntimeError(f"Server exited with {server.wait()} before answering initialize")
+    finally:
+        server.kill()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_SECONDS)
+    args = parser.parse_args()
+
+    timings: List[float] = [time_to_first_response() for _ in range(args.runs)]
+    for run, seconds in enumerate(timings, 1):
+        print(f"Run {run}: {seconds:.3f}s to initialize")
+    slowest = max(timings)
+    print(f"Slowest: {slowest:.3f}s (budget {args.budget:.3f}s)")
+    if slowest > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Tables the semantic models in boring.yml are built on.
+They are read from the dbt DuckDB file, or the one at POKEMON_TCG_DATABASE_PATH, or from the Parquet lake
+written by dbt's `export_lake` when POKEMON_TCG_LAKE_PATH is set, so the server never locks the file dbt writes to.
+"""
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+DATABASE_PATH: Path = Path(__file__).parent.parent.parent / "pokemon_tcg_pipeline.duckdb"
+DATABASE_PATH_ENV: str = "POKEMON_TCG_DATABASE_PATH"
+LAKE_PATH_ENV: str = "POKEMON_TCG_LAKE_PATH"
+
+# Table name -> dbt layer (the `main_<layer>` schema, or the `<layer>/` directory of the lake)
+TABLE_LAYERS: Dict[str, str] = {
+    "mart_archetype_stats": "consumption",
+    "mart_monthly_meta_shifts": "consumption",
+    "mart_archetype_matchups": "consumption",
+    "mart_archetype_stats_rollup": "consumption",
+    "mart_archetype_matchups_rollup": "consumption",
+    "mart_cards_used": "consumption",
+    "mart_archetype_card_staples": "consumption",
+    "mart_archetype_matchup_suggestions": "consumption",
+    "mart_tournament_analysis": "consumption",
+    "mart_deck_analysis": "consumption",
+    "dim_cards": "semantic",
+    "fct_matches": "semantic",
+}
+
+
+def database_path() -> Path:
+    return Path(os.environ.get(DATABASE_PATH_ENV) or DATABASE_PATH)
+
+
+class LazyTables(Mapping[str, Any]):
+    """
+    The tables of TABLE_LAYERS, each bound the first time it is looked up.
+    Ibis is only imported, and the database or lake only opened, with the first table.
+    The DuckDB file is opened read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lake_path = os.environ.get(LAKE_PATH_ENV)
+        self._con: Optional[Any] = None
+        self._tables: Dict[str, Any] = {}
+        self._pool: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> Any:
+        layer = TABLE_LAYERS[name]
+        with self._lock:
+            if name not in self._tables:
+                self._tables[name] = self._bind(name, layer)
+            return self._tables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(TABLE_LAYERS)
+
+    def __len__(self) -> int:
+        return len(TABLE_LAYERS)
+
+    def connection(self) -> Any:
+        """The Ibis DuckDB backend, opened read-only on the DuckDB file or in memory for the lake."""
+        if self._con is None:
+            import ibis
+
+            if not self._lake_path:
+                self._con = ibis.duckdb.connect(str(database_path()), read_only=True)
+            else:
+                self._con = ibis.duckdb.connect()
+        return self._con
+
+    def pool(self) -> Any:
+        """Cursors over the same database as the tables, for running their queries concurrently."""
+        from pool import ConnectionPool
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ConnectionPool(self.connection().con)
+            return self._pool
+
+    def _bind(self, name: str, layer: str) -> Any:
+        con = self.connection()
+        schema = f"main_{layer}"
+        if self._lake_path:
+            # A view rather than Ibis' read_parquet, whose temporary view other cursors would not see. It is created
+            # in the schema of the DuckDB file, where boring.yml's `database` has BSL look the table up again.
+            # Partition columns (set_name, tournament_month) come back from the hive paths,
+            # and filters on them only read the matching partitions
+            path = f"{self._lake_path}/{layer}/{name}/**/*.parquet"
+            con.raw_sql(f'create schema if not exists "{schema}"')
+            con.raw_sql(
+                f"create or replace view \"{schema}\".\"{name}\" as "
+                f"select * from read_parquet('{path}', hive_partitioning = true)"
+            )
+        return con.table(name, database=schema)
+
+
+def load_tables() -> LazyTables:
+    return LazyTables()
+
+
+def data_version() -> Tuple[float, int]:
+    """
+    Changes whenever a dlt load or a dbt run rewrites the data: the newest modification time and the total
+    size of the DuckDB file, or of the Parquet files of the lake. Checking it does not open the database.
+    """
+    lake_path = os.environ.get(LAKE_PATH_ENV)
+    if not lake_path:
+        database = database_path()
+        paths = [database, database.with_name(database.name + ".wal")]
+    else:
+        paths = [
+            path
+            for layer in set(TABLE_LAYERS.values())
+            for path in (Path(lake_path) / layer).glob("**/*.parquet")
+        ]
+    stats = [path.stat() for path in paths if path.exists()]
+    return max((stat.st_mtime for stat in stats), default=0.0), sum(stat.st_size for stat in stats)
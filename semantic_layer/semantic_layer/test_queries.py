@@ -1,27 +1,9 @@
 #!/usr/bin/env python3
-import ibis
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Union, Tuple
-from boring_semantic_layer import from_yaml
+from typing import Any, List, Optional, Callable, Union, Tuple, Mapping
+from semantic_models import load_models
 
 # Setup same environment as server
-base_dir: Path = Path(__file__).parent
-yaml_path: Path = base_dir / "boring.yml"
-con: Any = ibis.duckdb.connect(str(base_dir.parent.parent / "pokemon_tcg_pipeline.duckdb"))
-tables: Dict[str, Any] = {
-    "mart_archetype_stats": con.table("mart_archetype_stats", database="main_consumption"),
-    "mart_monthly_meta_shifts": con.table("mart_monthly_meta_shifts", database="main_consumption"),
-    "mart_archetype_matchups": con.table("mart_archetype_matchups", database="main_consumption"),
-    "mart_cards_used": con.table("mart_cards_used", database="main_consumption"),
-    "mart_archetype_card_staples": con.table("mart_archetype_card_staples", database="main_consumption"),
-    "mart_archetype_matchup_suggestions": con.table("mart_archetype_matchup_suggestions", database="main_consumption"),
-    "mart_tournament_analysis": con.table("mart_tournament_analysis", database="main_consumption"),
-    "mart_deck_analysis": con.table("mart_deck_analysis", database="main_consumption"),
-    "dim_cards": con.table("dim_cards", database="main_semantic"),
-    "fct_matches": con.table("fct_matches", database="main_semantic"),
-}
-
-models: Dict[str, Any] = from_yaml(str(yaml_path), tables=tables)
+models: Mapping[str, Any] = load_models()
 
 
 def run_test(
@@ -60,7 +42,7 @@ run_test(
     "Win rate of Charizard decks",
     "archetype_stats",
     dimensions=["archetype"],
-    measures=["avg_win_rate"],
+    measures=["win_rate"],
     filters=lambda t: t.archetype == "Charizard",
 )
 
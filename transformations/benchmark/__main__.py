@@ -0,0 +1,207 @@
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from .generator import SyntheticData
+from .runner import (
+    FULL_REFRESH,
+    INCREMENTAL,
+    BenchmarkOptions,
+    install_packages,
+    options_dict,
+    run_phase,
+    write_profiles,
+)
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def _delta(value: Any, baseline: Any) -> str:
+    if not isinstance(value, (int, float)) or not isinstance(baseline, (int, float)):
+        return ""
+    if not baseline:
+        return f" (baseline {baseline})"
+    return f" (baseline {baseline}, {(value - baseline) / baseline:+.1%})"
+
+
+def report(results: dict[str, Any], baseline: Optional[dict[str, Any]]) -> None:
+    baseline = baseline or {}
+    for field in ("config",):
+        if baseline and baseline.get(field) != results[field]:
+            print(f"Baseline was recorded with a different {field}:")
+            print(f"  baseline: {baseline.get(field)}")
+            print(f"  current:  {results[field]}")
+
+    for scale, result in results["scales"].items():
+        reference = baseline.get("scales", {}).get(scale, {})
+        if reference and reference.get("data") != result["data"]:
+            print(f"Baseline for {scale} was recorded on different data:")
+            print(f"  baseline: {reference.get('data')}")
+            print(f"  current:  {result['data']}")
+
+        print(f"{scale}: {result['data']}")
+        print(f"  generate_seconds {result['generate_seconds']:>10}")
+        for phase, metrics in result["phases"].items():
+            phase_reference = reference.get("phases", {}).get(phase, {})
+            print(f"  {phase}:")
+            for name in ("seed_seconds", "run_seconds", "peak_rss_mib"):
+                print(
+                    f"    {name:<34} {metrics[name]:>10}"
+                    f"{_delta(metrics[name], phase_reference.get(name))}"
+                )
+            for model, timing in metrics["models"].items():
+                model_reference = phase_reference.get("models", {}).get(model, {})
+                rows = timing["rows"]
+                changed = (
+                    f" (baseline {model_reference['rows']} rows)"
+                    if model_reference and model_reference.get("rows") != rows
+                    else ""
+                )
+                print(
+                    f"    {model:<34} {timing['seconds']:>10}"
+                    f"{_delta(timing['seconds'], model_reference.get('seconds'))}"
+                    f"  {rows} rows{changed}"
+                )
+
+
+def run_scale(
+    data: SyntheticData, options: BenchmarkOptions, plans_dir: Optional[Path]
+) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        database = Path(workdir) / "pokemon_tcg_pipeline.duckdb"
+        write_profiles(Path(workdir), database, options.threads)
+
+        print(f"Generating {data.describe()}...", flush=True)
+        started = time.perf_counter()
+        # The last month is held back for the incremental phase
+        rows = data.write(database, range(data.months - 1))
+        generate_seconds = time.perf_counter() - started
+
+        phases: dict[str, Any] = {}
+        # One fresh process per phase keeps peak RSS figures independent
+        context = multiprocessing.get_context("spawn")
+        for phase in (FULL_REFRESH, INCREMENTAL):
+            if phase == INCREMENTAL:
+                data.write(database, range(data.months - 1, data.months))
+            print(f"Running {phase} build...", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                phases[phase] = executor.submit(
+                    run_phase,
+                    phase,
+                    str(database),
+                    workdir,
+                    options,
+                    str(plans_dir) if plans_dir else None,
+                ).result()
+
+    return {
+        "data": data.describe(),
+        "raw_rows": rows,
+        "generate_seconds": round(generate_seconds, 3),
+        "phases": phases,
+    }
+
+
+def run(args: argparse.Namespace) -> None:
+    options = BenchmarkOptions(
+        threads=args.threads, plans=not args.no_plans, verbose=args.verbose
+    )
+    install_packages(options.verbose)
+
+    results: dict[str, Any] = {"config": options_dict(options), "scales": {}}
+    for scale in args.scale:
+        data = SyntheticData(
+            scale=scale, months=args.months, players=args.players, seed=args.seed
+        )
+        plans_dir = None
+        if options.plans:
+            plans_dir = Path(args.plans_dir) / f"{scale:g}x"
+            plans_dir.mkdir(parents=True, exist_ok=True)
+        results["scales"][f"{scale:g}x"] = run_scale(data, options, plans_dir)
+        if plans_dir:
+            print(f"Wrote query profiles to {plans_dir}")
+
+    baseline_path = Path(args.baseline)
+    baseline = None
+    if baseline_path.exists() and not args.save_baseline:
+        baseline = json.loads(baseline_path.read_text())
+    report(results, baseline)
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Saved baseline to {baseline_path}")
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+def generate(args: argparse.Namespace) -> None:
+    data = SyntheticData(
+        scale=args.scale, months=args.months, players=args.players, seed=args.seed
+    )
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    rows = data.write(args.out)
+    print(f"Wrote {data.describe()} {rows} to {args.out}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the dbt models on synthetic raw tables."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser(
+        "generate", help="Write synthetic raw tables to a DuckDB file."
+    )
+    generate_parser.add_argument("--scale", type=float, default=1.0)
+    generate_parser.add_argument("--months", type=int, default=12)
+    generate_parser.add_argument("--players", type=int, default=32)
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument("--out", default=".benchmark/synthetic.duckdb")
+    generate_parser.set_defaults(func=generate)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark.")
+    run_parser.add_argument(
+        "--scale",
+        type=float,
+        nargs="+",
+        default=[10.0],
+        help="Volumes to build, as multiples of a year of 25 tournaments a month.",
+    )
+    run_parser.add_argument("--months", type=int, default=12)
+    run_parser.add_argument("--players", type=int, default=32)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="dbt threads; 1 keeps the model timings from overlapping.",
+    )
+    run_parser.add_argument(
+        "--plans-dir",
+        default=".benchmark/dbt_plans",
+        help="Where to write the EXPLAIN ANALYZE profile of every model.",
+    )
+    run_parser.add_argument(
+        "--no-plans",
+        action="store_true",
+        help="Skip the query profiles, which run every model's query once more.",
+    )
+    run_parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    run_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the baseline with this run instead of comparing against it.",
+    )
+    run_parser.add_argument(
+        "--output", help="Also write the results as JSON to this file."
+    )
+    run_parser.add_argument("--verbose", action="store_true", help="Show dbt output.")
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    args.func(args)
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import csv
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+SEEDS_PATH = Path(__file__).parent.parent / "seeds"
+RAW_SCHEMA = "pokemon_tcg_data"
+BASE_URL = "https://play.limitlesstcg.com"
+
+# Volume of scale 1: a year of 25 tournaments a month with 32 players each,
+# about 9,600 decks, 190,000 deck cards and 48,000 matches
+BASE_TOURNAMENTS_PER_MONTH = 25
+# Archetype i of meta_decks.csv is played with a weight of 1 / i ** ARCHETYPE_SKEW
+ARCHETYPE_SKEW = 1.0
+TIE_RATE = 0.08
+# Largest shift of a matchup's win probability away from 50%
+MATCHUP_SKEW = 0.15
+
+_FILLER_POKEMON = [
+    "Fezandipiti ex",
+    "Pecharunt ex",
+    "Squawkabilly ex",
+    "Radiant Greninja",
+    "Manaphy",
+    "Bibarel",
+    "Bidoof",
+    "Rotom V",
+    "Lumineon V",
+    "Mew ex",
+    "Iron Bundle",
+    "Hawlucha",
+    "Tatsugiri",
+    "Cleffa",
+    "Snorlax",
+    "Budew",
+    "Shaymin",
+    "Latias ex",
+    "Klefki",
+    "Drifloon",
+]
+_TRAINERS = [
+    "Professor's Research",
+    "Boss's Orders",
+    "Iono",
+    "Arven",
+    "Ultra Ball",
+    "Nest Ball",
+    "Rare Candy",
+    "Buddy-Buddy Poffin",
+    "Counter Catcher",
+    "Night Stretcher",
+    "Super Rod",
+    "Earthen Vessel",
+    "Energy Retrieval",
+    "Switch",
+    "Prime Catcher",
+    "Lana's Aid",
+    "Pokégear 3.0",
+    "Battle VIP Pass",
+    "Forest Seal Stone",
+    "Bravery Charm",
+    "Rescue Board",
+    "Artazon",
+    "Temple of Sinnoh",
+    "Jamming Tower",
+    "Briar",
+    "Crispin",
+    "Carmine",
+    "Unfair Stamp",
+    "Technical Machine: Evolution",
+    "Hero's Cape",
+]
+_ENERGY = [
+    "Basic Grass Energy",
+    "Basic Fire Energy",
+    "Basic Water Energy",
+    "Basic Lightning Energy",
+    "Basic Psychic Energy",
+    "Basic Fighting Energy",
+    "Basic Darkness Energy",
+    "Basic Metal Energy",
+    "Jet Energy",
+    "Mist Energy",
+    "Luminous Energy",
+]
+# Kind -> (names, fewest and most entries a deck draws from them, most copies of an entry)
+_FILLERS: dict[str, tuple[list[str], int, int, int]] = {
+    "pokemon": (_FILLER_POKEMON, 3, 7, 2),
+    "trainer": (_TRAINERS, 12, 18, 4),
+    "energy": (_ENERGY, 1, 3, 8),
+}
+
+
+@dataclass(slots=True)
+class SyntheticData:
+    """
+    Raw dlt tables shaped like an ingestion run, generated at `scale` times the scale 1 volume.
+    Tournaments are spread over `months` months ending with `last_month`, and every month is
+    written as its own dlt load, so incremental dbt runs can be replayed month by month.
+    """
+
+    scale: float = 1.0
+    months: int = 12
+    players: int = 32
+    last_month: date = date(2026, 1, 1)
+    seed: int = 0
+
+    @property
+    def tournaments_per_month(self) -> int:
+        return max(round(BASE_TOURNAMENTS_PER_MONTH * self.scale), 1)
+
+    @property
+    def player_pool(self) -> int:
+        """Distinct player names, so that players meet again over the months."""
+        return self.players * self.tournaments_per_month
+
+    def describe(self) -> str:
+        return (
+            f"synthetic {self.scale:g}x: {self.months} months x {self.tournaments_per_month} "
+            f"tournaments x {self.players} players"
+        )
+
+    def write(self, path: str | Path, months: range | None = None) -> dict[str, int]:
+        """
+        Appends the loads of `months` (indexes from the oldest month, all of them by default)
+        to the raw tables of the DuckDB file at `path`. Returns the rows written per table.
+        """
+        months = range(self.months) if months is None else months
+        con = duckdb.connect(str(path))
+        try:
+            con.execute("set enable_progress_bar = false")
+            _create_raw_tables(con)
+            self._create_inputs(con)
+            before = _row_counts(con)
+            for month in months:
+                self._write_month(con, month)
+            return {
+                table: count - before[table]
+                for table, count in _row_counts(con).items()
+            }
+        finally:
+            con.close()
+
+    def _create_inputs(self, con: duckdb.DuckDBPyConnection) -> None:
+        with open(SEEDS_PATH / "meta_decks.csv", newline="") as file:
+            rules = list(csv.DictReader(file))
+        weights = [1 / rank**ARCHETYPE_SKEW for rank in range(1, len(rules) + 1)]
+        total = sum(weights)
+
+        con.execute(
+            "create or replace temp table archetypes "
+            "(rule integer, archetype varchar, low double, high double)"
+        )
+        con.execute(
+            "create or replace temp table archetype_cards (rule integer, name varchar)"
+        )
+        low = 0.0
+        for rule, (row, weight) in enumerate(zip(rules, weights)):
+            high = low + weight / total
+            con.execute(
+                "insert into archetypes values (?, ?, ?, ?)",
+                [rule, row["archetype"], low, high],
+            )
+            for column, name in row.items():
+                if column.startswith("card_name_") and name:
+                    con.execute(
+                        "insert into archetype_cards values (?, ?)", [rule, name]
+                    )
+            low = high
+
+        con.execute(
+            "create or replace temp table fillers "
+            "(kind varchar, idx integer, name varchar, pool integer, "
+            "fewest integer, most integer, copies integer)"
+        )
+        for kind, (names, fewest, most, copies) in _FILLERS.items():
+            con.executemany(
+                "insert into fillers values (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    [kind, idx, name, len(names), fewest, most, copies]
+                    for idx, name in enumerate(names)
+                ],
+            )
+
+        with open(SEEDS_PATH / "pokemon_sets.csv", newline="") as file:
+            sets = [row["Abbreviation"] for row in csv.DictReader(file)]
+        con.execute(
+            "create or replace temp table sets (idx integer, abbreviation varchar)"
+        )
+        con.executemany(
+            "insert into sets values (?, ?)", [[i, name] for i, name in enumerate(sets)]
+        )
+
+    def _write_month(self, con: duckdb.DuckDBPyConnection, month: int) -> None:
+        """Writes the tournaments of month `month` and everything played at them as one load."""
+        # Every value is drawn from a hash of the seed and the row, so a month is the same in every run
+        params: dict[str, Any] = {
+            "seed": self.seed,
+            "month": month,
+            "month_start": _add_months(self.last_month, month - self.months + 1),
+            # Epoch seconds of the same width sort like dlt load ids do
+            "load_id": f"{1_700_000_000 + month * 86_400}.0",
+            "tournaments": self.tournaments_per_month,
+            "players": self.players,
+            "pool": self.player_pool,
+            "rounds": max((self.players - 1).bit_length(), 1),
+            "tie_rate": TIE_RATE,
+            "skew": MATCHUP_SKEW,
+            "base_url": BASE_URL,
+        }
+        for statement in _MONTH_SQL:
+            # DuckDB rejects named parameters a statement does not use
+            names = set(re.findall(r"\$(\w+)", statement))
+            con.execute(statement, {name: params[name] for name in names})
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _row_counts(con: duckdb.DuckDBPyConnection) -> dict[str, int]:
+    return {
+        table: con.execute(f"select count(*) from {RAW_SCHEMA}.{table}").fetchone()[0]
+        for table in RAW_TABLES
+    }
+
+
+def _create_raw_tables(con: duckdb.DuckDBPyConnection) -> None:
+    con.execute(f"create schema if not exists {RAW_SCHEMA}")
+    for table, columns in RAW_TABLES.items():
+        con.execute(f"create table if not exists {RAW_SCHEMA}.{table} ({columns})")
+
+
+# Columns as dlt creates them from the Arrow tables of ingestion/batches.py
+RAW_TABLES = {
+    "tournaments": (
+        "data_date date, data_time varchar, data_name varchar, data_organizer varchar, "
+        "data_format varchar, data_players bigint, data_winner varchar, "
+        "tournament_page varchar not null, date date, _dlt_load_id varchar not null"
+    ),
+    "participant_deck": (
+        "player varchar not null, tournament varchar not null, decklist_link varchar, "
+        "_dlt_load_id varchar not null"
+    ),
+    "participant_deck_cards": (
+        "tournament varchar not null, player varchar not null, card varchar not null, "
+        "name varchar, code varchar, quantity bigint, kind varchar, _dlt_load_id varchar not null"
+    ),
+    "participant_matches": (
+        "round varchar not null, p1 varchar not null, p2 varchar, result varchar, "
+        "tournament varchar not null, _dlt_load_id varchar not null"
+    ),
+}
+
+# Fraction in [0, 1) drawn from the hash of its arguments
+_DRAW = "(hash($seed, {}) % 1000000) / 1000000.0"
+
+_MONTH_SQL = [
+    f"""
+    create or replace temp table month_tournaments as
+    select
+        t,
+        format('synth{{:03d}}{{:05d}}', $month, t) as tournament_id,
+        $month_start + to_days(floor({_DRAW.format("$month, t, 'day'")} * 28)::integer) as day,
+        $players // 2 + floor({_DRAW.format("$month, t, 'players'")} * $players)::integer
+            as players,
+        (hash($seed, $month, t, 'first') % $pool)::integer as first_player
+    from range($tournaments) as r(t)
+    """,
+    """
+    create or replace temp table month_participants as
+    select
+        t.tournament_id,
+        p,
+        format('player{:07d}', (t.first_player + p) % $pool) as player,
+        $base_url || '/tournament/' || t.tournament_id || '/standings' as tournament
+    from month_tournaments as t
+    cross join range($players * 2) as r(p)
+    where p < t.players
+    """,
+    f"""
+    create or replace temp table month_decks as
+    select
+        p.*,
+        a.rule,
+        a.archetype
+    from month_participants as p
+    inner join archetypes as a
+        on {_DRAW.format("p.tournament_id, p.p, 'archetype'")} >= a.low
+        and {_DRAW.format("p.tournament_id, p.p, 'archetype'")} < a.high
+    """,
+    """
+    insert into pokemon_tcg_data.tournaments
+    select
+        t.day,
+        (epoch_ms(t.day::timestamp))::varchar,
+        'Synthetic Cup ' || t.tournament_id,
+        'Synthetic League',
+        'STANDARD',
+        t.players,
+        format('player{:07d}', t.first_player),
+        $base_url || '/tournament/' || t.tournament_id || '/standings',
+        t.day,
+        $load_id
+    from month_tournaments as t
+    """,
+    """
+    insert into pokemon_tcg_data.participant_deck
+    select
+        player,
+        tournament,
+        $base_url || '/tournament/' || tournament_id || '/player/' || player || '/decklist',
+        $load_id
+    from month_participants
+    """,
+    f"""
+    insert into pokemon_tcg_data.participant_deck_cards
+    with archetype_entries as (
+        select
+            d.tournament,
+            d.player,
+            'pokemon' as kind,
+            c.name,
+            2 + floor({_DRAW.format("d.tournament_id, d.p, c.name")} * 3)::integer as quantity
+        from month_decks as d
+        inner join archetype_cards as c on d.rule = c.rule
+    ),
+
+    filler_picks as (
+        select
+            d.tournament_id,
+            d.p,
+            d.tournament,
+            d.player,
+            k.kind,
+            i,
+            hash($seed, d.tournament_id, d.p, k.kind, i) % k.pool as idx
+        from month_decks as d
+        cross join (select distinct kind, pool, fewest, most from fillers) as k
+        cross join range(32) as r(i)
+        where i < k.fewest + hash($seed, d.tournament_id, d.p, k.kind) % (k.most - k.fewest + 1)
+    ),
+
+    filler_entries as (
+        select
+            p.tournament,
+            p.player,
+            f.kind,
+            f.name,
+            1 + floor({_DRAW.format("p.tournament_id, p.p, f.kind, p.i, 'copies'")} * f.copies)::integer
+                as quantity
+        from filler_picks as p
+        inner join fillers as f on p.kind = f.kind and p.idx = f.idx
+    ),
+
+    entries as (
+        select * from archetype_entries
+        union all
+        select * from filler_entries
+    ),
+
+    -- Every Pokémon name gets one code, from a set and number drawn from the name
+    codes as (
+        select
+            n.name,
+            s.abbreviation || '-' || (1 + hash(n.name, 'number') % 250) as code
+        from (select distinct name from entries where kind = 'pokemon') as n
+        inner join sets as s on s.idx = hash(n.name, 'set') % (select count(*) from sets)
+    ),
+
+    coded as (
+        select
+            e.*,
+            c.code
+        from entries as e
+        left join codes as c on e.kind = 'pokemon' and e.name = c.name
+    )
+
+    select
+        tournament,
+        player,
+        kind || '|' || name || '|' || coalesce(code, '') as card,
+        name,
+        code,
+        sum(quantity),
+        kind,
+        $load_id
+    from coded
+    group by tournament, player, name, code, kind
+    """,
+    # Players of a round are paired in the order of a per-round shuffle; the odd one out gets no match.
+    # The first of a pair wins with 50% shifted by a skew of the archetype matchup, and both rows agree.
+    f"""
+    insert into pokemon_tcg_data.participant_matches
+    with seated as (
+        select
+            d.tournament_id,
+            d.tournament,
+            d.player,
+            d.archetype,
+            r.round,
+            row_number() over (
+                partition by d.tournament_id, r.round
+                order by hash($seed, d.tournament_id, r.round, d.p)
+            ) - 1 as seat
+        from month_decks as d
+        cross join range(1, $rounds + 1) as r(round)
+    ),
+
+    pairs as (
+        select
+            a.tournament,
+            a.round,
+            a.player as first_player,
+            b.player as second_player,
+            {_DRAW.format("a.tournament_id, a.round, a.seat, 'result'")} as draw,
+            0.5 + $skew * (
+                {_DRAW.format("a.archetype, b.archetype")} - {_DRAW.format("b.archetype, a.archetype")}
+            ) as win_probability
+        from seated as a
+        inner join seated as b
+            on a.tournament_id = b.tournament_id
+            and a.round = b.round
+            and b.seat = a.seat + 1
+        where a.seat % 2 = 0
+    ),
+
+    results as (
+        select
+            *,
+            case
+                when draw < $tie_rate then 'TIE'
+                when (draw - $tie_rate) / (1 - $tie_rate) < win_probability then 'WIN'
+                else 'LOSS'
+            end as first_result
+        from pairs
+    )
+
+    select round::varchar, first_player, second_player, first_result, tournament, $load_id
+    from results
+    union all
+    select
+        round::varchar,
+        second_player,
+        first_player,
+        case first_result when 'WIN' then 'LOSS' when 'LOSS' then 'WIN' else 'TIE' end,
+        tournament,
+        $load_id
+    from results
+    """,
+]
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+PROJECT_DIR = Path(__file__).parent.parent
+PROFILE_NAME = "pokemon_tcg_transform"
+
+FULL_REFRESH = "full_refresh"
+INCREMENTAL = "incremental"
+# The full refresh builds every month but the last, which the incremental run then loads
+PHASES = (FULL_REFRESH, INCREMENTAL)
+
+
+@dataclass(slots=True)
+class BenchmarkOptions:
+    threads: int = 1
+    plans: bool = True
+    verbose: bool = False
+
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB on Linux
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def write_profiles(workdir: Path, database: Path, threads: int) -> None:
+    """A profiles.yml pointing the project at the benchmark database. JSON is valid YAML."""
+    profiles = {
+        PROFILE_NAME: {
+            "target": "benchmark",
+            "outputs": {
+                "benchmark": {
+                    "type": "duckdb",
+                    "path": str(database),
+                    "threads": threads,
+                }
+            },
+        }
+    }
+    (workdir / "profiles.yml").write_text(json.dumps(profiles, indent=2) + "\n")
+
+
+def dbt(command: list[str], workdir: Path, verbose: bool) -> Any:
+    """Invokes dbt in this process, so that peak RSS includes DuckDB, and returns its result."""
+    from dbt.cli.main import dbtRunner
+
+    args = [] if verbose else ["--quiet"]
+    args += [
+        *command,
+        "--project-dir",
+        str(PROJECT_DIR),
+        "--profiles-dir",
+        str(workdir),
+        "--target-path",
+        str(workdir / "target"),
+        "--log-path",
+        str(workdir / "logs"),
+    ]
+    outcome = dbtRunner().invoke(args)
+    if not outcome.success:
+        raise RuntimeError(
+            f"dbt {command[0]} failed: {outcome.exception or outcome.result}"
+        )
+    return outcome.result
+
+
+def install_packages(verbose: bool) -> None:
+    """Installs the project's dbt packages on the first run, as `dbt deps` would."""
+    if (PROJECT_DIR / "dbt_packages").exists():
+        return
+    from dbt.cli.main import dbtRunner
+
+    args = [] if verbose else ["--quiet"]
+    outcome = dbtRunner().invoke([*args, "deps", "--project-dir", str(PROJECT_DIR)])
+    if not outcome.success:
+        raise RuntimeError(f"dbt deps failed: {outcome.exception}")
+
+
+def explain_analyze(database: Path, sql: str) -> str:
+    """DuckDB's EXPLAIN ANALYZE profile of `sql`, which runs the query once more."""
+    import duckdb
+
+    con = duckdb.connect(str(database))
+    try:
+        con.execute("set enable_progress_bar = false")
+        return "\n".join(
+            value for _, value in con.execute("explain analyze " + sql).fetchall()
+        )
+    finally:
+        con.close()
+
+
+def row_count(database: Path, relation: str) -> int:
+    import duckdb
+
+    con = duckdb.connect(str(database))
+    try:
+        return con.execute(f"select count(*) from {relation}").fetchone()[0]
+    finally:
+        con.close()
+
+
+def run_phase(
+    phase: str,
+    database: str,
+    workdir: str,
+    options: BenchmarkOptions,
+    plans_dir: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Runs one dbt build of the benchmark database and times every model.
+    Meant to run in a fresh process, so peak RSS covers this phase only.
+    """
+    database_path, work_path = Path(database), Path(workdir)
+    full_refresh = ["--full-refresh"] if phase == FULL_REFRESH else []
+
+    started = time.perf_counter()
+    dbt(["seed", *full_refresh], work_path, options.verbose)
+    seed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = dbt(["run", *full_refresh], work_path, options.verbose).results
+    run_seconds = time.perf_counter() - started
+    peak_rss = peak_rss_mib()
+
+    models: dict[str, dict[str, Any]] = {}
+    for result in results:
+        node = result.node
+        # Results also hold the on-run-end hooks, which have no relation
+        if node.resource_type != "model":
+            continue
+        models[node.name] = {
+            "materialized": node.config.materialized,
+            "seconds": round(result.execution_time, 3),
+            "rows": row_count(database_path, node.relation_name),
+        }
+        # Profiles replay the compiled query against the built tables. After an incremental run
+        # the watermark already covers the new load, so only full builds are profiled.
+        if plans_dir and phase == FULL_REFRESH and node.compiled_code:
+            plan = explain_analyze(database_path, node.compiled_code)
+            (Path(plans_dir) / f"{node.name}.txt").write_text(plan + "\n")
+
+    return {
+        "seed_seconds": round(seed_seconds, 3),
+        "run_seconds": round(run_seconds, 3),
+        "peak_rss_mib": round(peak_rss, 1),
+        "models": models,
+    }
+
+
+def options_dict(options: BenchmarkOptions) -> dict[str, Any]:
+    config = asdict(options)
+    config.pop("plans")
+    config.pop("verbose")
+    return config
@@ -0,0 +1,113 @@
+{#
+    Exports the raw dlt tables and every semantic and consumption table to `path` as Parquet:
+
+        <path>/raw/<table>/tournament_month=<month>/data_0.parquet
+        <path>/semantic/<model>/data_0.parquet
+        <path>/consumption/<model>/set_name=<set>/data_0.parquet
+
+    Marts with a `set_name` column are partitioned by it, then marts with a `tournament_month` column.
+    Runs at the end of `dbt run` when the `lake_path` var is set, or on its own with
+    `dbt run-operation export_lake --args '{path: ../lake}'`.
+    Partitions are overwritten in place, so remove the export after a `--full-refresh` that drops sets or months.
+#}
+{% macro export_lake(path=none) -%}
+    {%- set path = path or var('lake_path', none) -%}
+    {%- if not execute or not path or flags.WHICH not in ('run', 'build', 'run-operation') -%}
+        {{ return('') }}
+    {%- endif -%}
+
+    {%- do lake_directory(path) -%}
+    {%- for layer in ['raw', 'semantic', 'consumption'] -%}
+        {%- do lake_directory(path ~ '/' ~ layer) -%}
+    {%- endfor -%}
+
+    {#- Raw tables already read from a lake are not exported again -#}
+    {%- if not var('raw_lake_path', none) -%}
+        {%- for table, query in lake_raw_tables().items() -%}
+            {%- do run_query(lake_copy(query, path ~ '/raw/' ~ table, 'tournament_month')) -%}
+        {%- endfor -%}
+    {%- endif -%}
+
+    {%- for node in graph.nodes.values() if node.resource_type == 'model' and node.fqn[1] in ['semantic', 'consumption'] -%}
+        {%- set relation = adapter.get_relation(database=node.database, schema=node.schema, identifier=node.alias) -%}
+        {%- if relation -%}
+            {%- set columns = adapter.get_columns_in_relation(relation) | map(attribute='name') | list -%}
+            {%- if node.fqn[1] != 'consumption' -%}
+                {%- set partition = none -%}
+            {%- elif 'set_name' in columns -%}
+                {%- set partition = 'set_name' -%}
+            {%- elif 'tournament_month' in columns -%}
+                {%- set partition = 'tournament_month' -%}
+            {%- else -%}
+                {%- set partition = none -%}
+            {%- endif -%}
+            {%- do run_query(lake_copy('select * from ' ~ relation, path ~ '/' ~ node.fqn[1] ~ '/' ~ node.name, partition)) -%}
+        {%- endif -%}
+    {%- endfor -%}
+
+    {%- do log('Exported the Parquet lake to ' ~ path, info=true) -%}
+    {{ return('') }}
+{%- endmacro %}
+
+{# DuckDB only creates the last directory of a COPY target, and does so even for an empty partitioned COPY #}
+{% macro lake_directory(path) -%}
+    {%- do run_query("copy (select 1 as p where false) to '" ~ path ~ "' (format parquet, partition_by (p), overwrite_or_ignore true)") -%}
+{%- endmacro %}
+
+{% macro lake_copy(query, path, partition=none) -%}
+    {%- if partition -%}
+        copy ({{ query }}) to '{{ path }}' (format parquet, partition_by ({{ partition }}), overwrite_or_ignore true)
+    {%- else -%}
+        {%- do lake_directory(path) -%}
+        copy ({{ query }}) to '{{ path }}/data_0.parquet' (format parquet)
+    {%- endif -%}
+{%- endmacro %}
+
+{# Raw tables get the month of their tournament, the finest grain every table can be traced to #}
+{% macro lake_raw_tables() -%}
+    {%- set tournament_months -%}
+        select
+            tournament_page,
+            max(date_trunc('month', data_date::date)) as tournament_month
+        from {{ source('pokemon_tcg', 'tournaments') }}
+        group by 1
+    {%- endset -%}
+
+    {%- set tournaments -%}
+        select
+            *,
+            date_trunc('month', data_date::date) as tournament_month
+        from {{ source('pokemon_tcg', 'tournaments') }}
+    {%- endset -%}
+
+    {%- set participant_deck -%}
+        select
+            d.*,
+            m.tournament_month
+        from {{ source('pokemon_tcg', 'participant_deck') }} as d
+        left join ({{ tournament_months }}) as m on d.tournament = m.tournament_page
+    {%- endset -%}
+
+    {%- set participant_deck_cards -%}
+        select
+            c.*,
+            m.tournament_month
+        from {{ source('pokemon_tcg', 'participant_deck_cards') }} as c
+        left join ({{ tournament_months }}) as m on c.tournament = m.tournament_page
+    {%- endset -%}
+
+    {%- set participant_matches -%}
+        select
+            p.*,
+            m.tournament_month
+        from {{ source('pokemon_tcg', 'participant_matches') }} as p
+        left join ({{ tournament_months }}) as m on p.tournament = m.tournament_page
+    {%- endset -%}
+
+    {{ return({
+        'tournaments': tournaments,
+        'participant_deck': participant_deck,
+        'participant_deck_cards': participant_deck_cards,
+        'participant_matches': participant_matches,
+    }) }}
+{%- endmacro %}
@@ -0,0 +1,73 @@
+{#
+    Incremental models only process rows of dlt loads newer than the newest load they already hold.
+    `_dlt_load_id` is carried from the raw dlt tables through staging and the semantic layer for this,
+    and aggregated models keep the newest load id that contributed to each row.
+#}
+
+{% macro load_watermark() -%}
+    (select coalesce(max(_dlt_load_id), '') from {{ this }})
+{%- endmacro %}
+
+{% macro is_new_load(column='_dlt_load_id') -%}
+    {%- if is_incremental() -%}
+        {{ column }} > {{ load_watermark() }}
+    {%- else -%}
+        true
+    {%- endif -%}
+{%- endmacro %}
+
+{#
+    Tournaments with rows in any of `models` loaded after the watermark.
+    The models must also be referenced outside of `is_incremental()` blocks, so that dbt sees the dependency
+    (a `-- depends_on: {{ ref(...) }}` comment is enough).
+#}
+{% macro changed_tournaments(models) -%}
+    {%- for model in models %}
+    select tournament_id from {{ ref(model) }}
+    where {{ is_new_load() }}
+    {%- if not loop.last %}
+    union
+    {%- endif -%}
+    {%- endfor %}
+{%- endmacro %}
+
+{#
+    Values of the dim_tournament_sets `column` (set_name or tournament_month) of the tournaments of
+    `changed_tournaments(models)`: the current one, and the one a reload moved them away from.
+    Partitioned marts rebuild both, so that a moved tournament does not leave rows in its old partition.
+    Like the `models`, dim_tournament_sets must also be referenced outside of `is_incremental()` blocks.
+#}
+{% macro changed_partitions(column, models) -%}
+    select ts.{{ column }}
+    from ({{ changed_tournaments(models) }}) as changed
+    left join {{ ref('dim_tournament_sets') }} as ts on changed.tournament_id = ts.tournament_id
+    union
+    select ts.previous_{{ column }}
+    from ({{ changed_tournaments(models) }}) as changed
+    inner join {{ ref('dim_tournament_sets') }} as ts on changed.tournament_id = ts.tournament_id
+    -- Tournaments new to dim_tournament_sets had no partition before
+    where ts.previous_tournament_month is not null
+{%- endmacro %}
+
+{#
+    Deletes the rows of `{{ this }}` whose `column` has rows in `model` loaded after the watermark, as a pre-hook.
+    delete+insert only replaces the keys the new loads select again, so models that can drop a reloaded key
+    clear them first. The model must also be referenced outside of `is_incremental()` blocks.
+#}
+{% macro delete_new_loads(column, model) -%}
+    {%- if is_incremental() -%}
+        delete from {{ this }}
+        where {{ column }} in (select {{ column }} from {{ ref(model) }} where {{ is_new_load() }})
+    {%- endif -%}
+{%- endmacro %}
+
+{#
+    Deletes the rows of `{{ this }}` whose `column` value no longer appears in `model`, as a pre-hook.
+    delete+insert never selects such a value again, so its rows would otherwise stay.
+#}
+{% macro delete_missing(column, model) -%}
+    {%- if is_incremental() -%}
+        delete from {{ this }}
+        where {{ column }} not in (select {{ column }} from {{ ref(model) }})
+    {%- endif -%}
+{%- endmacro %}
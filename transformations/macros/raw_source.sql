@@ -0,0 +1,7 @@
+{#
+    A raw dlt table: the `pokemon_tcg` source in the DuckDB file, or the `pokemon_tcg_lake` source
+    on its Parquet export when the `raw_lake_path` var is set.
+#}
+{% macro raw_source(table) -%}
+    {{ source('pokemon_tcg_lake' if var('raw_lake_path', none) else 'pokemon_tcg', table) }}
+{%- endmacro %}
@@ -0,0 +1,8 @@
+{#
+    A 64-bit integer key: the first 16 hex digits of dbt_utils' md5 surrogate key.
+    It only depends on `field_list`, so keys stay stable across incremental and full-refresh runs
+    without a lookup table, and joins compare 8 bytes instead of 32-character strings.
+#}
+{% macro surrogate_key(field_list) -%}
+    ('0x' || left({{ dbt_utils.generate_surrogate_key(field_list) }}, 16))::ubigint
+{%- endmacro %}
@@ -1,24 +1,53 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='archetype',
+        pre_hook="{{ delete_missing('archetype', 'dim_deck_archetypes') }}"
+    )
+}}
+
 with archetype_decks as (
     select
         participant_id,
-        archetype
+        archetype,
+        _dlt_load_id
     from {{ ref('dim_deck_archetypes') }}
+    {% if is_incremental() %}
+        where archetype in (
+            select archetype from {{ ref('dim_deck_archetypes') }}
+            where {{ is_new_load() }}
+            union
+            -- Archetypes that reloaded decks left, which no longer have the decks the mart counted
+            select staples.archetype
+            from (select distinct archetype, total_archetype_decks from {{ this }}) as staples
+            inner join (
+                select
+                    archetype,
+                    count(*) as decks
+                from {{ ref('dim_deck_archetypes') }}
+                group by 1
+            ) as current_decks on staples.archetype = current_decks.archetype
+            where staples.total_archetype_decks != current_decks.decks
+        )
+    {% endif %}
 ),
 
 deck_compositions as (
     select
-        participant_id,
-        card_name,
-        card_code,
-        card_kind,
-        quantity
-    from {{ ref('fct_deck_composition') }}
+        dc.participant_id,
+        c.card_name,
+        c.card_code,
+        c.card_kind,
+        dc.quantity
+    from {{ ref('fct_deck_composition') }} as dc
+    inner join {{ ref('dim_cards') }} as c on dc.card_id = c.card_id
 ),
 
 archetype_totals as (
     select
         archetype,
-        count(distinct participant_id) as total_decks
+        count(distinct participant_id) as total_decks,
+        max(_dlt_load_id) as _dlt_load_id
     from archetype_decks
     group by 1
 ),
@@ -43,6 +72,7 @@ select
     cu.card_kind,
     cu.decks_with_card,
     archt.total_decks as total_archetype_decks,
+    archt._dlt_load_id,
     round(cu.decks_with_card * 100.0 / archt.total_decks, 2) as inclusion_rate,
     round(cu.mean_quantity_when_included, 2) as mean_quantity
 from card_usage as cu
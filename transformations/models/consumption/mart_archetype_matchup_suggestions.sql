@@ -1,21 +1,10 @@
-with matches as (
-    select * from {{ ref('fct_matches') }}
-),
-
-archetypes as (
-    select * from {{ ref('dim_deck_archetypes') }}
-),
-
-tournaments as (
-    select * from {{ ref('dim_tournaments') }}
-),
-
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
-),
-
-deck_composition as (
-    select * from {{ ref('fct_deck_composition') }}
+with deck_composition as (
+    select
+        dc.participant_id,
+        c.card_name,
+        dc.quantity
+    from {{ ref('fct_deck_composition') }} as dc
+    inner join {{ ref('dim_cards') }} as c on dc.card_id = c.card_id
 ),
 
 archetype_staples as (
@@ -27,11 +16,14 @@ archetype_staples as (
     group by 1, 2
 ),
 
+-- mart_cards_used has a row per set and printing; keeping the lowest rate of each card avoids repeating
+-- suggestions and lets through the same cards as filtering those rows one by one
 global_staples as (
     select
         card_name,
-        (decks_containing * 100.0 / (select count(distinct participant_id) from archetypes)) as global_inclusion_rate -- noqa
+        (min(decks_containing) * 100.0 / (select count(*) from {{ ref('dim_deck_archetypes') }})) as global_inclusion_rate -- noqa
     from {{ ref('mart_cards_used') }}
+    group by 1
 ),
 
 unique_cards as (
@@ -42,29 +34,17 @@ unique_cards as (
     group by 1
 ),
 
-tournaments_with_sets as (
-    select
-        t.tournament_id,
-        s.set_name
-    from tournaments as t
-    left join sets as s
-        on t.tournament_date >= s.release_date
-    qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
-),
-
 matches_with_meta as (
     select
-        m.match_id,
-        m.participant_id,
-        m.opponent_id,
-        m.result,
-        a1.archetype as p1_archetype,
-        a2.archetype as p2_archetype,
-        ts.set_name
-    from matches as m
-    inner join archetypes as a1 on m.participant_id = a1.participant_id
-    inner join archetypes as a2 on m.opponent_id = a2.participant_id
-    left join tournaments_with_sets as ts on m.tournament_id = ts.tournament_id
+        match_id,
+        participant_id,
+        opponent_id,
+        result,
+        p1_archetype,
+        p2_archetype,
+        set_name
+    from {{ ref('int_matches_enriched') }}
+    where p1_archetype is not null and p2_archetype is not null
 ),
 
 difficult_matchups as (
@@ -180,5 +160,9 @@ where
         'Darkness Energy',
         'Metal Energy'
     )
-qualify row_number() over (partition by r.set_name, r.archetype, r.opponent_archetype order by 10 desc) <= 5
+qualify
+    row_number() over (
+        partition by r.set_name, r.archetype, r.opponent_archetype
+        order by relevance_score desc, r.suggested_card asc
+    ) <= 5
 order by 1, 2, 3, 10 desc
@@ -1,52 +1,32 @@
-with matches as (
-    select * from {{ ref('fct_matches') }}
-),
+{{ config(materialized='incremental', unique_key='set_name') }}
 
-archetypes as (
-    select * from {{ ref('dim_deck_archetypes') }}
-),
+-- depends_on: {{ ref('fct_matches') }}
+-- depends_on: {{ ref('dim_participants') }}
+-- depends_on: {{ ref('dim_tournament_sets') }}
 
-tournaments as (
-    select * from {{ ref('dim_tournaments') }}
-),
-
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
-),
-
-tournaments_with_sets as (
-    select
-        t.tournament_id,
-        s.set_name
-    from tournaments as t
-    left join sets as s
-        on t.tournament_date >= s.release_date
-    qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
-),
-
-matches_with_ids as (
-    select
-        m.match_id,
-        m.participant_id as p1_id,
-        m.result,
-        m.opponent_id as p2_id,
-        m.tournament_id
-    from matches as m
-),
+with
+{% if is_incremental() %}
+    changed_sets as (
+        select distinct coalesce(set_name, 'Unknown') as set_name
+        from ({{ changed_partitions('set_name', ['fct_matches', 'dim_participants']) }}) as changed
+    ),
+{% endif %}
 
 matches_with_archetypes as (
     select
-        m.match_id,
-        m.result,
-        a1.archetype as p1_archetype,
-        a1.sub_archetype as p1_sub_archetype,
-        ts.set_name,
-        coalesce(a2.archetype, 'Unknown') as p2_archetype,
-        coalesce(a2.sub_archetype, 'Unknown') as p2_sub_archetype
-    from matches_with_ids as m
-    inner join archetypes as a1 on m.p1_id = a1.participant_id
-    left join archetypes as a2 on m.p2_id = a2.participant_id
-    left join tournaments_with_sets as ts on m.tournament_id = ts.tournament_id
+        match_id,
+        result,
+        p1_archetype,
+        p1_sub_archetype,
+        set_name,
+        _dlt_load_id,
+        coalesce(p2_archetype, 'Unknown') as p2_archetype,
+        coalesce(p2_sub_archetype, 'Unknown') as p2_sub_archetype
+    from {{ ref('int_matches_enriched') }}
+    where p1_archetype is not null
+    {% if is_incremental() %}
+        and set_name in (select set_name from changed_sets)
+    {% endif %}
 )
 
 select
@@ -66,7 +46,8 @@ select
     round(
         sum(case when result = 'WIN' then 1 else 0 end) * 100.0 / count(*),
         2
-    ) as win_no_ties_rate
+    ) as win_no_ties_rate,
+    max(_dlt_load_id) as _dlt_load_id
 from matches_with_archetypes
 group by
     1, 2, 3, 4, 5
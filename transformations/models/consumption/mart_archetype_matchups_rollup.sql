@@ -0,0 +1,47 @@
+-- mart_archetype_matchups pre-aggregated to the coarser grains the semantic layer is asked for.
+-- Rows keep additive counts, so rates are weighted by matches instead of averaged across rows.
+-- One group by per grain, named by the `grain` column; columns outside of a row's grain are null.
+{%- set grains = [
+    ['p1_archetype'],
+    ['p1_archetype', 'p2_archetype'],
+    ['p1_archetype', 'p1_sub_archetype', 'p2_archetype'],
+    ['p1_archetype', 'p2_archetype', 'p2_sub_archetype'],
+    ['set_name', 'p1_archetype'],
+    ['set_name', 'p1_archetype', 'p2_archetype'],
+] %}
+
+with rollup as (
+    {%- for grain in grains %}
+        select
+            {{ grain | join(', ') }},
+            '{{ grain | join(",") }}' as grain,
+            sum(total_matches)::bigint as total_matches,
+            sum(wins)::bigint as wins,
+            sum(losses)::bigint as losses,
+            sum(ties)::bigint as ties,
+            round((sum(wins) + sum(ties)) * 100.0 / sum(total_matches), 2) as win_ties_rate,
+            round(sum(wins) * 100.0 / sum(total_matches), 2) as win_no_ties_rate,
+            max(_dlt_load_id) as _dlt_load_id
+        from {{ ref('mart_archetype_matchups') }}
+        group by {{ grain | join(', ') }}
+        {%- if not loop.last %}
+            union all by name
+        {%- endif %}
+    {%- endfor %}
+)
+
+select
+    grain,
+    set_name,
+    p1_archetype,
+    p1_sub_archetype,
+    p2_archetype,
+    p2_sub_archetype,
+    total_matches,
+    wins,
+    losses,
+    ties,
+    win_ties_rate,
+    win_no_ties_rate,
+    _dlt_load_id
+from rollup
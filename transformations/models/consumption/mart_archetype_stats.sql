@@ -1,38 +1,29 @@
-with matches as (
-    select * from {{ ref('fct_matches') }}
-),
+{{ config(materialized='incremental', unique_key='set_name') }}
 
-archetypes as (
-    select * from {{ ref('dim_deck_archetypes') }}
-),
+-- depends_on: {{ ref('fct_matches') }}
+-- depends_on: {{ ref('dim_participants') }}
+-- depends_on: {{ ref('dim_tournament_sets') }}
 
-tournaments as (
-    select * from {{ ref('dim_tournaments') }}
-),
-
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
-),
-
-tournaments_with_sets as (
-    select
-        t.tournament_id,
-        s.set_name
-    from tournaments as t
-    left join sets as s
-        on t.tournament_date >= s.release_date
-    qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
-),
+with
+{% if is_incremental() %}
+    changed_sets as (
+        select distinct coalesce(set_name, 'Unknown') as set_name
+        from ({{ changed_partitions('set_name', ['fct_matches', 'dim_participants']) }}) as changed
+    ),
+{% endif %}
 
 matches_with_archetypes as (
     select
-        m.result,
-        a.archetype,
-        a.sub_archetype,
-        ts.set_name
-    from matches as m
-    inner join archetypes as a on m.participant_id = a.participant_id
-    left join tournaments_with_sets as ts on m.tournament_id = ts.tournament_id
+        result,
+        p1_archetype as archetype,
+        p1_sub_archetype as sub_archetype,
+        set_name,
+        _dlt_load_id
+    from {{ ref('int_matches_enriched') }}
+    where p1_archetype is not null
+    {% if is_incremental() %}
+        and set_name in (select set_name from changed_sets)
+    {% endif %}
 )
 
 select
@@ -43,7 +34,8 @@ select
     sum(case when result = 'WIN' then 1 else 0 end) as wins,
     sum(case when result = 'LOSS' then 1 else 0 end) as losses,
     sum(case when result = 'TIE' then 1 else 0 end) as ties,
-    round(sum(case when result = 'WIN' then 1 else 0 end) * 100.0 / count(*), 2) as win_rate
+    round(sum(case when result = 'WIN' then 1 else 0 end) * 100.0 / count(*), 2) as win_rate,
+    max(_dlt_load_id) as _dlt_load_id
 from matches_with_archetypes
 group by
     set_name,
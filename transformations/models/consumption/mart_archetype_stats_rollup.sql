@@ -0,0 +1,40 @@
+-- mart_archetype_stats pre-aggregated to the coarser grains the semantic layer is asked for.
+-- Rows keep additive counts, so rates are weighted by matches instead of averaged across rows.
+-- One group by per grain, named by the `grain` column; columns outside of a row's grain are null.
+{%- set grains = [
+    ['archetype'],
+    ['archetype', 'sub_archetype'],
+    ['set_name', 'archetype'],
+] %}
+
+with rollup as (
+    {%- for grain in grains %}
+        select
+            {{ grain | join(', ') }},
+            '{{ grain | join(",") }}' as grain,
+            sum(total_matches)::bigint as total_matches,
+            sum(wins)::bigint as wins,
+            sum(losses)::bigint as losses,
+            sum(ties)::bigint as ties,
+            round(sum(wins) * 100.0 / sum(total_matches), 2) as win_rate,
+            max(_dlt_load_id) as _dlt_load_id
+        from {{ ref('mart_archetype_stats') }}
+        group by {{ grain | join(', ') }}
+        {%- if not loop.last %}
+            union all by name
+        {%- endif %}
+    {%- endfor %}
+)
+
+select
+    grain,
+    set_name,
+    archetype,
+    sub_archetype,
+    total_matches,
+    wins,
+    losses,
+    ties,
+    win_rate,
+    _dlt_load_id
+from rollup
@@ -1,40 +1,44 @@
+{{ config(materialized='incremental', unique_key='set_name') }}
+
 with deck_composition as (
     select * from {{ ref('fct_deck_composition') }}
 ),
 
-participants as (
-    select * from {{ ref('dim_participants') }}
+cards as (
+    select * from {{ ref('dim_cards') }}
 ),
 
-tournaments as (
-    select * from {{ ref('dim_tournaments') }}
+participants as (
+    select * from {{ ref('dim_participants') }}
 ),
 
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
+tournament_sets as (
+    select * from {{ ref('dim_tournament_sets') }}
 ),
 
-tournaments_with_sets as (
-    select
-        t.tournament_id,
-        s.set_name
-    from tournaments as t
-    left join sets as s
-        on t.tournament_date >= s.release_date
-    qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
+{% if is_incremental() %}
+changed_sets as (
+    select distinct coalesce(set_name, 'Unknown') as set_name
+    from ({{ changed_partitions('set_name', ['dim_participants']) }}) as changed
 ),
+{% endif %}
 
 cards_with_sets as (
     select
-        dc.card_name,
-        dc.card_code,
-        dc.card_kind,
+        c.card_name,
+        c.card_code,
+        c.card_kind,
         dc.quantity,
         dc.participant_id,
-        ts.set_name
+        coalesce(ts.set_name, 'Unknown') as set_name,
+        greatest(dc._dlt_load_id, p._dlt_load_id) as _dlt_load_id
     from deck_composition as dc
+    inner join cards as c on dc.card_id = c.card_id
     inner join participants as p on dc.participant_id = p.participant_id
-    left join tournaments_with_sets as ts on p.tournament_id = ts.tournament_id
+    left join tournament_sets as ts on p.tournament_id = ts.tournament_id
+    {% if is_incremental() %}
+        where coalesce(ts.set_name, 'Unknown') in (select set_name from changed_sets)
+    {% endif %}
 )
 
 select
@@ -43,7 +47,8 @@ select
     card_code,
     card_kind,
     sum(quantity) as total_used,
-    count(distinct participant_id) as decks_containing
+    count(distinct participant_id) as decks_containing,
+    max(_dlt_load_id) as _dlt_load_id
 from cards_with_sets
 group by
     set_name,
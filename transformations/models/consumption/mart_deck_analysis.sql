@@ -1,46 +1,52 @@
-with matches as (
-    select
-        participant_id,
-        count(*) as total_matches,
-        sum(case when result = 'WIN' then 1 else 0 end) as wins,
-        sum(case when result = 'LOSS' then 1 else 0 end) as losses,
-        sum(case when result = 'TIE' then 1 else 0 end) as ties
-    from {{ ref('fct_matches') }}
-    group by participant_id
-),
+{{ config(materialized='incremental', unique_key='set_name') }}
 
-participants as (
+-- depends_on: {{ ref('fct_matches') }}
+
+with participants as (
     select * from {{ ref('dim_participants') }}
 ),
 
-tournaments as (
-    select * from {{ ref('dim_tournaments') }}
+tournament_sets as (
+    select * from {{ ref('dim_tournament_sets') }}
 ),
 
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
+{% if is_incremental() %}
+changed_sets as (
+    select distinct coalesce(set_name, 'Unknown') as set_name
+    from ({{ changed_partitions('set_name', ['fct_matches', 'dim_participants']) }}) as changed
 ),
+{% endif %}
 
-tournaments_with_sets as (
+-- A participant's matches all belong to the set of their tournament
+matches as (
     select
-        t.tournament_id,
-        s.set_name
-    from tournaments as t
-    left join sets as s
-        on t.tournament_date >= s.release_date
-    qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
+        participant_id,
+        count(*) as total_matches,
+        sum(case when result = 'WIN' then 1 else 0 end) as wins,
+        sum(case when result = 'LOSS' then 1 else 0 end) as losses,
+        sum(case when result = 'TIE' then 1 else 0 end) as ties,
+        max(_dlt_load_id) as _dlt_load_id
+    from {{ ref('int_matches_enriched') }}
+    {% if is_incremental() %}
+        where set_name in (select set_name from changed_sets)
+    {% endif %}
+    group by participant_id
 )
 
 select
-    ts.set_name,
     p.player_name,
     p.tournament_url,
     m.total_matches,
     m.wins,
     m.losses,
     m.ties,
-    case when m.total_matches > 0 then m.wins::double / m.total_matches else 0 end as win_rate
+    coalesce(ts.set_name, 'Unknown') as set_name,
+    case when m.total_matches > 0 then m.wins::double / m.total_matches else 0 end as win_rate,
+    greatest(p._dlt_load_id, m._dlt_load_id) as _dlt_load_id
 from participants as p
 left join matches as m on p.participant_id = m.participant_id
-left join tournaments_with_sets as ts on p.tournament_id = ts.tournament_id
+left join tournament_sets as ts on p.tournament_id = ts.tournament_id
+{% if is_incremental() %}
+    where coalesce(ts.set_name, 'Unknown') in (select set_name from changed_sets)
+{% endif %}
 order by win_rate desc
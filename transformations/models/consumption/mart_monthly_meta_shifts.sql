@@ -1,13 +1,29 @@
-with participants as (
+{{ config(materialized='incremental', unique_key='tournament_month') }}
+
+-- depends_on: {{ ref('fct_matches') }}
+-- depends_on: {{ ref('dim_tournament_sets') }}
+
+with
+{% if is_incremental() %}
+    changed_months as (
+        {{ changed_partitions('tournament_month', ['fct_matches', 'dim_participants']) }}
+    ),
+{% endif %}
+
+participants as (
     select
         p.participant_id,
         p.tournament_id,
         da.archetype,
         t.tournament_date,
-        date_trunc('month', t.tournament_date) as tournament_month
+        date_trunc('month', t.tournament_date) as tournament_month,
+        greatest(p._dlt_load_id, t._dlt_load_id) as _dlt_load_id
     from {{ ref('dim_participants') }} as p
     inner join {{ ref('dim_tournaments') }} as t on p.tournament_id = t.tournament_id
     left join {{ ref('dim_deck_archetypes') }} as da on p.participant_id = da.participant_id
+    {% if is_incremental() %}
+        where date_trunc('month', t.tournament_date) in (select tournament_month from changed_months)
+    {% endif %}
 ),
 
 monthly_totals as (
@@ -22,20 +38,26 @@ archetype_monthly_counts as (
     select
         tournament_month,
         archetype,
-        count(distinct participant_id) as archetype_participants
+        count(distinct participant_id) as archetype_participants,
+        max(_dlt_load_id) as _dlt_load_id
     from participants
     group by 1, 2
 ),
 
 match_stats as (
     select
-        da.archetype,
-        date_trunc('month', t.tournament_date) as tournament_month,
+        p1_archetype as archetype,
+        tournament_month,
         count(*) as total_matches,
-        sum(case when m.result = 'WIN' then 1 else 0 end) as wins
-    from {{ ref('fct_matches') }} as m
-    inner join {{ ref('dim_tournaments') }} as t on m.tournament_id = t.tournament_id
-    inner join {{ ref('dim_deck_archetypes') }} as da on m.participant_id = da.participant_id
+        sum(case when result = 'WIN' then 1 else 0 end) as wins,
+        max(_dlt_load_id) as _dlt_load_id
+    from {{ ref('int_matches_enriched') }}
+    where
+        p1_archetype is not null
+        and tournament_month is not null
+    {% if is_incremental() %}
+        and tournament_month in (select tournament_month from changed_months)
+    {% endif %}
     group by 1, 2
 )
 
@@ -47,7 +69,8 @@ select
     coalesce(ms.total_matches, 0) as total_matches,
     coalesce(ms.wins, 0) as wins,
     round(amc.archetype_participants * 100.0 / mt.total_participants, 2) as meta_share,
-    round(coalesce(ms.wins, 0) * 100.0 / nullif(ms.total_matches, 0), 2) as win_rate
+    round(coalesce(ms.wins, 0) * 100.0 / nullif(ms.total_matches, 0), 2) as win_rate,
+    greatest(amc._dlt_load_id, ms._dlt_load_id) as _dlt_load_id
 from archetype_monthly_counts as amc
 inner join monthly_totals as mt on amc.tournament_month = mt.tournament_month
 left join match_stats as ms
@@ -1,11 +1,26 @@
-with player_matches as (
+{{ config(materialized='incremental', unique_key='player_name') }}
+
+with
+{% if is_incremental() %}
+    changed_players as (
+        select distinct player_name
+        from {{ ref('dim_participants') }}
+        where tournament_id in ({{ changed_tournaments(['fct_matches', 'dim_participants']) }})
+    ),
+{% endif %}
+
+player_matches as (
     select
         p.player_name,
         m.result,
-        da.archetype
+        da.archetype,
+        greatest(p._dlt_load_id, m._dlt_load_id) as _dlt_load_id
     from {{ ref('dim_participants') }} as p
     inner join {{ ref('fct_matches') }} as m on p.participant_id = m.participant_id
     left join {{ ref('dim_deck_archetypes') }} as da on p.participant_id = da.participant_id
+    {% if is_incremental() %}
+        where p.player_name in (select player_name from changed_players)
+    {% endif %}
 ),
 
 player_stats as (
@@ -14,7 +29,8 @@ player_stats as (
         count(*) as total_matches,
         sum(case when result = 'WIN' then 1 else 0 end) as wins,
         sum(case when result = 'LOSS' then 1 else 0 end) as losses,
-        sum(case when result = 'TIE' then 1 else 0 end) as ties
+        sum(case when result = 'TIE' then 1 else 0 end) as ties,
+        max(_dlt_load_id) as _dlt_load_id
     from player_matches
     group by 1
 ),
@@ -44,6 +60,7 @@ select
     ps.losses,
     ps.ties,
     fa.favorite_archetype,
+    ps._dlt_load_id,
     round(ps.wins * 100.0 / nullif(ps.total_matches, 0), 2) as win_rate
 from player_stats as ps
 left join fav_archetype as fa on ps.player_name = fa.player_name
@@ -1,26 +1,35 @@
+{{ config(materialized='incremental', unique_key='tournament_id') }}
+
 with tournaments as (
     select * from {{ ref('dim_tournaments') }}
+    {% if is_incremental() %}
+        where tournament_id in ({{ changed_tournaments(['dim_tournaments', 'fct_matches']) }})
+    {% endif %}
 ),
 
 matches as (
     select
         tournament_id,
-        count(*) as total_matches
+        count(*) as total_matches,
+        max(_dlt_load_id) as _dlt_load_id
     from {{ ref('fct_matches') }}
     group by 1
 ),
 
-sets as (
-    select * from {{ ref('dim_pokemon_sets') }}
+tournament_sets as (
+    select
+        tournament_id,
+        set_name
+    from {{ ref('dim_tournament_sets') }}
 )
 
 select
-    t.*,
-    s.set_name,
-    coalesce(m.total_matches, 0) as total_matches
+    t.* exclude (_dlt_load_id),
+    ts.set_name,
+    coalesce(m.total_matches, 0) as total_matches,
+    greatest(t._dlt_load_id, m._dlt_load_id) as _dlt_load_id
 from tournaments as t
 left join matches as m
     on t.tournament_id = m.tournament_id
-left join sets as s
-    on t.tournament_date >= s.release_date
-qualify row_number() over (partition by t.tournament_id order by s.release_date desc) = 1
+left join tournament_sets as ts
+    on t.tournament_id = ts.tournament_id
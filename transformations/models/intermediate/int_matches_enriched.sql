@@ -0,0 +1,47 @@
+{{ config(materialized='incremental', unique_key='match_id') }}
+
+-- depends_on: {{ ref('dim_participants') }}
+
+-- Every match with both players' archetypes and the tournament's set and month resolved once,
+-- for the marts to aggregate from. Matches of tournaments with new matches, decks or set lookups are rebuilt.
+with matches as (
+    select * from {{ ref('fct_matches') }}
+    {% if is_incremental() %}
+        where tournament_id in ({{ changed_tournaments(['fct_matches', 'dim_participants', 'dim_tournament_sets']) }})
+    {% endif %}
+),
+
+archetypes as (
+    select
+        participant_id,
+        archetype,
+        sub_archetype,
+        _dlt_load_id
+    from {{ ref('dim_deck_archetypes') }}
+),
+
+tournament_sets as (
+    select * from {{ ref('dim_tournament_sets') }}
+)
+
+select
+    m.match_id,
+    m.tournament_id,
+    ts.tournament_date,
+    ts.tournament_month,
+    m.round,
+    m.participant_id,
+    m.opponent_id,
+    m.result,
+    a1.archetype as p1_archetype,
+    a1.sub_archetype as p1_sub_archetype,
+    a2.archetype as p2_archetype,
+    a2.sub_archetype as p2_sub_archetype,
+    coalesce(ts.set_name, 'Unknown') as set_name,
+    greatest(m._dlt_load_id, a1._dlt_load_id, a2._dlt_load_id, ts._dlt_load_id) as _dlt_load_id
+from matches as m
+left join archetypes as a1 on m.participant_id = a1.participant_id
+left join archetypes as a2 on m.opponent_id = a2.participant_id
+left join tournament_sets as ts on m.tournament_id = ts.tournament_id
+-- Keeps the rows of a set or month together, so that DuckDB's min/max zone maps skip the rest on filters
+order by ts.tournament_date, m.tournament_id
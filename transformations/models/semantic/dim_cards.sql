@@ -1,12 +1,15 @@
+{{ config(materialized='incremental', unique_key='card_id') }}
+
 with staging as (
-    select distinct
+    select
+        card_id,
         card_name,
         card_code,
-        card_kind
+        card_kind,
+        max(_dlt_load_id) as _dlt_load_id
     from {{ ref('stg_deck_cards') }}
+    where {{ is_new_load() }}
+    group by 1, 2, 3, 4
 )
 
-select
-    {{ dbt_utils.generate_surrogate_key(['card_name', 'card_kind', 'card_code']) }} as card_id,
-    *
-from staging
+select * from staging
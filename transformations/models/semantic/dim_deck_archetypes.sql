@@ -1,45 +1,92 @@
+{{
+    config(
+        materialized='incremental',
+        unique_key='participant_id',
+        pre_hook="{{ delete_new_loads('participant_id', 'dim_participants') }}"
+    )
+}}
+
+-- depends_on: {{ ref('dim_participants') }}
+
+-- Each row of the meta_decks seed is a rule: a deck matches it when it contains every card named in
+-- its card_name_* columns. More columns (card_name_3, ...) make more specific rules without changing this model.
+-- A deck takes the matching rule with the most cards; ties go to the rule whose cards the deck plays most copies of.
+-- Reloaded participants lose their row first, since a deck that no longer matches any rule gets no new one.
+
 with deck_cards as (
     select
         participant_id,
-        card_name
+        card_id,
+        quantity,
+        _dlt_load_id
     from {{ ref('fct_deck_composition') }}
+    where {{ is_new_load() }}
+),
+
+rules as (
+    select
+        *,
+        hash(meta) as rule_id
+    from (select distinct * from {{ ref('meta_decks') }}) as meta
 ),
 
-meta as (
-    select * from {{ ref('meta_decks') }}
+rule_cards as (
+    unpivot rules
+    on columns('^card_name_')
+    into name card_slot value card_name
 ),
 
-matches as (
+rule_card_ids as (
+    select
+        c.card_id,
+        c.card_name
+    from {{ ref('dim_cards') }} as c
+    where c.card_name in (select rc.card_name from rule_cards as rc)
+),
+
+rule_sizes as (
+    select
+        rule_id,
+        archetype,
+        sub_archetype,
+        count(*) as rule_cards
+    from rule_cards
+    group by 1, 2, 3
+),
+
+-- Cards no rule names never reach the rule join, which keeps it close to one row per card a deck plays
+played_rule_cards as (
     select
         d.participant_id,
-        m.archetype,
-        m.sub_archetype,
-        m.card_name_1,
-        m.card_name_2,
-        -- Score: 2 if both match, 1 if only c1 matches and c2 is null
-        case
-            when d2.card_name is not null then 2
-            when m.card_name_2 is null then 1
-            else 0
-        end as match_score
-    from meta as m
-    inner join deck_cards as d on m.card_name_1 = d.card_name
-    left join deck_cards as d2 on d.participant_id = d2.participant_id and m.card_name_2 = d2.card_name
-    where
-        -- Must match c2 if it exists
-        (m.card_name_2 is null or d2.card_name is not null)
+        r.card_name,
+        sum(d.quantity) as quantity,
+        max(d._dlt_load_id) as _dlt_load_id
+    from deck_cards as d
+    inner join rule_card_ids as r on d.card_id = r.card_id
+    group by 1, 2
 ),
 
-ranked as (
+rule_hits as (
     select
-        *,
-        row_number() over (partition by participant_id order by match_score desc) as rn
-    from matches
+        d.participant_id,
+        r.rule_id,
+        count(*) as matched_cards,
+        sum(d.quantity) as matched_quantity,
+        max(d._dlt_load_id) as _dlt_load_id
+    from played_rule_cards as d
+    inner join rule_cards as r on d.card_name = r.card_name
+    group by 1, 2
 )
 
 select
-    participant_id,
-    archetype,
-    sub_archetype
-from ranked
-where rn = 1
+    h.participant_id,
+    s.archetype,
+    s.sub_archetype,
+    h._dlt_load_id
+from rule_hits as h
+inner join rule_sizes as s on h.rule_id = s.rule_id
+where h.matched_cards = s.rule_cards
+qualify row_number() over (
+    partition by h.participant_id
+    order by s.rule_cards desc, h.matched_quantity desc, s.archetype asc, s.sub_archetype asc
+) = 1
@@ -1,5 +1,8 @@
+{{ config(materialized='incremental', unique_key='participant_id') }}
+
 with staging as (
     select * from {{ ref('stg_participants') }}
+    where {{ is_new_load() }}
 )
 
 select * from staging
@@ -0,0 +1,54 @@
+{{ config(materialized='incremental', unique_key='tournament_id') }}
+
+with
+{% if is_incremental() %}
+    -- Where reloaded tournaments were before this load, so that the marts also rebuild the set and month they left
+    previous_sets as (
+        select
+            tournament_id,
+            set_name,
+            tournament_month
+        from {{ this }}
+    ),
+{% endif %}
+
+tournaments as (
+    select
+        tournament_id,
+        tournament_date,
+        _dlt_load_id,
+        date_trunc('month', tournament_date) as tournament_month
+    from {{ ref('dim_tournaments') }}
+    where {{ is_new_load() }}
+),
+
+-- Sets released together share a start date; keep one of them so that the lookup is deterministic
+set_periods as (
+    select
+        set_name,
+        set_abbreviation,
+        online_start_date
+    from {{ ref('dim_pokemon_sets') }}
+    qualify row_number() over (partition by online_start_date order by set_name) = 1
+)
+
+select
+    t.tournament_id,
+    t.tournament_date,
+    s.set_name,
+    s.set_abbreviation,
+    t._dlt_load_id,
+    t.tournament_month,
+    {% if is_incremental() %}
+        ps.set_name as previous_set_name,
+        ps.tournament_month as previous_tournament_month
+    {% else %}
+        null::varchar as previous_set_name,
+        null::date as previous_tournament_month
+    {% endif %}
+from tournaments as t
+asof left join set_periods as s
+    on t.tournament_date >= s.online_start_date
+{% if is_incremental() %}
+    left join previous_sets as ps on t.tournament_id = ps.tournament_id
+{% endif %}
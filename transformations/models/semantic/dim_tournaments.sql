@@ -1,5 +1,8 @@
+{{ config(materialized='incremental', unique_key='tournament_id') }}
+
 with staging as (
     select * from {{ ref('stg_tournaments') }}
+    where {{ is_new_load() }}
 )
 
 select * from staging
@@ -1,20 +1,15 @@
+{{ config(materialized='incremental', unique_key='participant_id') }}
+
+-- Card names, codes and kinds live in dim_cards; the fact only keeps integer keys
 with cards as (
     select * from {{ ref('stg_deck_cards') }}
-),
-
-participants as (
-    select
-        participant_id,
-        source_id
-    from {{ ref('stg_participants') }}
+    where {{ is_new_load() }}
 )
 
 select
-    p.participant_id,
-    c.card_entry_id,
-    c.card_name,
-    c.card_code,
-    c.quantity,
-    c.card_kind
-from cards as c
-left join participants as p on c.source_participant_id = p.source_id
+    participant_id,
+    card_entry_id,
+    card_id,
+    quantity,
+    _dlt_load_id
+from cards
@@ -1,5 +1,8 @@
+{{ config(materialized='incremental', unique_key='match_id') }}
+
 with staging as (
     select * from {{ ref('stg_matches') }}
+    where {{ is_new_load() }}
 )
 
 select * from staging
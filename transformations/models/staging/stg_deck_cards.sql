@@ -1,42 +1,33 @@
+-- Keyed on the participant, so a reloaded deck replaces all of its previous cards
+{{ config(unique_key='participant_id') }}
+
 with cards as (
-    select * from {{ source('pokemon_tcg', 'participant_deck__decklist') }}
+    select * from {{ raw_source('participant_deck_cards') }}
+    where {{ is_new_load() }}
 ),
 
-parents as (
+renamed as (
     select
-        _dlt_id,
+        {{ surrogate_key(['player', 'tournament']) }} as participant_id,
         _dlt_load_id,
-        {{ dbt_utils.generate_surrogate_key(['player', 'tournament']) }} as participant_id
-    from {{ source('pokemon_tcg', 'participant_deck') }}
-),
-
-deduplicated_parents as (
-    select _dlt_id
-    from parents
-    qualify row_number() over (partition by participant_id order by _dlt_load_id desc) = 1
-),
-
-joined as (
-    select
-        c._dlt_parent_id as source_participant_id,
-        c.name as card_name,
-        c.quantity,
-        c.kind as card_kind,
+        name as card_name,
+        quantity,
+        kind as card_kind,
         case
-            when c.kind = 'pokemon' then c.code
+            when kind = 'pokemon' then code
         end as card_code
-    from cards as c
-    inner join deduplicated_parents as p on c._dlt_parent_id = p._dlt_id
+    from cards
 )
 
 select
-
-    {{ dbt_utils.generate_surrogate_key(['source_participant_id', 'card_name', 'card_kind', 'card_code']) }}
+    {{ surrogate_key(['participant_id', 'card_name', 'card_kind', 'card_code']) }}
         as card_entry_id,
-    source_participant_id,
+    {{ surrogate_key(['card_name', 'card_kind', 'card_code']) }} as card_id,
+    participant_id,
     card_name,
     card_code,
     card_kind,
+    _dlt_load_id,
     sum(quantity) as quantity
-from joined
-group by 1, 2, 3, 4, 5
+from renamed
+group by 1, 2, 3, 4, 5, 6, 7
@@ -1,13 +1,16 @@
+{{ config(unique_key='match_id') }}
+
 with source as (
-    select * from {{ source('pokemon_tcg', 'participant_matches') }}
+    select * from {{ raw_source('participant_matches') }}
+    where {{ is_new_load() }}
 ),
 
 renamed as (
     select
-        {{ dbt_utils.generate_surrogate_key(['tournament', 'p1', 'round']) }} as match_id,
-        {{ dbt_utils.generate_surrogate_key(['tournament']) }} as tournament_id,
-        {{ dbt_utils.generate_surrogate_key(['p1', 'tournament']) }} as participant_id,
-        {{ dbt_utils.generate_surrogate_key(['p2', 'tournament']) }} as opponent_id,
+        {{ surrogate_key(['tournament', 'p1', 'round']) }} as match_id,
+        {{ surrogate_key(['tournament']) }} as tournament_id,
+        {{ surrogate_key(['p1', 'tournament']) }} as participant_id,
+        {{ surrogate_key(['p2', 'tournament']) }} as opponent_id,
         tournament as tournament_url,
         round,
         p1 as player_name,
@@ -17,6 +20,6 @@ renamed as (
     from source
 )
 
-select * exclude (_dlt_load_id)
+select *
 from renamed
 qualify row_number() over (partition by match_id order by _dlt_load_id desc) = 1